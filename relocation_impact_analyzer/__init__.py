@@ -22,6 +22,7 @@ Package Contents:
 - g_api: Interfaces with geospatial and traffic analytics APIs.
 - ui: Provides a web-based user interface for interactive analysis and visualization.
 - graphing: Supports the generation of graphical representations of analysis outcomes.
+- geodesy: Great-circle distance and destination point helpers shared by g_api and graphing.
 
 Additionally, this package initializes the package environment, setting up necessary configurations and routines essential for its operation.
 
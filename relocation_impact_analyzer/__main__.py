@@ -173,7 +173,7 @@ def handle_gen_graphs(analyzer, project, args):
         logfile = analyzer.project.project_directory + "/" + project + "/graph_gen_log.csv"
         # if there's an argument after do_gen_graphs, it is a call to regenerate just one graph
         if len(args) == 4:
-            analyzer.generate_graphs(args[3])
+            analyzer.generate_graphs(args[3], force=True)
         else:
             analyzer.generate_graphs()
         # remove the logfile if it exists
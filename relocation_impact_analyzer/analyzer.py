@@ -20,20 +20,525 @@ This class is designed with modularity and reusability in mind, allowing for fle
 import os
 from relocation_impact_analyzer.project import Project
 from relocation_impact_analyzer.g_api import GAPI
-from relocation_impact_analyzer.graphing import Graphing
+from relocation_impact_analyzer.graphing import Graphing, _latlong_key, _masked_points
 
 from datetime import datetime, timedelta
 import re
 from dotenv import load_dotenv, set_key
 from time import sleep
 import json
+import io
+import logging
+import hashlib
+import threading
 import pandas as pd
 import numpy as np
 import numpy_financial as npf
+import matplotlib
 import matplotlib.pyplot as mplt
 from matplotlib.lines import Line2D                
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+logger = logging.getLogger(__name__)
+
+# define a color palette supporting up to 10 unique colors
+_COLOR_PALETTE = ['#6e7c8a', '#90a08f', '#c3a3a9', '#b1c5c3', '#e1c08b', '#a592ba', '#a8b1d5', '#d4abad', '#c4c38a', '#ceb2ab']
+                # lighter pastel ['#7D8A97', '#A3B0A2', '#D3BCC0', '#C9D7D6', '#EAD2AC', '#B8A9C9', '#C5CBE3', '#E3C8C9', '#D1D0A3', '#DECBC6']
+
+# the palette converted to RGBA once at import, so artists are handed ready-made color tuples rather than
+# parsing the hex strings again for every scatter/hist call
+_COLOR_RGBA = tuple(matplotlib.colors.to_rgba(c) for c in _COLOR_PALETTE)
+
+# Create a new list of colors "i" long, recycling colors as needed
+def _colors(i):
+    return _COLOR_RGBA[i % len(_COLOR_RGBA)]
+
+# text box styling shared by every stats/threshold text box (matplotlib.patch.Patch properties and font), built once
+# and handed to each ax.text call; matplotlib copies them, so sharing the same objects is safe
+_STATS_BBOX = dict(boxstyle='round', facecolor='wheat', alpha=0.2)
+_THRESHOLD_BBOX = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
+_LEGEND_BBOX = dict(boxstyle='round', facecolor='white', alpha=1)
+_MONO_FONT = {'family': 'monospace'}
+
+# labels for the summary statistics text boxes, in display order
+_STAT_LABELS = ('Median:', 'Average:', 'Min:', 'Max:', 'Total:')
+
+# labels for the turnover threshold text boxes, in display order, and the column width they're padded to (the longest
+# label plus a space), worked out once here rather than for every text box
+_THRESHOLD_LABELS = ('Cost Threshold (\\$/day):', '# > Threshold (#):', 'Expected Cost (\\$):')
+_THRESHOLD_LABEL_WIDTH = max(len(lbl) for lbl in _THRESHOLD_LABELS) + 1
+
+# build a stats text box string, labels left aligned and dollar values right aligned in fixed width columns
+# (the text boxes use a monospace font, so fixed widths line the values up without measuring each string)
+def _stats_textstr(header, vals, labels=_STAT_LABELS, label_width=9, value_width=14):
+    return header + "".join(f"\n{lbl:<{label_width}}{f'${v:,.2f}':>{value_width}}" for lbl, v in zip(labels, vals))
+
+# build histogram bin edges as a numpy array, binmin rounded down and binmax rounded up to the nearest step,
+# so one edge array can be shared by every hist call on a figure (matplotlib would otherwise convert a range per call)
+def _bin_edges(binmax, step, binmin=0):
+    lo = np.floor(binmin / step) * step
+    # always at least one bin, even when binmin and binmax round to the same edge (e.g. all zero differentials)
+    hi = max(np.ceil(binmax / step) * step, lo + step)
+    return np.arange(lo, hi + step, step, dtype=np.float64)
+
+# count values into uniform-width bin edges (see _bin_edges()) by arithmetic on the bin width, rather than the binary
+# search over the edges np.histogram/hist() does; values outside the edges are dropped, the last bin includes its
+# right edge, as with np.histogram. The division can round a value within an ulp or so of an edge into the neighboring
+# bin, so each index is then checked against its bin's edges, giving exactly np.histogram's counts
+def _uniform_counts(x, edges):
+    x = np.asarray(x, dtype=np.float64)
+    lo, step, nbins = edges[0], edges[1] - edges[0], len(edges) - 1
+    x = x[(x >= lo) & (x <= edges[-1])]
+    idx = np.minimum(((x - lo) / step).astype(np.int64), nbins - 1)
+    idx -= x < edges[idx]
+    idx += (x >= edges[idx + 1]) & (idx < nbins - 1)
+    return np.bincount(idx, minlength=nbins)
+
+# PNG encoder settings for every saved graph: a low zlib compression level (the default level 6 is roughly twice as
+# slow to encode for little size benefit on these flat-colored plots) and no extra optimization pass
+_PNG_PIL_KWARGS = {'compress_level': 1, 'optimize': False}
+
+# save the current figure as a PNG, encoding into memory with _PNG_PIL_KWARGS and writing the file in one go
+def _save_png(plt, path):
+    buf = io.BytesIO()
+    plt.savefig(buf, format='png', pil_kwargs=_PNG_PIL_KWARGS)
+    with open(path, 'wb') as f:
+        f.write(buf.getbuffer())
+
+# save an object as JSON (json.dumps() keyword arguments pass through), encoding it in memory and writing the file in
+# one go rather than in the many small chunks json.dump() streams
+def _save_json(obj, path, **kwargs):
+    data = json.dumps(obj, **kwargs).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+# append an object to a JSON Lines file as one compact line, opening the file per call so each line is on disk as soon
+# as it is written and no handle is left open if the caller fails partway through
+def _append_jsonl(obj, path):
+    data = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b"\n"
+    with open(path, 'ab') as f:
+        f.write(data)
+
+# get the min (negative) and max (positive) values across a list of differential Series/arrays, as one numpy reduction
+# over all of them, with 0 included so the range always spans it (and an empty list gives (0, 0))
+def _diff_range(diffs):
+    vals = np.concatenate([np.asarray(d, dtype=np.float64) for d in diffs] + [np.zeros(1)])
+    return float(vals.min()), float(vals.max())
+
+# the mean of the n largest values in each row of a 2D array, as row.nlargest(n).mean() would give for each row, using
+# one np.partition over the whole array; as with nlargest, NaN values are skipped (a row of only NaN gives NaN)
+def _top_n_mean(x, n):
+    x = np.asarray(x, dtype=np.float64)
+    k = x.shape[1]
+    n = min(int(n), k)
+    if n <= 0:
+        return np.full(x.shape[0], np.nan)
+    nans = np.isnan(x)
+    if not nans.any():
+        return x.mean(axis=1) if n == k else np.partition(x, k-n, axis=1)[:, k-n:].mean(axis=1)
+    # sort NaN below every value, then drop any that made it into the top n from the mean
+    top = np.partition(np.where(nans, -np.inf, x), k-n, axis=1)[:, k-n:]
+    top[top == -np.inf] = np.nan
+    with np.errstate(invalid='ignore'):
+        return np.nansum(top, axis=1) / np.count_nonzero(~np.isnan(top), axis=1)
+
+# a per-employee cost frame for an office, with every employee's coordinates, the office address and a cost of 0, in
+# employee order
+def _base_cost_df(emp, officeaddr):
+    return pd.DataFrame({'latitude': emp['latitude'].to_numpy(), 'longitude': emp['longitude'].to_numpy(), 
+                         'office': officeaddr, 'cost': 0.0})
+
+# index the offices' cost frames (a dict keyed by office address) by office address and employee coordinate key (see
+# _latlong_key()), in one long-form frame for _fill_costs(); as with the per-employee lookups this replaced, the first 
+# cost frame row for a coordinate is used
+def _cost_lookup(cost_frames):
+    costs = {}
+    for addr, val_set in cost_frames.items():
+        val_set = val_set[['Total Average Cost','Total High Cost']] \
+            .set_axis(pd.Index(_latlong_key(val_set['origin_lat'], val_set['origin_long']), name='latlong_key'))
+        costs[addr] = val_set[~val_set.index.duplicated()]
+    return pd.concat(costs, names=['office_address'])
+
+# fill in the 'Total Average Cost' and 'Total High Cost' columns of a per-employee cost frame (see _base_cost_df() and
+# Analyzer._get_cost_analysis()) with one hashed lookup of its office and employee coordinate key into _cost_lookup(),
+# employees without a row (outside the cutoff distance) keep a cost of 0; the lookup only yields row positions, the
+# costs are then gathered from the lookup's float64 arrays, without building an aligned intermediate frame
+def _fill_costs(costs, lookup):
+    rows = lookup.index.get_indexer(pd.MultiIndex.from_arrays([costs['office'], 
+                                                               _latlong_key(costs['latitude'], costs['longitude'])]))
+    found = rows >= 0
+    for col in ('Total Average Cost', 'Total High Cost'):
+        vals = np.zeros(len(rows))
+        vals[found] = lookup[col].to_numpy(dtype=np.float64)[rows[found]]
+        costs[col] = vals
+
+################################################################################
+### Per-office graph rendering
+# The per-office graphs are independent of one another, so they are rendered by pure module level functions
+# that only take plain data (no Analyzer/Project objects), which lets them run in separate worker processes.
+
+# the fewest per-office graphs worth starting a worker process for, a worker's start up (importing the package in a 
+# fresh interpreter and receiving the shared frames) costs about as much as rendering three graphs
+_RENDER_JOBS_PER_WORKER = 6
+
+# the keyword arguments shared by every per-office graph (employee data, commute data, etc.), set once in each worker 
+# process by _init_render_worker() rather than sent with every graph, see _render_batch()
+_render_shared = {}
+
+def _init_render_worker(shared):
+    """
+    Initializer for graph rendering worker processes, selecting the non-interactive Agg backend so workers
+    never try to open a display, and keeping the keyword arguments shared by every graph for the process's renders.
+
+    Args:
+        shared (dict): The shared keyword arguments, see _render_office_graphs().
+    """
+    matplotlib.use('Agg')
+    _render_shared.update(shared)
+
+def _render_batch(jobs, shared=None):
+    """
+    Renders a batch of per-office graphs. The batch's tra graphs are drawn into one traffic regime figure, passed from 
+    each to the next (see _render_tra()) and closed once the batch is done.
+
+    Args:
+        jobs (list): A list of (render, args) pairs, each render a module level render function called as render(*args) 
+            with the shared keyword arguments it takes, see _RENDER_SHARED_ARGS.
+        shared (dict, optional): The shared keyword arguments. Defaults to None, the worker process's shared arguments, 
+            see _init_render_worker().
+
+    Returns:
+        None
+    """
+    shared = _render_shared if shared is None else shared
+    tra_axes = None
+    try:
+        for render, args in jobs:
+            kwargs = {name: shared[name] for name in _RENDER_SHARED_ARGS[render]}
+            if render is _render_tra:
+                tra_axes = render(*args, ax=tra_axes, **kwargs)
+            else:
+                render(*args, **kwargs)
+    finally:
+        if tra_axes is not None:
+            mplt.close(np.ravel(tra_axes)[0].figure)
+
+def _render_office_graphs(jobs, shared):
+    """
+    Renders the per-office graphs, spreading them across worker processes when there are enough graphs to give more 
+    than one worker at least _RENDER_JOBS_PER_WORKER of them and more than one CPU to render on.
+
+    All the graphs are rendered by one pool of worker processes, started with the "spawn" method so the workers don't 
+    inherit the parent's open figures, threads or locks, and the shared keyword arguments are sent to each worker once, 
+    as it starts, rather than with every graph. Each worker renders one batch of consecutive graphs.
+
+    Args:
+        jobs (list): A list of (render, args) pairs, one per graph, see _render_batch().
+        shared (dict): Keyword arguments shared by every render call (employee data, commute data, etc.).
+
+    Returns:
+        None
+    """
+    workers = min(os.cpu_count() or 1, -(-len(jobs) // _RENDER_JOBS_PER_WORKER))
+    if workers > 1:
+        # one batch per worker, as even as the jobs divide
+        size = -(-len(jobs) // workers)
+        batches = [jobs[i:i+size] for i in range(0, len(jobs), size)]
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_render_worker, initargs=(shared,)) as executor:
+            futures = [executor.submit(_render_batch, batch) for batch in batches]
+            # wait on each batch so any worker exception is raised here
+            for future in futures:
+                future.result()
+    else:
+        _render_batch(jobs, shared)
+
+def _render_ncsda(key, title, office, emp, commute_data, commute_range_cut_off, plots_dir):
+    """
+    Renders the Normalized Commute Standard Deviation Analysis graph for a single office.
+
+    Args:
+        key (str): The graph key, used as the file name.
+        title (str): The graph title.
+        office (DataFrame): A single row DataFrame for the office.
+        emp (DataFrame): The employee data.
+        commute_data (DataFrame): The commute data.
+        commute_range_cut_off (float): The commute distance cut off, in miles.
+        plots_dir (str): The directory to save the graph in.
+    """
+    graphing = Graphing()
+    values = Analyzer._DURATION_COLS
+
+    emp_within = graphing.filter_drive_distance(emp,office,commute_range_cut_off, commute_data=commute_data)
+    val_set = graphing.get_commute_values(emp_within, office, commute_data, values)
+    val_set_free = graphing.get_commute_values(emp_within, office, commute_data, "duration")
+    val_set_miles = graphing.get_commute_values(emp_within, office, commute_data, "miles")
+    
+    mean = val_set.loc[:,values].mean(axis=1)
+    std = val_set.loc[:,values].std(axis=1)
+    max_val = val_set.loc[:,values].max(axis=1)
+    min_val = val_set.loc[:,values].min(axis=1)
+    data_labels = ['Mean','Standard Deviation','Max','Min']
+    x = [mean, std, max_val, min_val]
+    # Normalize the values in val_set by dividing by the corresponding values in val_set_free, and multiplying by 100
+    #for each in values:
+    #   val_set[each] = val_set[each] / val_set_free['duration'] * 100
+
+    plt, ax = graphing.get_scatterplot(emp, office, commute_data, "miles", "duration", title=title, x_label='Duration (min)', 
+                                            y_label='Commute Distance (miles)',
+                                            cutoff_radius=commute_range_cut_off, commute_radius=commute_range_cut_off, figsize=(15, 15), manual_plot=True, font_mod=1.5)
+    
+    # manually add scatter plots for each day
+    #for i in range(len(data_labels)):
+    i=1
+    ax.scatter(x[i], val_set_miles['miles'],  alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2,
+                label=data_labels[i])
+    # add the min/max spread lines with end bars, all drawn as one line broken by NaN points rather than a line artist per
+    # employee (the markers are still drawn at each end)
+    miles = val_set_miles['miles'].to_numpy(dtype=np.float64)
+    spread_x = np.column_stack((min_val.to_numpy(dtype=np.float64), max_val.to_numpy(dtype=np.float64), np.full(len(miles), np.nan)))
+    spread_y = np.column_stack((miles, miles, np.full(len(miles), np.nan)))
+    ax.plot(spread_x.ravel(), spread_y.ravel(), 'k-', marker='|', lw=1)
+
+    ax.tick_params(axis='both', which='major', labelsize=16)
+    
+    # add a legend to show the office options
+    # add a legend entry for the label='Min/Max Spread'
+    handles, labels = ax.get_legend_handles_labels()
+    new_handle = Line2D([], [], color='black', label='Min/Max Spread', linestyle='-', linewidth=1, marker='|')
+    new_label = 'In-Traffic Min/Max Spread for Week (miles)'
+    handles.append(new_handle)
+    labels.append(new_label)
+
+    ax.legend(handles=handles, labels=labels, loc='lower right', fontsize=16)
+    
+    _save_png(plt, plots_dir+"/"+key+".png")
+    plt.close()
+
+
+def _render_tbcca(key, address, office, val_set, emp, commute_data, commute_range_cut_off, plots_dir):
+    """
+    Renders the Time-Based Commute Cost Analysis graph for a single office.
+
+    Args:
+        key (str): The graph key, used as the file name.
+        address (str): The office address.
+        office (DataFrame): A single row DataFrame for the office.
+        val_set (DataFrame): The office's commute cost frame, see Analyzer.get_cost_frame().
+        emp (DataFrame): The employee data.
+        commute_data (DataFrame): The commute data.
+        commute_range_cut_off (float): The commute distance cut off, in miles.
+        plots_dir (str): The directory to save the graph in.
+    """
+    graphing = Graphing()
+
+    # create bins based on the max value of the data
+    binmax = 0
+    for each in ['Morning Average Cost','Evening Average Cost','Morning High Cost','Evening High Cost']:
+        if max(val_set[each]) > binmax:
+            binmax = max(val_set[each])
+    step = 5
+    # round the binmax up to the nearest step
+    bins = _bin_edges(binmax, step)
+    
+    font_mod = 1.5
+    # create histograms for the morning and evening average costs
+    plt, ax = graphing.get_histogram(emp, office, commute_data, ['m_morning_duration_in_traffic','m_evening_duration_in_traffic'], 
+                                          suptitle="Average and Maximum Time-in-Traffic Costs for \n"+str(address), 
+                                          cutoff_radius=commute_range_cut_off,
+                          x_label=str('\$ (USD) based on median salary (converted to per minute)'), y_label='# Employees',
+                          bins=bins, rows=2, cols=2, column_titles=["Average","High/Conservative"], 
+                          cumulative_line=False, font_mod=font_mod, manual_plot=True, sharey=True, sharex=True)
+    plot_vals = [['Morning Average Cost',"Morning High Cost"],["Evening Average Cost","Evening High Cost"]]
+    # manually add histograms for each office option
+    for r in range(2):
+        for c in range(2):
+            ax[r,c].hist(val_set[plot_vals[r][c]], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, align='mid', 
+                    rwidth=0.8, label=plot_vals, color=_colors(r+1))
+            ax[r,c].tick_params(axis='both', which='major', labelsize=16)
+
+            # add a text box in the upper right corner with the stats
+            textstr = _stats_textstr("Commute Time Cost: ", (np.median(val_set[plot_vals[r][c]]), np.mean(val_set[plot_vals[r][c]]),
+                                                            min(val_set[plot_vals[r][c]]), max(val_set[plot_vals[r][c]]),
+                                                            sum(val_set[plot_vals[r][c]])))
+            # place a text box in upper right in axes coords,
+            ax[r,c].text(.95, .75, textstr, transform=ax[r,c].transAxes, fontsize=14,
+                        verticalalignment='center', bbox=_STATS_BBOX, fontdict=_MONO_FONT, horizontalalignment='right')
+            
+
+            # for the first column, add morning/evening text box the top left of the plot
+            if r==0 and c == 0:
+                ax[r,c].text(0.05, 0.85, 'Morning', fontsize=14*font_mod, transform=ax[r,c].transAxes, ha='left', va='top')
+            if r==1 and c == 0:
+                ax[r,c].text(0.05, 0.85, 'Evening', fontsize=14*font_mod, transform=ax[r,c].transAxes, ha='left', va='top')
+                # set a y axis label for the first column
+                ax[r,c].set_ylabel('# Employees', fontsize=14*font_mod)
+            if r==1:
+                ax[r,c].set_xlabel('Employee Time Cost ($ USD)', fontsize=14*font_mod)
+
+    _save_png(plt, plots_dir+"/"+key+".png")
+    plt.close()
+
+
+# the tra day/time period keys, in display order, and their nice names
+_TRA_KEYS = ['m_morning_traffic_regime',
+             't_morning_traffic_regime',
+             'w_morning_traffic_regime',
+             'h_morning_traffic_regime',
+             'f_morning_traffic_regime',
+             'm_evening_traffic_regime',
+             't_evening_traffic_regime',
+             'w_evening_traffic_regime',
+             'h_evening_traffic_regime',
+             'f_evening_traffic_regime']
+
+_TRA_NICE_NAMES = {"m_morning_traffic_regime":"Monday Morning",
+                   "t_morning_traffic_regime":"Tuesday Morning",
+                   "w_morning_traffic_regime":"Wednesday Morning",
+                   "h_morning_traffic_regime":"Thursday Morning",
+                   "f_morning_traffic_regime":"Friday Morning",
+                   "m_evening_traffic_regime":"Monday Evening",
+                   "t_evening_traffic_regime":"Tuesday Evening",
+                   "w_evening_traffic_regime":"Wednesday Evening",
+                   "h_evening_traffic_regime":"Thursday Evening",
+                   "f_evening_traffic_regime":"Friday Evening"}
+
+def _render_tra(key, title, regime_counts, plots_dir, ax=None):
+    """
+    Renders the Traffic Regime Analysis graph for a single office.
+
+    Args:
+        key (str): The graph key, used as the file name.
+        title (str): The graph title.
+        regime_counts (dict): The counts of the congested, bounded and free flow commutes for each day/time period,
+            see Analyzer.get_traffic_regime_counts().
+        plots_dir (str): The directory to save the graph in.
+        ax (ndarray of Axes, optional): The pie chart axes returned by the previous tra graph, cleared and redrawn rather 
+            than creating a new figure. The caller closes the figure once it is done with it. Defaults to None, a new figure.
+
+    Returns:
+        ndarray of Axes: The pie chart axes, to pass to the next tra graph.
+    """
+
+    traffic_regimes = {1:"Congested",2:"Bounded",3:"Free Flow"}
+
+    # create a dictionary to hold the traffic regime counts for each day and morning/evening, dropping empty regimes
+    traffic_regime_counts = {}
+    for k in _TRA_KEYS:
+        counts = regime_counts[k]
+        traffic_regime_counts[k] = {i+1: int(counts[i]) for i in range(3) if counts[i] > 0}
+
+    # traffic_regime_counts now holds: 
+    # {'m_morning_traffic_regime': {1: 1539, 2: 424}, 't_morning_traffic_regime': {1: 1863, 2: 100}, 'w_morning_traffic_regime': {1: 1874, 2: 89}, 'h_morning_traffic_regime': {1: 1824, 2: 139}, 'f_morning_traffic_regime': {1: 1348, 2: 615}, 'm_evening_traffic_regime': {1: 1711, 2: 252}, 't_evening_traffic_regime': {1: 1826, 2: 137}, 'w_evening_traffic_regime': {1: 1888, 2: 75}, 'h_evening_traffic_regime': {1: 1878, 2: 85}, 'f_evening_traffic_regime': {1: 1704, 2: 259}}
+
+    # create a values variable holding a list of the traffic regime counts for each day and morning/evening
+    values = []
+    for k in _TRA_KEYS:
+        values.append(list(traffic_regime_counts[k].values()))
+
+    # iterate through traffic regime counts and create a list of labels for each day and morning/evening for regimes where counts are present
+    labels = []
+    for k in _TRA_KEYS:
+        label = []
+        for k in traffic_regime_counts[k].keys():
+            label.append(traffic_regimes[k])
+        labels.append(label)
+
+    # iterate through the labels and get the colors for each traffic regime _colors(i+1) will return a color for each regime
+    colors_list = []
+    for i in range(len(labels)):
+        color_list = []
+        for j in range(len(labels[i])):
+            color_list.append(_colors(j+7))
+        colors_list.append(color_list)
+
+    # create a titles variable holding a list of the traffic graph nice names
+    titles = [_TRA_NICE_NAMES[k] for k in _TRA_KEYS]
+    rows = 2
+    cols = 5
+    # create a composite pie chart, five wide, with rows for morning and evening.  Each pie chart will display three values, Congested, Bounded, Free Flow
+    # the figure is created for the first office in a batch and cleared and redrawn for the others, see _render_batch()
+    plt, ax = Graphing().get_piechart(values, titles=titles, suptitle=title, value_labels=labels, 
+                                      figsize=(21,7), manual_plot=False, font_mod=1, rows=rows, cols=cols, startangle=70, colors=colors_list,
+                                      ax=ax)
+    plt.tight_layout(pad=6, w_pad=8, h_pad=1)
+    plt.subplots_adjust(top=0.85)
+    # mauanlly adjust the font size of suptitle and plot titles
+    plt.suptitle(title, fontsize=25, fontweight='bold')
+    for i in range(rows):
+        for j in range(cols):
+            ax[i,j].title.set_fontsize(20)
+            # set bold
+            ax[i,j].title.set_fontweight('bold')
+
+    _save_png(plt, plots_dir+"/"+key+".png")
+    return ax
+
+def _render_wcerhma(key, address, office, emp_within, val_set, commute_range_cut_off, plots_dir):
+    """
+    Renders the Worst Case Emissions Rate Heat Map Analysis graph for a single office.
+
+    Args:
+        key (str): The graph key, used as the file name.
+        address (str): The office address.
+        office (DataFrame): A single row DataFrame for the office.
+        emp_within (DataFrame): The employees within the cut off distance, see Analyzer.get_office_commutes().
+        val_set (DataFrame): The office's commute values, see Analyzer.get_office_commutes().
+        commute_range_cut_off (float): The commute distance cut off, in miles.
+        plots_dir (str): The directory to save the graph in.
+    """
+    traffic_graph_keys = ['m_morning_emissions',
+                            't_morning_emissions',
+                            'w_morning_emissions',
+                            'h_morning_emissions',
+                            'f_morning_emissions',
+                            'm_evening_emissions',
+                            't_evening_emissions',
+                            'w_evening_emissions',
+                            'h_evening_emissions',
+                            'f_evening_emissions']
+
+    # get the sum total emissions for each day and morning/evening, in one reduction over the ten columns
+    emissions = val_set[traffic_graph_keys].to_numpy(dtype=np.float64).sum(axis=0)
+
+    # create a dictionary to hold the emissions for each day and morning/evening
+    emissions_dict = dict(zip(traffic_graph_keys, emissions.tolist()))
+
+
+    plt, ax = Graphing().get_heatmap(emp_within, office, val_set, "w_evening_emissions", title="Worst Case Emissions Rate (Wed. Evening)) \nfor "+str(address), 
+                                    value_label="CO2 Emissions in Traffic (kg/commute)", cutoff_distance=commute_range_cut_off, 
+                                    commute_radius=commute_range_cut_off, alpha=0.4, levels=20, font_mod=1.5, 
+                                    convex_hull=True, plot_points=True, imagery="Google", cmap='gist_heat_r')
+    # add a text label to the bottom right of the plot with the total emissions for the plotted value
+    t = {'em' : 'Total Emissions / Commute: {:.2f} kg'.format(emissions_dict['w_evening_emissions'])}    
+    # add to plot
+    textstr = t['em']                              
+    # place a text box in lower right in axes coords,
+    ax.text(.985, .015, textstr, transform=ax.transAxes, fontsize=14,
+                verticalalignment='bottom', bbox=_LEGEND_BBOX, fontdict=_MONO_FONT, horizontalalignment='right')
+    _save_png(plt, plots_dir+"/"+key+".png")
+    plt.close()
+
+# the shared keyword arguments each per-office render function takes, see _render_batch()
+_RENDER_SHARED_ARGS = {_render_ncsda: ("emp", "commute_data", "commute_range_cut_off", "plots_dir"),
+                       _render_tbcca: ("emp", "commute_data", "commute_range_cut_off", "plots_dir"),
+                       _render_tra: ("plots_dir",),
+                       _render_wcerhma: ("commute_range_cut_off", "plots_dir")}
+
 
 class Analyzer:
+    # commute_data column groups used throughout the analysis (lists, as pandas reads a tuple key as a single label)
+    _DURATION_COLS = ['m_morning_duration_in_traffic','m_evening_duration_in_traffic',
+                      't_morning_duration_in_traffic','t_evening_duration_in_traffic',
+                      'w_morning_duration_in_traffic','w_evening_duration_in_traffic',
+                      'h_morning_duration_in_traffic','h_evening_duration_in_traffic',
+                      'f_morning_duration_in_traffic','f_evening_duration_in_traffic']
+    _MORNING_COLS = ['m_morning_duration_in_traffic','t_morning_duration_in_traffic','w_morning_duration_in_traffic','h_morning_duration_in_traffic','f_morning_duration_in_traffic']
+    _EVENING_COLS = ['m_evening_duration_in_traffic','t_evening_duration_in_traffic','w_evening_duration_in_traffic','h_evening_duration_in_traffic','f_evening_duration_in_traffic']
+    _MORNING_EMISSIONS_COLS = ['m_morning_emissions','t_morning_emissions','w_morning_emissions','h_morning_emissions','f_morning_emissions']
+    _EVENING_EMISSIONS_COLS = ['m_evening_emissions','t_evening_emissions','w_evening_emissions','h_evening_emissions','f_evening_emissions']
+
     def __init__(self, proj=None, project_directory=None, env_file=""):
         """
         Initializes the Analyzer with specified project details and configuration.
@@ -55,6 +560,8 @@ class Analyzer:
         self.sleep_time = 60 / self.api_rate_limit
         # create a last call variable, set it to a time in the past
         self.last_call = datetime.now() - timedelta(seconds=self.sleep_time)
+        # the batch geocode and commute calls run on several threads, they take turns checking and updating last_call
+        self._rate_lock = threading.Lock()
         self.gAPI = None
         self.gAPI_key = ""
         self.analysis_phase = 0
@@ -93,6 +600,10 @@ class Analyzer:
             # create it if it doesn't exist, then list the plot .png filenames
         self.load_graphs()
         self.graphing = None
+        # per-office commute values and cost frames shared between graphs and analyses, see get_office_commutes()
+        # and get_cost_frame()
+        self._office_commutes = {}
+        self._cost_frames = {}
         # update the analysis phase
         self.update_analysis_phase()
         return None
@@ -128,11 +639,55 @@ class Analyzer:
         Returns:
             None
         """
-        # if the delta between the current time and the last call is less than the sleep time, sleep for the difference
-        if (datetime.now() - self.last_call).seconds < self.sleep_time:
-            sleep(self.sleep_time - (datetime.now() - self.last_call).seconds)
+        # if the delta between the current time and the last call is less than the sleep time, sleep for the difference,
+        # under the lock so concurrent callers are spaced sleep_time apart rather than all seeing the same last call
+        with self._rate_lock:
+            wait = self.sleep_time - (datetime.now() - self.last_call).total_seconds()
+            if wait > 0:
+                sleep(wait)
+            self.last_call = datetime.now()
         return None
 
+    def call_GAPI(self, name, call, *args):
+        """
+        Makes one rate limited Google API call, retrying it once after a delay if it fails with a recoverable exception.
+
+        This is the worker the batch geocode and commute methods run for each call, so the rate limit and retry handling 
+        apply per call while the calls themselves overlap on the API client's thread pool.
+
+        Args:
+            name (str): The name of the API function, for the error log.
+            call (callable): The API function to call, e.g. self.gAPI.geocode.
+            *args: The arguments to the API function.
+
+        Returns:
+            The API function's return value.
+
+        Raises:
+            Exception: The API function's exception if it is unrecoverable, or if it recurs on the retry.
+        """
+        self.sleepif()
+        try:
+            return call(*args)
+        except Exception as e:
+            # write the exception event to the error log
+            self.log_error("Exception calling "+name+" function for "+str(args)+": "+str(e)+"\n")
+            print("Exception calling "+name+" function: "+str(e)+"\n")
+            # if the exception is an unrecoverable one, raise it, else retry once after a delay
+            if not self.handle_GAPI_exception(e):
+                print("Unrecoverable exception calling "+name+", tried once. "+str(e)+"\n")
+                self.log_error("Unrecoverable error calling "+name+" function, failed once. Exception: "+str(e)+"\n")
+                raise
+        print("recoverable exception, waiting to retry once")
+        sleep(10000)
+        self.sleepif()
+        try:
+            return call(*args)
+        except Exception as e:
+            print("Recoverable exception, tried twice, deemed unrecoverable. "+str(e)+"\n")
+            self.log_error("Recoverable error calling "+name+" function, failed twice. Deemed unrecoverable. Exception: "+str(e)+"\n")
+            raise
+
     def log_error(self, message):
         """
         Logs an error message to the 'error_log.txt' file.
@@ -215,6 +770,7 @@ class Analyzer:
         """
         # create a new project
         self.project = Project(project_name, self.project_directory)
+        self.clear_office_caches()
         # update the analysis phase
         self.update_analysis_phase()
         return True
@@ -234,6 +790,7 @@ class Analyzer:
         """
      # load an existing project
         self.project = Project(project_name, self.project_directory)
+        self.clear_office_caches()
         # load the graphs if any
         self.load_graphs()
         # update the analysis phase
@@ -342,53 +899,32 @@ class Analyzer:
                 # if the address data is already in the project, use it
                 # create the project data object to hold the gps data
                 self.project.start_dataframe(out[file])
-                # iterate through the address data and convert each address to gps lat long in the project data object
-                for index, row in self.project.data[file].iterrows():
-                    # get the geocoded address lat and long
-                    try:
-                        if log_csv: 
-                            log.write("Geocoding address: "+row["address"]+"\n")
-                            log.flush()
-                            print("Geocoding address: "+row["address"]+"\n")
-                        self.sleepif()
-                        try:
-                            latlong = self.gAPI.geocode(row["address"])
-                        except Exception as e:
-                            # if logging, write the exception event to the logfile
-                            self.log_error("Exception calling geocode function: "+str(e)+"\n")
-                            print("Exception calling geocode function: "+str(e)+"\n")
-                            # if the excetion is a recoverable one, retry after a delay, else raise the exception
-                            if self.handle_GAPI_exception(e):
-                                print("recoverable exception, waiting to retry once")
-                                sleep(10000)
-                                try:
-                                    latlong = self.gAPI.geocode(row["address"])
-                                except Exception as e:
-                                    print("Unrecoverable exception, tried twice skipping address"+str(e)+"\n")
-                                    # if logging, write the exception event to the logfile
-                                    self.log_error("Recoverable error calling geocode function, failed twice. Deemed unrecoverable. Exception: "+str(e)+"\n")
-                                    e.add_note = "Recoverable error calling geocode function, failed twice. Deemed unrecoverable"
-                                    raise e
-                            else:
-                                print("Recoverable exception calling geocode, skipping address. \n"+str(e)+"\n")
-                                self.log_error("Unrecoverable error calling geocode, failed once. Exception: "+str(e)+"\n")
-                                e.add_note = "Unrecoverable error calling geocode, failed once"
-                                raise e
-                            
-
-                        # insert the lat and long into a new row in the project data object
-                        self.project.data[out[file]].loc[index] = {"address": row["address"],"latitude": latlong['lat'], "longitude": latlong['lng']}
-                    except Exception as e:
-                        print("Error saving geocode address result: "+row["address"] + "\n Got exception: "+str(e))
-                        if log_csv: log.write("Error saving geocode result address: "+row["address"]+"\n")
-                        self.log_error("Error saving geocode result address: "+row["address"]+"\n" + "Got exception: "+str(e))
-                        raise e
+                addresses = self.project.data[file]["address"]
+                for address in addresses:
+                    if log_csv: 
+                        log.write("Geocoding address: "+address+"\n")
+                        log.flush()
+                        print("Geocoding address: "+address+"\n")
+                # geocode the addresses concurrently on the API client's thread pool, each call rate limited and retried 
+                # once if it fails with a recoverable exception, see call_GAPI()
+                try:
+                    latlongs = self.gAPI.geocode_many(addresses, worker=lambda address: self.call_GAPI("geocode", self.gAPI.geocode, address))
+                except Exception as e:
+                    print("Error geocoding addresses from "+file+"\n Got exception: "+str(e))
+                    if log_csv: log.write("Error geocoding addresses from "+file+"\n")
+                    self.log_error("Error geocoding addresses from "+file+"\n" + "Got exception: "+str(e))
+                    raise e
+                # insert each address's lat and long into a new row in the project data object
+                for (index, address), latlong in zip(addresses.items(), latlongs):
+                    self.project.data[out[file]].loc[index] = {"address": address,"latitude": latlong['lat'], "longitude": latlong['lng']}
                                             
                 # save the project data object to the csv file
                 if file == "employee_addresses.csv":
                     self.project.save_data_file(out[file])
                 elif file == "office_addresses.csv":
                     self.project.save_data_file(out[file])
+                # employee or office locations changed, drop any office values and cost frames built from the old ones
+                self.clear_office_caches()
                 # update the analysis phase
                 self.update_analysis_phase()
                 if log_csv: log.write("Geocoding complete\n")
@@ -435,6 +971,8 @@ class Analyzer:
                 self.project.data["gps_fuzz.csv"].loc[index] = {"latitude": latlong['lat'], "longitude": latlong['lng']}
             # save the project data object to the csv file
             self.project.save_data_file("gps_fuzz.csv")
+            # fuzzed employee locations changed, drop any office values and cost frames built from the old ones
+            self.clear_office_caches()
             # update the analysis phase
             self.update_analysis_phase()
         else:    
@@ -564,6 +1102,8 @@ class Analyzer:
         """       
         # for each office location
         data_key = "employee_gps.csv" if self.project.use_gps_fuzzing==False or self.project.use_gps_fuzzing==False else "gps_fuzz.csv"
+        # the commutes to request, as (data_row, day_time, source, destination) for each office, employee, day and time
+        requests = []
         for index, row in self.project.data["office_gps.csv"].iterrows():
             # for each employee+
             for index2, row2 in self.project.data[data_key].iterrows():
@@ -571,10 +1111,9 @@ class Analyzer:
                 # create a row in the dataframe for this employee to this office, add initial data, use -1 for all incomplete calculations
                 val= [row["address"],row2["latitude"], row2["longitude"],row["latitude"],row["longitude"]] + [-1.0 for i in range(24)]
                 self.project.data["commute_data.csv"].loc[data_row] = val
-                # calculate the commute time for this employee to this office
+                # the commute time for this employee to this office for each day and time
                 for day in days:
                     for time in times:
-                        # log iff logging
                         # create source and destination placeholders
                         if "evening" in time:
                             source = (row2["latitude"],row2["longitude"])
@@ -582,56 +1121,46 @@ class Analyzer:
                         else:
                             source = (row["latitude"],row["longitude"])
                             destination = (row2["latitude"],row2["longitude"])
+                        # log iff logging
                         if log_csv: 
                             log.write("Calculating commute time for " +str(source[0])+","+str(source[1])+" to "+str(destination[0])+","+str(destination[1])+" at "+str(commutes[day+"_"+time])+"\n")
                             log.flush()
                         print("Calculating commute time for " +str(source[0])+","+str(source[1])+" to "+str(destination[0])+","+str(destination[1])+" at "+str(commutes[day+"_"+time])+"\n")
-                        # sleep if necessary for rate limit
-                        self.sleepif()
-                        try:
-                            # get the commute time
-                            commute = self.gAPI.commute((source[0],source[1]),(destination[0],destination[1]),commutes[day+"_"+time])
-                        except Exception as e:
-                            # if logging, write the exception event to the logfile
-                            if log_csv:
-                                log.write("Exception calling commute function: "+str(e)+"\n")
-                                log.flush()
-                            self.log_error("Exception calling commute function: "+str(e)+"\n")
-                            # if the excetion is a recoverable one, retry after a delay, else raise the exception
-                            if self.handle_GAPI_exception(e):
-                                print("recoverable exception, waiting to retry once")
-                                sleep(10000)
-                                try:
-                                    commute = self.gAPI.commute((source[0],source[1]),(destination(0),destination[1]),commutes[day+"_"+time])
-                                except Exception as e:
-                                    print("Recoverable exception, tried twice skipping address, deemed unrecoverable. "+str(e)+"\n")
-                                    # if logging, write the exception event to the logfile
-                                    self.log_error("Recoverable error calling commute function, failed twice. Deemed unrecoverable. Exception: "+str(e)+"\n")
-                                    e.add_note = "Recoverable error calling commute function, failed twice. Deemed unrecoverable"
-                                    raise e
-                            else:
-                                # print the full stack trace and raise e
-                                print("Unrecoverable unknown exception, tried once. "+str(e)+"\n")
-                                # if logging, write the exception event to the logfile
-                                self.log_error("Unrecoverable error calling commute function, failed once. Exception: "+str(e)+"\n")
-                                e.add_note = "Unrecoverable error calling commute function, failed once"
-                                raise e
-                        try:
-                            # Update the row in the dataframe with the commute time
-                            self.project.data["commute_data.csv"].loc[data_row,day+"_"+time+"_duration_in_traffic"] = float(self.convert_stringtime_to_minutes(commute["duration_in_traffic"]))
-                            # if this is the first time through, insert the distance and duration into the dataframe
-                            if day == "m" and time == "morning":
-                                self.project.data["commute_data.csv"].loc[data_row,"miles"] = float(self.convert_stringdistance_to_d(commute["distance"]))
-                                self.project.data["commute_data.csv"].loc[data_row,"duration"] = float(self.convert_stringtime_to_minutes(commute["duration"]))
-                        except Exception as e:
-                            # if logging, write the exception event to the logfile
-                            if log_csv:
-                                log.write("Exception updating commute data: "+str(e)+"\n")
-                                log.flush()
-                            self.log_error("Exception updating commute data: "+str(e)+"\n")
-                            e.add_note = "Exception updating commute data after calling commute function."
-                            raise e
+                        requests.append((data_row, day+"_"+time, source, destination))
+        # get the commute times concurrently on the API client's thread pool, each call rate limited and retried once if it 
+        # fails with a recoverable exception, see call_GAPI()
+        try:
+            results = self.gAPI.commute_many([(source, destination, commutes[day_time]) for _, day_time, source, destination in requests], 
+                                             worker=lambda *c: self.call_GAPI("commute", self.gAPI.commute, *c))
+        except Exception as e:
+            # if logging, write the exception event to the logfile
+            if log_csv:
+                log.write("Exception calling commute function: "+str(e)+"\n")
+                log.flush()
+            raise e
+        for (data_row, day_time, _, _), commute in zip(requests, results):
+            try:
+                # commute returns an error dictionary rather than raising
+                if "Error" in commute:
+                    raise ValueError("Commute function returned an error: "+commute["Error"])
+                # Update the row in the dataframe with the commute time
+                self.project.data["commute_data.csv"].loc[data_row,day_time+"_duration_in_traffic"] = float(self.convert_stringtime_to_minutes(commute["duration_in_traffic"]))
+                # if this is the first time through, insert the distance and duration into the dataframe
+                if day_time == "m_morning":
+                    self.project.data["commute_data.csv"].loc[data_row,"miles"] = float(self.convert_stringdistance_to_d(commute["distance"]))
+                    self.project.data["commute_data.csv"].loc[data_row,"duration"] = float(self.convert_stringtime_to_minutes(commute["duration"]))
+            except Exception as e:
+                # if logging, write the exception event to the logfile
+                if log_csv:
+                    log.write("Exception updating commute data: "+str(e)+"\n")
+                    log.flush()
+                self.log_error("Exception updating commute data: "+str(e)+"\n")
+                if hasattr(e, "add_note"):
+                    e.add_note("Exception updating commute data after calling commute function.")
+                raise e
                         
+        # commute durations changed, drop any office values and cost frames built from the old values
+        self.clear_office_caches()
         # save the project data object to the csv file
         self.project.save_data_file("commute_data.csv")
 
@@ -739,10 +1268,11 @@ class Analyzer:
         else:
             print("Commute data missing from project.")
             return False
-        # calculate the commute cost for each employee
-        for index, row in self.project.data["commute_data.csv"].iterrows():
-            # calculate the commute cost
-            self.project.data["commute_data.csv"].loc[index,"commute_cost"] = float(row["miles"]) * float(self.project.mileage_rate)
+        # calculate the commute cost for each employee, for every commute at once
+        commute_data = self.project.data["commute_data.csv"]
+        commute_data["commute_cost"] = commute_data["miles"].astype(float) * float(self.project.mileage_rate)
+        # commute costs changed, drop any office values and cost frames built from the old values
+        self.clear_office_caches()
         # save the project data object to the csv file
         self.project.save_data_file("commute_data.csv")
     
@@ -774,17 +1304,22 @@ class Analyzer:
         else:
             print("Commute data missing from project.")
             return False
-        # calculate the commute emissions for each row in the commute data
-        for index, row in self.project.data["commute_data.csv"].iterrows():
-            # calculate the commute emissions
-            self.project.data["commute_data.csv"].loc[index,"emissions"] = float(row["miles"]) * float(self.project.CO2_per_mile)
-            # calcualte the emissions for each day and time
-            for day in ["m","t","w","h","f"]:
-                for time in ["morning","evening"]:
-                    # get the traffic regime for this commute
-                    emissions_factor = self.get_traffic_emissions_factor(self.get_traffic_regime(row["miles"], row[day+"_"+time+"_duration_in_traffic"]))
-                    self.project.data["commute_data.csv"].loc[index,day+"_"+time+"_emissions"] = float(row["miles"]) * float(self.project.CO2_per_mile) * emissions_factor
+        commute_data = self.project.data["commute_data.csv"]
+        # calculate the commute emissions for every commute at once
+        miles = commute_data["miles"].to_numpy(dtype=np.float64)
+        base_emissions = miles * float(self.project.CO2_per_mile)
+        commute_data["emissions"] = base_emissions
+        # classify the commutes for every day and time as int8 regimes in one call, on a (periods, commutes) array of 
+        # durations, the emissions factors are then a lookup indexed by regime (index 0 is unused, regimes are 1-3)
+        emissions_factors = np.array([1.0, self.get_traffic_emissions_factor(1), self.get_traffic_emissions_factor(2),
+                                      self.get_traffic_emissions_factor(3)])
+        regimes = self._traffic_regime_vec(miles, commute_data[self._DURATION_COLS].to_numpy(dtype=np.float64).T)
+        # calcualte the emissions for each day and time
+        for col, regime in zip(self._DURATION_COLS, regimes):
+            commute_data[col.replace("_duration_in_traffic", "_emissions")] = base_emissions * emissions_factors[regime]
                     
+        # commute emissions changed, drop any office values and cost frames built from the old values
+        self.clear_office_caches()
         # save the project data object to the csv file
         self.project.save_data_file("commute_data.csv")
 
@@ -815,6 +1350,24 @@ class Analyzer:
         # if the average speed is greater than or equal to the lower bound of regime 3, return regime 3
         return 3
         
+    def _traffic_regime_vec(self, distance, duration_in_traffic):
+        """
+        Vectorized get_traffic_regime(), classifying arrays of commutes in one pass.
+
+        Args:
+            distance (ndarray): The distances of the commutes.
+            duration_in_traffic (ndarray): The durations of the commutes in traffic in minutes, broadcastable against distance 
+                (e.g. a (periods, commutes) array to classify several day/time periods at once).
+
+        Returns:
+            ndarray: The traffic regime level (int8) for each commute, using the same thresholds as get_traffic_regime().
+        """
+        # get the average speeds, a zero duration gives an infinite speed (free flow) rather than raising
+        with np.errstate(divide='ignore', invalid='ignore'):
+            average_speed = distance / (duration_in_traffic/60)
+        return np.select([average_speed < self.project.traffic_regime_2, average_speed < self.project.traffic_regime_3],
+                         [np.int8(1), np.int8(2)], default=np.int8(3))
+
     def get_traffic_emissions_factor(self, regime):
         """
         Retrieves the emissions factor associated with a given traffic regime.
@@ -866,7 +1419,211 @@ class Analyzer:
             print("Encountered an undefined exception type (" + str(exception) + "). Raising the exception...")
             return False
 
-    def generate_graphs(self, graph="_all"):
+    def clear_office_caches(self):
+        """
+        Drops the cached per-office commute values and cost frames, see get_office_commutes() and get_cost_frame().
+
+        Called by every method that replaces or changes the employee, office or commute data the values are built from, 
+        and when a project is created or loaded.
+
+        Returns:
+            None
+        """
+        self._office_commutes = {}
+        self._cost_frames = {}
+        return None
+
+    def get_office_commutes(self, office, emp, commute_data):
+        """
+        Returns the employees within the cutoff distance of an office and their commute data, building and caching them on first use.
+
+        Most of the per-office graphs, the cost frames and the attrition/emissions analyses all start from the same drive distance 
+        filter and commute data lookup for an office, so it is only done once per office.
+
+        Args:
+            office (DataFrame): A single row DataFrame for the office.
+            emp (DataFrame): The employee data.
+            commute_data (DataFrame): The commute data.
+
+        Returns:
+            tuple: The employees within the cutoff distance (DataFrame), and their commute data for the office with all commute 
+            data columns plus 'origin_lat' and 'origin_long' restored (DataFrame). Callers should treat both as read only, they are shared.
+
+        Values are cached in self._office_commutes, cleared along with self._cost_frames, see get_cost_frame(). Cached values 
+        are only reused for the same emp and commute_data frames, reloading, regeocoding or refuzzing the employees (or 
+        reloading the commute data) gives a new frame, and the values are rebuilt from it.
+        """
+        cache_key = (office["address"].values[0], self.project.commute_range_cut_off, self.project.use_gps_fuzzing)
+        cached = self._office_commutes.get(cache_key)
+        if cached is not None and cached[0] is emp and cached[1] is commute_data:
+            return cached[2:]
+
+        # get the needed commute values
+        values = commute_data.columns.to_list()
+        # filter the employees to only those within the cutoff distance
+        emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
+        val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
+        # restore val_set columns latitutde and longitude to origin_lat and origin_long
+        val_set['origin_lat'] = val_set['latitude']
+        val_set['origin_long'] = val_set['longitude']
+
+        # kept with the frames they were built from, see above
+        self._office_commutes[cache_key] = (emp, commute_data, emp_within, val_set)
+        return emp_within, val_set
+
+    def get_traffic_regime_counts(self, office, emp, commute_data):
+        """
+        Returns the number of congested, bounded and free flow commutes to an office for each day's morning and evening commute.
+
+        Args:
+            office (DataFrame): A single row DataFrame for the office.
+            emp (DataFrame): The employee data.
+            commute_data (DataFrame): The commute data.
+
+        Returns:
+            dict: The counts (ndarray of three ints, ordered congested, bounded, free flow) keyed by day/time period 
+            (e.g. 'm_morning_traffic_regime').
+        """
+        # the employees within the cutoff distance and their commute values are shared with the wcerhma graphs
+        emp_within, val_set = self.get_office_commutes(office, emp, commute_data)
+
+        # classify every commute for all ten day/time periods in one call, on a (periods, commutes) array of durations
+        miles = val_set['miles'].to_numpy(dtype=np.float64)
+        durations = val_set[self._DURATION_COLS].to_numpy(dtype=np.float64).T
+        regimes = self._traffic_regime_vec(miles, durations)
+        # regimes are the fixed integers 1-3, so a bincount gives the counts already ordered by regime
+        return {col.replace('_duration_in_traffic', '_traffic_regime'): np.bincount(r, minlength=4)[1:]
+                for col, r in zip(self._DURATION_COLS, regimes)}
+
+    def get_cost_frame(self, office, emp, commute_data):
+        """
+        Returns the per-employee commute cost frame for an office, building and caching it on first use.
+
+        The frame holds the commute data for employees within the cutoff distance of the office, with the morning/evening 
+        average and top 'commute_days_per_week' durations, their time costs at the median salary, and the total time and 
+        total (time plus mileage) costs added as columns.  It is shared by the Time-Based and Total Commute Cost graphs and 
+        the attrition analysis, so each office's frame is only built once.
+
+        Args:
+            office (DataFrame): A single row DataFrame for the office.
+            emp (DataFrame): The employee data.
+            commute_data (DataFrame): The commute data.
+
+        Returns:
+            DataFrame: The cost frame for the office. Callers should treat it as read only, it is shared.
+
+        Frames are cached in self._cost_frames, which is cleared (see clear_office_caches()) when a project is loaded or 
+        created and whenever the employee, office or commute data is regenerated or the commute costs are recalculated.  The cache key includes the project settings the frame depends on, so edits to 
+        those settings are picked up without clearing it, and a frame is only reused while it was built from the office's 
+        current commute values (see get_office_commutes()), so it is rebuilt when they are.
+        """
+        cdpw = self.project.commute_days_per_week
+        # Calculate a per-minute cost based on "median_salary" and "hours_per_year"
+        per_minute_cost = self.project.median_salary / (self.project.hours_per_year * 60)
+        cache_key = (office["address"].values[0], self.project.commute_range_cut_off, self.project.use_gps_fuzzing, 
+                     cdpw, per_minute_cost)
+        office_values = self.get_office_commutes(office, emp, commute_data)[1]
+        cached = self._cost_frames.get(cache_key)
+        if cached is not None and cached[0] is office_values:
+            return cached[1]
+
+        # start from a copy of the office's shared commute values, the cost columns are added to it below
+        val_set = office_values.copy()
+
+        # Calculate and insert the average and top 'cdpw' maximum morning and evening commute times directly into val_set
+        # the weekday columns are pulled out as (commutes, 5) float64 blocks once, both the averages and the top 'cdpw'
+        # averages are computed from them (the average is the top-5 average, which skips NaN as mean() does)
+        mornings = val_set[self._MORNING_COLS].to_numpy(dtype=np.float64)
+        evenings = val_set[self._EVENING_COLS].to_numpy(dtype=np.float64)
+        averages = np.column_stack([_top_n_mean(mornings, mornings.shape[1]), _top_n_mean(evenings, evenings.shape[1]),
+                                    _top_n_mean(mornings, cdpw), _top_n_mean(evenings, cdpw)])
+        val_set[['Morning Average', 'Evening Average', 'Average Top CDPW Morning', 'Average Top CDPW Evening']] = averages
+
+        # Calculate and insert the average and high/conservative costs for the week directly into val_set, in one product
+        val_set[['Morning Average Cost', 'Evening Average Cost', 'Morning High Cost', 'Evening High Cost']] = averages * per_minute_cost
+
+        # Calculate a Total Average Time and Total High Time cost
+        val_set['Total Average Time Cost'] = val_set['Morning Average Cost'] + val_set['Evening Average Cost']
+        val_set['Total High Time Cost'] = val_set['Morning High Cost'] + val_set['Evening High Cost']
+
+        # Calculate a Total Average Cost and Total High Cost
+        val_set['Total Average Cost'] = val_set['Total Average Time Cost'] + val_set['commute_cost']
+        val_set['Total High Cost'] = val_set['Total High Time Cost'] + val_set['commute_cost']
+
+        self._cost_frames[cache_key] = (office_values, val_set)
+        return val_set
+
+    def get_emissions_frame(self, office, emp, commute_data):
+        """
+        Returns the per-employee commute emissions cost frame for an office, building and caching it on first use.
+
+        The frame holds the commute data for employees within the cutoff distance of the office, with the morning/evening 
+        average and top 'commute_days_per_week' emissions, and their costs at the CO2 credit cost, added as columns, see 
+        get_cost_frame().
+
+        Args:
+            office (DataFrame): A single row DataFrame for the office.
+            emp (DataFrame): The employee data.
+            commute_data (DataFrame): The commute data.
+
+        Returns:
+            DataFrame: The emissions cost frame for the office. Callers should treat it as read only, it is shared.
+
+        Frames are cached in self._cost_frames alongside the commute cost frames, see get_cost_frame().
+        """
+        cdpw = self.project.commute_days_per_week
+        # emissions figure are in kg/commute. To get cost we need the CO2_credit_cost, which is $/metric ton
+        per_kg_CO2_cost = self.project.CO2_credit_cost / 1000
+        cache_key = ("emissions", office["address"].values[0], self.project.commute_range_cut_off, self.project.use_gps_fuzzing, 
+                     cdpw, per_kg_CO2_cost)
+        office_values = self.get_office_commutes(office, emp, commute_data)[1]
+        cached = self._cost_frames.get(cache_key)
+        if cached is not None and cached[0] is office_values:
+            return cached[1]
+
+        # start from a copy of the office's shared commute values, the cost columns are added to it below
+        val_set = office_values.copy()
+
+        # Calculate and insert the average and top 'cdpw' maximum morning and evening emissions directly into val_set
+        # the weekday columns are pulled out as (commutes, 5) float64 blocks once, both the averages and the top 'cdpw'
+        # averages are computed from them (the average is the top-5 average, which skips NaN as mean() does)
+        mornings = val_set[self._MORNING_EMISSIONS_COLS].to_numpy(dtype=np.float64)
+        evenings = val_set[self._EVENING_EMISSIONS_COLS].to_numpy(dtype=np.float64)
+        averages = np.column_stack([_top_n_mean(mornings, mornings.shape[1]), _top_n_mean(evenings, evenings.shape[1]),
+                                    _top_n_mean(mornings, cdpw), _top_n_mean(evenings, cdpw)])
+        val_set[['Morning Average', 'Evening Average', 'Average Top CDPW Morning', 'Average Top CDPW Evening']] = averages
+
+        # Calculate and insert the average and high/conservative costs for the week directly into val_set, in one product
+        val_set[['Morning Average Cost', 'Evening Average Cost', 'Morning High Cost', 'Evening High Cost']] = averages * per_kg_CO2_cost
+
+        # Calculate a Total Average Time and Total High Time cost
+        val_set['Total Average Cost'] = val_set['Morning Average Cost'] + val_set['Evening Average Cost']
+        val_set['Total High Cost'] = val_set['Morning High Cost'] + val_set['Evening High Cost']
+
+        self._cost_frames[cache_key] = (office_values, val_set)
+        return val_set
+
+    def get_graph_inputs_hash(self, emp, offices, commute_data):
+        """
+        Returns a fingerprint of everything the graphs are rendered from, used to skip re-rendering unchanged graphs.
+
+        Args:
+            emp (DataFrame): The employee data.
+            offices (DataFrame): The office data.
+            commute_data (DataFrame): The commute data.
+
+        Returns:
+            str: A hex digest of the employee, office and commute data contents and the project settings.
+        """
+        h = hashlib.sha256()
+        for data in (emp, offices, commute_data):
+            h.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+        # the API key doesn't affect the graphs, leave it out so it is never hashed alongside the data
+        settings = {attr: getattr(self.project, attr) for attr in self.project.project_file_attributes if attr != "GMAPS_API_KEY"}
+        h.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()
+
+    def generate_graphs(self, graph="_all", force=False):
         """
         Generates and saves graphical representations of analyzed commute data.
 
@@ -877,19 +1634,13 @@ class Analyzer:
         Args:
             graph (str, optional): Specifies which graph to generate. Use "_all" to generate all graphs, or specify a 
             particular graph's key. Defaults to "_all".
+            force (bool, optional): If True, re-renders graphs even if their .png was already rendered from the same data and 
+            settings, see get_graph_inputs_hash(). Defaults to False.
 
         Returns:
             list: A list of dictionaries, each containing details about the generated graphs, including file paths and titles.
         """
 
-        # define a color palette supporting up to 10 unique colors
-        color_palette = ['#6e7c8a', '#90a08f', '#c3a3a9', '#b1c5c3', '#e1c08b', '#a592ba', '#a8b1d5', '#d4abad', '#c4c38a', '#ceb2ab']
-                        # lighter pastel ['#7D8A97', '#A3B0A2', '#D3BCC0', '#C9D7D6', '#EAD2AC', '#B8A9C9', '#C5CBE3', '#E3C8C9', '#D1D0A3', '#DECBC6']
-
-        # Create a new list of colors "i" long, recycling colors as needed
-        def colors(i):
-            return color_palette[i % len(color_palette)]
-
         # generate the graphs for the project
         # if the commute data isn't already in the project, load it
         if "commute_data.csv" in self.project.list_data_files():
@@ -919,16 +1670,11 @@ class Analyzer:
         
         offices = self.project.get_office_gps()
         commute_data = self.project.get_commute_data()
-        
-        # helper function to get a base cost dataframe
-        def get_base_cost_df(emp, officeaddr):
-            rows = []
-            for index, row in emp.iterrows():
-                cost = 0.0
-                rows.append({'latitude':row['latitude'],'longitude':row['longitude'],'office':officeaddr,'cost':cost})
-            #cost_df = pd.DataFrame(rows)
-            return rows
-            
+
+        # map each graph key to its renderer and the per-graph arguments it needs, graphs are registered
+        # in display order below and only the requested ones are rendered once registration is complete
+        renderers = {}
+
         ################################################################################ 
         # GRAPH: 
         ## Geographical Distribution of Analyzed Locations
@@ -941,12 +1687,7 @@ class Analyzer:
                                     "including those which may be outside of the commuting radius.  A total of "+str(len(emp))+" employee addresses " + \
                                     "and "+str(len(offices))+" office locations are included in the analysis."               
                                 })
-        if graph == "_all" or graph == key:
-            plt, ax = self.graphing.get_map_view(emp, offices, title=title, font_mod=1.5,
-                                                 commute_color=False, commute_data=commute_data, convex_hull=False, size_o=400, size_e=40)
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/gdal.png")
-            plt.close()
+        renderers[key] = (self._render_gdal, self.graph_list[-1], title, None)
 
         ################################################################################
         ### GRAPH SET: Local Analysis for Office X
@@ -968,23 +1709,7 @@ class Analyzer:
                                                         "roadway complexities.  The bounded region will vary widely between offices analyzed."
                                                         
                                     })
-            if graph == "_all" or graph == key:
-                #just get the first office row
-                #offices = pd.DataFrame(offices.iloc[0],offices.columns).reset_index(drop=True)
-                office = row.to_frame().T
-                plt, ax = self.graphing.get_map_view(emp, office, title="Employee Distribution for \n"+OfficeAddr, 
-                                                    cutoff_distance=self.project.commute_range_cut_off*2,
-                                                    commute_radius=self.project.commute_range_cut_off, font_mod=1.5,
-                                                    commute_color=True, commute_data=commute_data, convex_hull=True, legend_loc='lower right')
-                plt.tight_layout(pad=1.0)
-                plt.savefig(plots_dir+"/"+key+".png")
-                plt.close()
-
-                # get the employees within the cutoff distance by driving distance, then add the count to the plot description
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                self.graph_list[-1]["PLOT-DESCRIPTION"] = self.graph_list[-1]["PLOT-DESCRIPTION"] + " There are " + str(len(emp_within)) + \
-                                                                " of the total " + str(len(emp)) + " employees within the cutoff distance, a total of " + \
-                                                                str(round(len(emp_within)/len(emp)*100,2)) + "% of the total employees."
+            renderers[key] = (self._render_lafo, self.graph_list[-1], title, row)
 
         ################################################################################ 
         # GRAPH: 
@@ -1001,14 +1726,7 @@ class Analyzer:
                                                     "work status affected by the relocation while those outside the green convex hull remain unaffected by all scenarios. " + \
                                                     "Black circles represent a bounding linear distance of " + str(self.project.commute_range_cut_off) +" miles from each office options for perspective."
                                 })
-        if graph == "_all" or graph == key:
-            plt, ax = self.graphing.get_map_view(emp, offices, title=title, 
-                                                 cutoff_radius=self.project.commute_range_cut_off*2,
-                                                 commute_radius=self.project.commute_range_cut_off, legend_loc='lower left', font_mod=1.5,
-                                                 commute_color=True, commute_data=commute_data, convex_hull=True,size_o=500)
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
+        renderers[key] = (self._render_lacg, self.graph_list[-1], title, None)
 
 
         ################################################################################ 
@@ -1023,55 +1741,7 @@ class Analyzer:
                                 "PLOT-DESCRIPTION": "deferred"                                
                                 })
         
-        if graph == "_all" or graph == key:
-            plt, ax = self.graphing.get_map_view(emp, offices, title=title, font_mod=1.5,
-                                                 cutoff_radius=self.project.commute_range_cut_off*1.2,
-                                                 commute_radius=self.project.commute_range_cut_off, 
-                                                 commute_color=False, commute_data=commute_data, convex_hull=False,size_o=500, manual_plot=True)
-            
-            emp_within, emp_outside, emp_overlap, emp_within_all, emp_outside_all = None, None, None, None, None
-            
-            emp_within = self.graphing.filter_drive_distance(emp,offices,self.project.commute_range_cut_off, commute_data=commute_data, inside=True)
-            emp_outside = self.graphing.filter_drive_distance(emp,offices,self.project.commute_range_cut_off, commute_data=commute_data, inside=False)
-            if not emp_within.empty and not emp_outside.empty:                
-                emp_overlap = self.graphing.get_common_points(emp_within,emp_outside)
-            if not emp_within.empty and not emp_outside.empty:
-                emp_outside_all = self.graphing.get_unique_points(emp_outside,emp_overlap)
-            if not emp_within.empty and not emp_outside.empty:
-                emp_within_all = self.graphing.get_unique_points(emp_within,emp_overlap)
-            emp_within_list = []
-            hullvars = {"color":"red","linewidth":50,"alpha":0.07}
-            for i, row in offices.iterrows():
-                office = row.to_frame().T
-                emp_within_list.append(self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data, inside=True))
-                self.graphing.plot_convex_hull(ax, emp_within_list[i], **hullvars)
-
-            # plot the points
-            if emp_within_all is not None and not emp_within_all.empty:
-                self.graphing.plot_addresses(ax, emp_within_all, color='green', label="Unaffected by \nRelocation Decision")
-            #if emp_outside_all is not None and not emp_outside_all.empty:
-                #self.graphing.plot_addresses(ax, emp_outside_all,color='gray',label="Outside Commute \nRadius for Offices")
-            if emp_overlap is not None and not emp_overlap.empty:
-                self.graphing.plot_addresses(ax, emp_overlap, color='red',s=50, label="Impacted by \nRelocation Decision")
-            self.graphing.plot_offices(ax, offices, s=400, label="Potential Office Locations")
-            if emp_within_all is not None and not emp_within_all.empty:
-                self.graphing.plot_convex_hull(ax, emp_within_all, color='red')
-            if emp_overlap is not None and not emp_overlap.empty:
-                self.graphing.plot_convex_hull(ax, emp_overlap, color='gray')
-            self.graphing.add_scalebar(ax,font_mod=1.5)
-            # add legend
-            handles, labels = plt.gca().get_legend_handles_labels()
-            self.graphing.map_view_standard_legend(ax, handles, labels, fontsize=15)
-            plt.title(title, fontsize=25)
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
-            
-
-            # udpate the plot description
-            self.graph_list[-1]["PLOT-DESCRIPTION"] = "This graph displays the " + str(0 if emp_overlap is None or emp_overlap.empty else len(emp_overlap)) + " employees that are impacted by the relocaiton.  " + \
-                                "Specifically, the red indicates employees that either rotate into, or out of the remote work policy by cutoff-distance. This is " + \
-                                str(0 if emp_overlap is None or emp_overlap.empty else round(len(emp_overlap)/len(emp)*100,2)) + "% of the total employees.  "
+        renderers[key] = (self._render_lacg2, self.graph_list[-1], title, None)
         
 
         ################################################################################ 
@@ -1086,66 +1756,7 @@ class Analyzer:
                                 "PLOT-DESCRIPTION": "deferred"
                                 })
         
-        if graph == "_all" or graph == key:
-            # get the value to plot
-            value = ['commute_cost']
-            # baseline will be first office, assumed to be the current office, or "as is use case"
-            office = offices.iloc[0].to_frame().T
-            # employees to analyze are within the cutoff distance for this office
-            emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-            # get commute cost values 
-            cost_values = self.graphing.get_commute_values(emp_within, office, commute_data, value)
-            # calculate the bin list based upon a the max value of the data
-            binmax = int(max(cost_values['commute_cost'])+1)
-            step = 1
-            # round the binmax up to the nearest step
-            bins = range(0, int(binmax + step - (binmax % step)), step)
-            plt, ax = self.graphing.get_histogram(emp_within, office, commute_data, value, suptitle="",
-                                      x_label=str('\$ (USD) based on \$'+str(self.project.mileage_rate)+' per mile.'), y_label='# Employees',
-                                      bins=bins, rows=1, cols=1, column_titles=["Baseline Commute Cost Analysis for "+office["address"].values[0] ], cumulative_line=False, font_mod=1, figsize=(10,6))
-            
-            # udpate the plot description
-            median_cost = round(np.median(cost_values['commute_cost']),2)
-            average_cost = round(np.mean(cost_values['commute_cost']),2)
-            commutes = 2*self.project.commute_days_per_week*self.project.commute_weeks_per_year
-            self.graph_list[-1]["PLOT-DESCRIPTION"] = "This graph displays the distribution of commute costs for employees within the " + \
-                                                    "cutoff distance of the office at "+office["address"].values[0]+".  " + \
-                                                    "The median cost per commute is $"+"{:.2f}".format(median_cost)+", and the average cost per commute is $"+"{:.2f}".format(average_cost)+", one way. " + \
-                                                    "For 2 commutes per day, " + str(self.project.commute_days_per_week) + \
-                                                    " days per week, and " + str(self.project.commute_weeks_per_year) + " weeks per year (" + str(commutes) + " commutes/yr), the " + \
-                                                    "median and average annual cost per employee is $"+"{:.2f}".format(round(median_cost*commutes,2))+" and $"+"{:.2f}".format(round(average_cost*commutes,2))+" respectively not including tolls, etc. " + \
-                                                    "Minimum and maximum annual costs within the designated commute range are: $" + "{:.2f}".format(round(min(cost_values['commute_cost']*commutes),2)) + " and $" + \
-                                                    "{:.2f}".format(round(max(cost_values['commute_cost']*commutes),2)) + " respectively.  In total, the workforce within the cutoff distance " + \
-                                                    "has a total annual commute cost of $"+"{:,.2f}".format(round(sum(cost_values['commute_cost'])*commutes,2))+". Values based on $"+str(self.project.mileage_rate)+" per mile."
-            
-            # add a text box with the stats, using two decimal places and adding commas at the thousands
-            t = {'me' : 'Median: |${:,.2f}'.format(median_cost*commutes),
-                'av' : 'Average: |${:,.2f}'.format(average_cost*commutes),
-                'mi' : 'Min: |${:,.2f}'.format(round(min(cost_values['commute_cost']*commutes),2)),
-                'ma' : 'Max: |${:,.2f}'.format(round(max(cost_values['commute_cost']*commutes),2)),
-                'to' : 'Total: |${:,.2f}'.format(round(sum(cost_values['commute_cost'])*commutes,2))
-                }
-            # get the longest string value
-            max_len = max(len(t['me']),len(t['av']),len(t['to']),len(t['mi']),len(t['ma']))
-            # calculate how many narrow numbers/letters exist in the string, we need to add additional space for each
-            for k in t:
-                t[k] = t[k].replace("|"," "*(max_len-len(t[k])))
-
-
-            # add spaces to make all the same length, replacing |
-            textstr = "Annualized Costs: "
-            for k in t:
-                textstr += "\n" + t[k]
-            
-            props = dict(boxstyle='round', facecolor='wheat', alpha=0.2)
-                
-            ax.text(.95, .5, textstr, fontsize=10, transform=ax.transAxes,
-                        verticalalignment='center', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='right')
-
-
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
+        renderers[key] = (self._render_bcca, self.graph_list[-1], title, None)
 
             
 
@@ -1164,85 +1775,7 @@ class Analyzer:
                                                     "Costs due to cash equivalent for time not included."
                                 })
         
-        if graph == "_all" or graph == key:
-            # get the value to plot
-            value = []
-            # employees to analyze are within the cutoff distance for this office
-            # for this analysis, we need to iterate through options
-            emp_within = []
-            office_addrs = []
-            cost_values = []
-            median_costs = []
-            average_costs = []
-            total_costs = []
-            min_costs = []
-            max_costs = []
-            for index, row in offices.iterrows():
-                office = row.to_frame().T
-                emp_within.append(self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data))
-                office_addrs.append(office["address"].values[0])
-                value.append('commute_cost')
-                cost_values.append(self.graphing.get_commute_values(emp_within[-1], office, commute_data, value[-1]))
-                commutes = 2*self.project.commute_days_per_week*self.project.commute_weeks_per_year
-                median_costs.append(round(np.median(cost_values[-1]['commute_cost'])*commutes,2))
-                average_costs.append(round(np.mean(cost_values[-1]['commute_cost']*commutes),2))
-                total_costs.append(round(sum(cost_values[-1]['commute_cost'])*commutes,2))
-                min_costs.append(round(min(cost_values[-1]['commute_cost']*commutes),2))
-                max_costs.append(round(max(cost_values[-1]['commute_cost']*commutes),2))
-
-
-            # calculate the bin list based upon a the max value of the data
-            #binmax = int(max(cost_values['commute_cost'])+1)
-            binmax = 0
-            for i in range(len(cost_values)):
-                if max(cost_values[i]['commute_cost']) > binmax:
-                    binmax = max(cost_values[i]['commute_cost'])
-            step = 1
-            # round the binmax up to the nearest step
-            bins = range(0, int(binmax + step - (binmax % step)), step)
-            plt, ax = self.graphing.get_histogram(emp, offices, commute_data, value, suptitle="", cutoff_radius=self.project.commute_range_cut_off,
-                                      x_label=str('\$ (USD), one-way, based on \$'+str(self.project.mileage_rate)+' per mile.'), y_label='# Employees',
-                                      bins=bins, rows=len(office_addrs), cols=1, column_titles=["Commute Cost Analysis for Options"], 
-                                      cumulative_line=False, font_mod=1.5, manual_plot=True)
-            
-            # manually add histograms for each office option
-            for i in range(len(emp_within)):
-                ax[i].hist(cost_values[i]['commute_cost'], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, align='mid', 
-                           rwidth=0.8, label=office_addrs[i], color=colors(i))
-                ax[i].tick_params(axis='both', which='major', labelsize=16)
-                
-                # add a legend to show the office options
-                ax[i].legend(loc='upper right', fontsize=16)
-                
-                # add a text box with the stats, using two decimal places and adding commas at the thousands
-                t = {'me' : 'Median: |${:,.2f}'.format(median_costs[i]),
-                    'av' : 'Average: |${:,.2f}'.format(average_costs[i]),
-                    'mi' : 'Min: |${:,.2f}'.format(min_costs[i]),
-                    'ma' : 'Max: |${:,.2f}'.format(max_costs[i]),
-                    'to' : 'Total: |${:,.2f}'.format(total_costs[i])
-                    }             
-                # get the longest string value
-                max_len = max(len(t['me']),len(t['av']),len(t['to']),len(t['mi']),len(t['ma']))
-                
-                # calculate how many narrow numbers/letters exist in the string, we need to add additional space for each
-                for k in t:
-                    t[k] = t[k].replace("|"," "*(max_len-len(t[k])))
-
-
-                # add spaces to make all the same length, replacing |
-                textstr = "Annualized Costs: "
-                for k in t:
-                    textstr += "\n" + t[k]
-                # these are matplotlib.patch.Patch properties
-                props = dict(boxstyle='round', facecolor='wheat', alpha=0.2)
-                # place a text box in upper right in axes coords, 
-                ax[i].text(.95, .5, textstr, transform=ax[i].transAxes, fontsize=14,
-                            verticalalignment='center', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='right')
-                
-            
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
+        renderers[key] = (self._render_ccpo, self.graph_list[-1], title, None)
 
             
             
@@ -1262,151 +1795,7 @@ class Analyzer:
                                                     "Costs due to cash equivalent for time not included."
                                 })
         
-        if graph == "_all" or graph == key:
-            # get the value to plot
-            value = []
-            # employees to analyze are within the cutoff distance for this office
-            # for this analysis, we need to iterate through options
-            current_office = offices.iloc[0].to_frame().T
-            other_offices = offices.drop(0)
-            cost_values = []
-            withins = []
-            commutes = 2*self.project.commute_days_per_week*self.project.commute_weeks_per_year
-            
-            # for each employee, calculate the commute cost to the current office, place a new dataframe with lat, long, office, and cost
-            # if the employee is within the cutoff distance, if outside the cutoff distance, the cost is 0
-            # start by looping through ALL employees and adding a row with the current office, and cost = 0
-                    
-
-            base_costs = pd.DataFrame(get_base_cost_df(emp, current_office['address'].values[0]))
-            # now get emp_within for the current office, and update the relevant rows of base_costs with actual costs for those employees 
-            # using the commute_cost column in the commute_data dataframe where the employee lat long matches the commute_data lat long and office address
-            
-            base_emp_within = self.graphing.filter_drive_distance(emp,current_office,self.project.commute_range_cut_off, commute_data=commute_data)
-
-            for index, row in base_emp_within.iterrows():
-                # get the cost from the commute_data
-                cost = commute_data[(commute_data['origin_lat'] == row['latitude']) & (commute_data['origin_long'] == row['longitude']) & (commute_data['office_address'] == current_office['address'].values[0])]['commute_cost'].values[0]
-                base_costs.loc[(base_costs['latitude'] == row['latitude']) & (base_costs['longitude'] == row['longitude']),'cost'] = cost
-            # now we have a dataframe with all employees, and the cost to the current office
-        
-            # now iterate through the other offices, get a base cost dataframe, and then update the relevant rows with actual costs, place in cost_values
-            for index, row in other_offices.iterrows():
-                office = row.to_frame().T
-                tmp_costs = pd.DataFrame(get_base_cost_df(emp, office['address'].values[0]))
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                # we will use this later to get the differential for each employee, without the employees that aren't overlapping
-                withins.append(emp_within)
-                for index, row in emp_within.iterrows():
-                    # get the cost from the commute_data
-                    cost = commute_data[(commute_data['origin_lat'] == row['latitude']) & (commute_data['origin_long'] == row['longitude']) & (commute_data['office_address'] == office['address'].values[0])]['commute_cost'].values[0]
-                    tmp_costs.loc[(tmp_costs['latitude'] == row['latitude']) & (tmp_costs['longitude'] == row['longitude']),'cost'] = cost
-                cost_values.append(tmp_costs)
-            
-            # now we have a full list of costs for each employee to each office, we can get the differentials
-            # create a list to hold the differential dataframes
-            diffs = []
-            # for each cost dataframe, calculate the differential from the base_costs dataframe into a new dataframe
-            for i in range(len(cost_values)):
-                # get the differential
-                diffs.append(cost_values[i]['cost'] - base_costs['cost'])
-            # now we have a list of dataframes with the differentials, we eliminate all rows with 0 cost differential to prevent skewing the histogram
-            # calculate the bin list based upon a the min (negative) and max (positive) values of the data     
-            binmin = 0
-            binmax = 0
-            for i in range(len(diffs)):
-                if min(diffs[i]) < binmin:
-                    binmin = min(diffs[i])
-                if max(diffs[i]) > binmax:
-                    binmax = max(diffs[i])
-            step = 1
-            # round the binmin down to the nearest step, max up to the nearest step
-            bins = range(int(binmin - (binmin % step)), int(binmax + step - (binmax % step)), step)
-
-            plt, ax = self.graphing.get_histogram(emp, other_offices, commute_data, value, suptitle="Employee Commute Cost Differential Analysis", cutoff_radius=self.project.commute_range_cut_off,
-                                      x_label=str('\$ (USD) based on \$'+str(self.project.mileage_rate)+' per mile.'), y_label='# Employees (log scale)',
-                                      bins=bins, rows=len(other_offices), cols=1, column_titles=["Employee Commute Cost Differential Analysis"], 
-                                      cumulative_line=False, font_mod=1.5, manual_plot=True)
-            
-            # manually add histograms for each office option
-            for i in range(len(diffs)):
-                ax[i].hist(diffs[i], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, align='mid', 
-                           rwidth=0.8, label=other_offices['address'].values[i], color=colors(i+1))
-                ax[i].tick_params(axis='both', which='major', labelsize=16)
-                
-                # add a legend to show the office options
-                ax[i].legend(loc='upper right', fontsize=16)
-                
-                # add a text box with the stats, using two decimal places and adding commas at the thousands
-                t = {'me' : 'Median: |${:,.2f}'.format(np.median(diffs[i]*commutes)),
-                    'av' : 'Average: |${:,.2f}'.format(np.mean(diffs[i]*commutes)),
-                    'mi' : 'Min: |${:,.2f}'.format(min(diffs[i])*commutes),
-                    'ma' : 'Max: |${:,.2f}'.format(max(diffs[i])*commutes),
-                    'to' : 'Total: |${:,.2f}'.format(sum(diffs[i])*commutes)
-                    }             
-                # get the longest string value
-                max_len = max(len(t['me']),len(t['av']),len(t['to']),len(t['mi']),len(t['ma']))
-                
-                # calculate additional space
-                for k in t:
-                    t[k] = t[k].replace("|"," "*(max_len-len(t[k])))
-
-
-                # add spaces to make all the same length, replacing |
-                textstr = "Annualized \nDifferentials: "
-                for k in t:
-                    textstr += "\n" + t[k]
-                # these are matplotlib.patch.Patch properties
-                props = dict(boxstyle='round', facecolor='wheat', alpha=0.2)
-                # place a text box in upper left in axes coords, 
-                ax[i].text(.05, .75, textstr, transform=ax[i].transAxes, fontsize=14,
-                            verticalalignment='center', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='left')
-                
-                # now, take the base_cost and the cost_values[i] and get the differential for each employee omitting 
-                # any employees that are zero cost in one, and not zero cost in the other
-                # this will omit those employees who rotated to/from remote work status as a result of the move.
-                mask = (cost_values[i]['cost'] != 0) & (base_costs['cost'] != 0)
-                differences = (cost_values[i]['cost'] - base_costs['cost'])[mask]
-                
-                # Convert differences to a list and store in diffs
-                diffs2 = differences.tolist()
-
-                # get the differential
-                # get the stats
-                median = np.median(diffs2)*commutes
-                average = np.mean(diffs2)*commutes
-                minimum = min(diffs2)*commutes
-                maximum = max(diffs2)*commutes
-                total = sum(diffs2)*commutes
-               
-                # add a text box with the stats, using two decimal places and adding commas at the thousands
-                t = {'me' : 'Median: |${:,.2f}'.format(median),
-                    'av' : 'Average: |${:,.2f}'.format(average),
-                    'mi' : 'Min: |${:,.2f}'.format(minimum),
-                    'ma' : 'Max: |${:,.2f}'.format(maximum),
-                    'to' : 'Total: |${:,.2f}'.format(total)
-                    }
-                
-                # get the longest string value
-                max_len = max(len(t['me']),len(t['av']),len(t['to']),len(t['mi']),len(t['ma']))
-                # calculate how many narrow numbers/letters exist in the string, we need to add additional space for each
-                for k in t:
-                    t[k] = t[k].replace("|"," "*(max_len-len(t[k])))
-                # add spaces to make all the same length, replacing |
-                textstr = "Annualized Differentials omitting \n Employees Rotating to/from Remote Work: "
-                for k in t:
-                    textstr += "\n" + t[k]
-                # place a text box in upper right in axes coords, 
-                ax[i].text(.95, .75, textstr, transform=ax[i].transAxes, fontsize=14,
-                            verticalalignment='center', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='right')
-                
-
-                ax[i].set_yscale('log')
-
-
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
+        renderers[key] = (self._render_eccda, self.graph_list[-1], title, None)
             
         
 
@@ -1430,53 +1819,7 @@ class Analyzer:
                                                         "to the office at "+row["address"]+"."
                                     })
             
-            if graph == "_all" or graph == key:
-                # only calculate for the first office, the current office
-                #office = offices.iloc[0].to_frame().T
-                office = row.to_frame().T
-                values = ['m_morning_duration_in_traffic','m_evening_duration_in_traffic',
-                        't_morning_duration_in_traffic','t_evening_duration_in_traffic',
-                        'w_morning_duration_in_traffic','w_evening_duration_in_traffic',
-                        'h_morning_duration_in_traffic','h_evening_duration_in_traffic',
-                        'f_morning_duration_in_traffic','f_evening_duration_in_traffic']
-                cumulative_markers = {50: {'color': 'purple', 'marker': 'x', 'label': '50%', 'linestyle': '--', 'linewidth': 1},
-                                    75: {'color': 'blue', 'marker': 'x', 'label': '75%', 'linestyle': '--', 'linewidth': 1},}
-                # calculate teh bins based on the max value of the data
-                binmax = 0
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-                # get max value of val_set
-                # val_set is a DataFrame containing the extracted values for each employee location that matches the given office location. The DataFrame includes 'latitude' and 'longitude' of the employee locations and the specified `values`.
-                for each in values:
-                    if max(val_set[each]) > binmax:
-                        binmax = max(val_set[each])            
-                step = 5
-                # round the binmax up to the nearest step
-                bins = range(0, int(binmax + step - (binmax % step)), step)
-                plt, ax = self.graphing.get_histogram(emp, office, commute_data, values, suptitle=str(row['address'])+" Commute Analysis", x_label='Minutes in Traffic', y_label='# Employees',  
-                            commute_radius=self.project.commute_range_cut_off, bins=bins, rows=5, cols=2, column_titles=['Morning Commute','Evening Commute'], cumulative_line=True,
-                            cumulative_color='black', cumulative_linestyle='--', cumulative_linewidth=1, cumulative_markers=cumulative_markers, font_mod=1.5)
-                
-                plt.legend(loc='center right')
-                for each in plt.gcf().get_axes():
-                    # Add monday through Friday labels on first column only
-                    if each.get_subplotspec().colspan.start == 0:
-                        # first row is monday, second is tuesday, etc
-                        row = each.get_subplotspec().rowspan.start
-                        if row == 0:
-                            each.text(0.02, 0.85, 'Monday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                        elif row == 1:
-                            each.text(0.02, 0.85, 'Tuesday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                        elif row == 2:
-                            each.text(0.02, 0.85, 'Wednesday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                        elif row == 3:
-                            each.text(0.02, 0.85, 'Thursday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                        elif row == 4:
-                            each.text(0.02, 0.85, 'Friday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                            
-                plt.tight_layout(pad=1.0)
-                plt.savefig(plots_dir+"/"+key+".png")
-                plt.close()
+            renderers[key] = (self._render_wcda, self.graph_list[-1], title, row)
 
 
         ################################################################################
@@ -1499,63 +1842,7 @@ class Analyzer:
                                                         "to the office at "+row["address"]+"."
                                     })
             
-            if graph == "_all" or graph == key:
-                # only calculate for the first office, the current office
-                #office = offices.iloc[0].to_frame().T
-                office = row.to_frame().T
-                values = ['m_morning_duration_in_traffic','m_evening_duration_in_traffic',
-                        't_morning_duration_in_traffic','t_evening_duration_in_traffic',
-                        'w_morning_duration_in_traffic','w_evening_duration_in_traffic',
-                        'h_morning_duration_in_traffic','h_evening_duration_in_traffic',
-                        'f_morning_duration_in_traffic','f_evening_duration_in_traffic']
-                cumulative_markers = {50: {'color': 'purple', 'marker': 'x', 'label': 'Median (min)', 'linestyle': '--', 'linewidth': 1}}
-                
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-                val_set_free = self.graphing.get_commute_values(emp_within, office, commute_data, "duration")
-                # Normalize the values in val_set by dividing by the corresponding values in val_set_free, and multiplying by 100
-                for each in values:
-                    val_set[each] = val_set[each] / val_set_free['duration'] * 100
-                
-                # calculate teh bins based on the max value of the data
-                binmax = 0
-                binmin = 100
-                for each in values:
-                    if max(val_set[each]) > binmax:
-                        binmax = max(val_set[each])
-                    if min(val_set[each]) < binmin:
-                        binmin = min(val_set[each])            
-                step = 5
-                # round the binmax up to the nearest step, and binmin down to the nearest step
-                bins = range(int(binmin - (binmin % step)), int(binmax + step - (binmax % step)), step)
-                
-                plt, ax = self.graphing.get_histogram(emp, office, commute_data, values, suptitle="Normalized 'In Traffic' Commute Analysis, \n"+str(row['address']), 
-                                                      x_label='Normalized (In-Traffic / Traffic-Free) \n Commute Duration (%)', y_label='# Employees',  
-                            commute_radius=self.project.commute_range_cut_off, bins=bins, rows=5, cols=2, column_titles=['Morning Commute','Evening Commute'], cumulative_line=True,
-                            cumulative_color='black', cumulative_linestyle='--', cumulative_linewidth=1, cumulative_markers=cumulative_markers, 
-                            override_values=val_set, font_mod=1.5)
-                
-                
-                plt.legend(loc='center right')
-                for each in plt.gcf().get_axes():
-                    # Add monday through Friday labels on first column only
-                    if each.get_subplotspec().colspan.start == 0:
-                        # first row is monday, second is tuesday, etc
-                        row = each.get_subplotspec().rowspan.start
-                        if row == 0:
-                            each.text(0.02, 0.85, 'Monday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                        elif row == 1:
-                            each.text(0.02, 0.85, 'Tuesday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                        elif row == 2:
-                            each.text(0.02, 0.85, 'Wednesday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                        elif row == 3:
-                            each.text(0.02, 0.85, 'Thursday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                        elif row == 4:
-                            each.text(0.02, 0.85, 'Friday', fontsize=12, transform=each.transAxes, ha='left', va='top')
-                            
-                plt.tight_layout(pad=1.0)
-                plt.savefig(plots_dir+"/"+key+".png")
-                plt.close()
+            renderers[key] = (self._render_nwcda, self.graph_list[-1], title, row)
 
 
 
@@ -1573,42 +1860,7 @@ class Analyzer:
                                                     "and therefore present minimal risk of skewing the analysis when an average across days/employees is taken."
                                 })
         
-        if graph == "_all" or graph == key:
-            office = offices.iloc[0].to_frame().T
-            values = ['m_morning_duration_in_traffic','m_evening_duration_in_traffic',
-                    't_morning_duration_in_traffic','t_evening_duration_in_traffic',
-                    'w_morning_duration_in_traffic','w_evening_duration_in_traffic',
-                    'h_morning_duration_in_traffic','h_evening_duration_in_traffic',
-                    'f_morning_duration_in_traffic','f_evening_duration_in_traffic']
-            data_labels = ['Monday Morning','Monday Evening',
-                    'Tuesday Morning','Tuesday Evening',
-                    'Wednesday Morning','Wednesday Evening',
-                    'Thursday Morning','Thursday Evening',
-                    'Friday Morning','Friday Evening']
-            emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-            val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-            val_set_free = self.graphing.get_commute_values(emp_within, office, commute_data, "duration")
-            val_set_miles = self.graphing.get_commute_values(emp_within, office, commute_data, "miles")
-            # Normalize the values in val_set by dividing by the corresponding values in val_set_free, and multiplying by 100
-            for each in values:
-                val_set[each] = val_set[each] / val_set_free['duration'] * 100
-
-            plt, ax = self.graphing.get_scatterplot(emp, office, commute_data, "miles", "duration", title=title, x_label='Normalized (In-Traffic / Traffic-Free) \n Commute Duration (%)', 
-                                                    y_label='Commute Distance miles',
-                                                    cutoff_radius=self.project.commute_range_cut_off, commute_radius=self.project.commute_range_cut_off, figsize=(15, 15), manual_plot=True, font_mod=1.5)
-            # manually add scatter plots for each day
-            for i in range(len(values)):
-                ax.scatter(val_set[values[i]], val_set_miles['miles'],  alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, 
-                           label=data_labels[i], color=colors(i))
-                
-                ax.tick_params(axis='both', which='major', labelsize=16)
-              
-                # add a legend to show the office options
-                ax.legend(loc='upper right', fontsize=16)
-
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
+        renderers[key] = (self._render_ncda, self.graph_list[-1], title, None)
 
 
         ############################################################################################################
@@ -1624,36 +1876,7 @@ class Analyzer:
                                                     "The objective is to understand the geography driving any strong departures from average or standard deviation."
                                 })
         
-        if graph == "_all" or graph == key:
-            office = offices.iloc[0].to_frame().T
-            values = ['m_morning_duration_in_traffic','m_evening_duration_in_traffic',
-                    't_morning_duration_in_traffic','t_evening_duration_in_traffic',
-                    'w_morning_duration_in_traffic','w_evening_duration_in_traffic',
-                    'h_morning_duration_in_traffic','h_evening_duration_in_traffic',
-                    'f_morning_duration_in_traffic','f_evening_duration_in_traffic']
-            data_labels = ['Monday Morning','Monday Evening',
-                    'Tuesday Morning','Tuesday Evening',
-                    'Wednesday Morning','Wednesday Evening',
-                    'Thursday Morning','Thursday Evening',
-                    'Friday Morning','Friday Evening']
-            
-            emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-            val_set = self.graphing.get_commute_values(emp_within, office, commute_data, commute_data.columns.to_list())
-            # restore origin_lat and origin_long to the val_set
-            val_set['origin_lat'] = val_set['latitude']
-            val_set['origin_long'] = val_set['longitude']
-            val_set_free = self.graphing.get_commute_values(emp_within, office, commute_data, "duration")
-            # Normalize the values in val_set by dividing by the corresponding values in val_set_free, and multiplying by 100
-            for each in values:
-                val_set[each] = val_set[each] / val_set_free['duration'] * 100
-            
-            plt, ax = self.graphing.get_heatmap(emp_within, office, val_set, values[3], title=title, 
-                                                value_label="Normalized Commute in Traffic (% vs. Free)", cutoff_distance=self.project.commute_range_cut_off, commute_radius=self.project.commute_range_cut_off,
-                                                cmap='jet', alpha=0.3, levels=10, font_mod=1.5)
-
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
+        renderers[key] = (self._render_ncdahm, self.graph_list[-1], title, None)
             
         ################################################################################
         ### GRAPH SET: Local Analysis for Office X
@@ -1673,58 +1896,8 @@ class Analyzer:
                                     "office location at " + row["address"] + "."
                                     })
             
-            if graph == "_all" or graph == key:
-                office = row.to_frame().T
-                values = ['m_morning_duration_in_traffic','m_evening_duration_in_traffic',
-                        't_morning_duration_in_traffic','t_evening_duration_in_traffic',
-                        'w_morning_duration_in_traffic','w_evening_duration_in_traffic',
-                        'h_morning_duration_in_traffic','h_evening_duration_in_traffic',
-                        'f_morning_duration_in_traffic','f_evening_duration_in_traffic']
-
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-                val_set_free = self.graphing.get_commute_values(emp_within, office, commute_data, "duration")
-                val_set_miles = self.graphing.get_commute_values(emp_within, office, commute_data, "miles")
-                
-                mean = val_set.loc[:,values].mean(axis=1)
-                std = val_set.loc[:,values].std(axis=1)
-                max_val = val_set.loc[:,values].max(axis=1)
-                min_val = val_set.loc[:,values].min(axis=1)
-                data_labels = ['Mean','Standard Deviation','Max','Min']
-                x = [mean, std, max_val, min_val]
-                # Normalize the values in val_set by dividing by the corresponding values in val_set_free, and multiplying by 100
-                #for each in values:
-                #   val_set[each] = val_set[each] / val_set_free['duration'] * 100
-
-                plt, ax = self.graphing.get_scatterplot(emp, office, commute_data, "miles", "duration", title=title, x_label='Duration (min)', 
-                                                        y_label='Commute Distance (miles)',
-                                                        cutoff_radius=self.project.commute_range_cut_off, commute_radius=self.project.commute_range_cut_off, figsize=(15, 15), manual_plot=True, font_mod=1.5)
-                
-                # manually add scatter plots for each day
-                #for i in range(len(data_labels)):
-                i=1
-                ax.scatter(x[i], val_set_miles['miles'],  alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2,
-                            label=data_labels[i])
-                for i in range(len(val_set)):
-                    # add end bars to the lines
-                    ax.plot([min_val.iloc[i], max_val.iloc[i]], [val_set_miles['miles'].iloc[i], val_set_miles['miles'].iloc[i]], 'k-', marker='|', lw=1)   
-
-                ax.tick_params(axis='both', which='major', labelsize=16)
-                
-                # add a legend to show the office options
-                # add a legend entry for the label='Min/Max Spread'
-                handles, labels = ax.get_legend_handles_labels()
-                new_handle = Line2D([], [], color='black', label='Min/Max Spread', linestyle='-', linewidth=1, marker='|')
-                new_label = 'In-Traffic Min/Max Spread for Week (miles)'
-                handles.append(new_handle)
-                labels.append(new_label)
-            
-                ax.legend(handles=handles, labels=labels, loc='lower right', fontsize=16)
-                
-                plt.tight_layout(pad=1.0)
-                plt.savefig(plots_dir+"/"+key+".png")
-                plt.close()
-            
+            renderers[key] = (_render_ncsda, title, offices.loc[[index]])
+
 
         ################################################################################
         ### GRAPH SET: Local Analysis for Office X
@@ -1745,106 +1918,8 @@ class Analyzer:
                                     str(self.project.commute_days_per_week) + " days per week."
                                     })
             
-            if graph == "_all" or graph == key:
-                office = row.to_frame().T
-
-                # get the needed commute values
-                values = ['m_morning_duration_in_traffic','m_evening_duration_in_traffic',
-                        't_morning_duration_in_traffic','t_evening_duration_in_traffic',
-                        'w_morning_duration_in_traffic','w_evening_duration_in_traffic',
-                        'h_morning_duration_in_traffic','h_evening_duration_in_traffic',
-                        'f_morning_duration_in_traffic','f_evening_duration_in_traffic']
-                
-                mornings = ['m_morning_duration_in_traffic','t_morning_duration_in_traffic','w_morning_duration_in_traffic','h_morning_duration_in_traffic','f_morning_duration_in_traffic']
-                evenings = ['m_evening_duration_in_traffic','t_evening_duration_in_traffic','w_evening_duration_in_traffic','h_evening_duration_in_traffic','f_evening_duration_in_traffic']
-                cdpw = self.project.commute_days_per_week
-
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-                
-                
+            renderers[key] = (_render_tbcca, row["address"], offices.loc[[index]])
 
-                # Calculate and insert the average morning and evening commute times directly into val_set
-                val_set['Morning Average'] = val_set.loc[:, mornings].mean(axis=1)
-                val_set['Evening Average'] = val_set.loc[:, evenings].mean(axis=1)
-
-                # Calculate and insert the top 'cdpw' maximum morning and evening commute times
-                # Note: Adjust the code below to calculate the averages of the top 'cdpw' as new columns directly
-                val_set['Average Top CDPW Morning'] = val_set[mornings].apply(lambda row: row.nlargest(cdpw).mean(), axis=1)
-                val_set['Average Top CDPW Evening'] = val_set[evenings].apply(lambda row: row.nlargest(cdpw).mean(), axis=1)
-
-                # Calculate a per-minute cost based on "median_salary" and "hours_per_year"
-                per_minute_cost = self.project.median_salary / (self.project.hours_per_year * 60)
-
-                # Calculate and insert the average cost for the week directly into val_set
-                val_set['Morning Average Cost'] = val_set['Morning Average'] * per_minute_cost
-                val_set['Evening Average Cost'] = val_set['Evening Average'] * per_minute_cost
-
-                # Calculate and insert the high/conservative cost for the week directly into val_set
-                val_set['Morning High Cost'] = val_set['Average Top CDPW Morning'] * per_minute_cost
-                val_set['Evening High Cost'] = val_set['Average Top CDPW Evening'] * per_minute_cost
-
-                # create bins based on the max value of the data
-                binmax = 0
-                for each in ['Morning Average Cost','Evening Average Cost','Morning High Cost','Evening High Cost']:
-                    if max(val_set[each]) > binmax:
-                        binmax = max(val_set[each])
-                step = 5
-                # round the binmax up to the nearest step
-                bins = range(0, int(binmax + step - (binmax % step)), step)
-                
-                font_mod = 1.5
-                # create histograms for the morning and evening average costs
-                plt, ax = self.graphing.get_histogram(emp, office, commute_data, ['m_morning_duration_in_traffic','m_evening_duration_in_traffic'], 
-                                                      suptitle="Average and Maximum Time-in-Traffic Costs for \n"+str(row['address']), 
-                                                      cutoff_radius=self.project.commute_range_cut_off,
-                                      x_label=str('\$ (USD) based on median salary (converted to per minute)'), y_label='# Employees',
-                                      bins=bins, rows=2, cols=2, column_titles=["Average","High/Conservative"], 
-                                      cumulative_line=False, font_mod=font_mod, manual_plot=True, sharey=True, sharex=True)
-                plot_vals = [['Morning Average Cost',"Morning High Cost"],["Evening Average Cost","Evening High Cost"]]
-                # manually add histograms for each office option
-                for r in range(2):
-                    for c in range(2):
-                        ax[r,c].hist(val_set[plot_vals[r][c]], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, align='mid', 
-                                rwidth=0.8, label=plot_vals, color=colors(r+1))
-                        ax[r,c].tick_params(axis='both', which='major', labelsize=16)
-
-                        # add a text box in the upper right corner with the stats
-                        t = {'me' : 'Median: |${:,.2f}'.format(np.median(val_set[plot_vals[r][c]])),
-                            'av' : 'Average: |${:,.2f}'.format(np.mean(val_set[plot_vals[r][c]])),
-                            'mi' : 'Min: |${:,.2f}'.format(min(val_set[plot_vals[r][c]])),
-                            'ma' : 'Max: |${:,.2f}'.format(max(val_set[plot_vals[r][c]])),
-                            'to' : 'Total: |${:,.2f}'.format(sum(val_set[plot_vals[r][c]]))
-                            }
-                        # get the longest string value
-                        max_len = max(len(t['me']),len(t['av']),len(t['to']),len(t['mi']),len(t['ma']))
-                        # calculate additional space
-                        for k in t:
-                            t[k] = t[k].replace("|"," "*(max_len-len(t[k])))
-                        # add spaces to make all the same length, replacing |
-                        textstr = "Commute Time Cost: "
-                        for k in t:
-                            textstr += "\n" + t[k]
-                        # these are matplotlib.patch.Patch properties
-                        props = dict(boxstyle='round', facecolor='wheat', alpha=0.2)
-                        # place a text box in upper right in axes coords,
-                        ax[r,c].text(.95, .75, textstr, transform=ax[r,c].transAxes, fontsize=14,
-                                    verticalalignment='center', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='right')
-                        
-
-                        # for the first column, add morning/evening text box the top left of the plot
-                        if r==0 and c == 0:
-                            ax[r,c].text(0.05, 0.85, 'Morning', fontsize=14*font_mod, transform=ax[r,c].transAxes, ha='left', va='top')
-                        if r==1 and c == 0:
-                            ax[r,c].text(0.05, 0.85, 'Evening', fontsize=14*font_mod, transform=ax[r,c].transAxes, ha='left', va='top')
-                            # set a y axis label for the first column
-                            ax[r,c].set_ylabel('# Employees', fontsize=14*font_mod)
-                        if r==1:
-                            ax[r,c].set_xlabel('Employee Time Cost ($ USD)', fontsize=14*font_mod)
-
-                plt.tight_layout(pad=1.0)
-                plt.savefig(plots_dir+"/"+key+".png")
-                plt.close()  
 
 
         ############################################################################################################
@@ -1862,122 +1937,7 @@ class Analyzer:
                                 "average commute times, while the high/conservative cost is based upon the highest morning maximum and evening values for " + \
                                 str(self.project.commute_days_per_week) + " days per week."
                                 })
-        if graph == "_all" or graph == key:
-            employee_costs_to_office = {}
-
-            for index, row in offices.iterrows():    
-                office = row.to_frame().T
-            
-                # get the needed commute values
-                values = commute_data.columns.to_list()
-                
-                mornings = ['m_morning_duration_in_traffic','t_morning_duration_in_traffic','w_morning_duration_in_traffic','h_morning_duration_in_traffic','f_morning_duration_in_traffic']
-                evenings = ['m_evening_duration_in_traffic','t_evening_duration_in_traffic','w_evening_duration_in_traffic','h_evening_duration_in_traffic','f_evening_duration_in_traffic']
-                
-                cdpw = self.project.commute_days_per_week
-
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-                
-                
-
-                # Calculate and insert the average morning and evening commute times directly into val_set
-                val_set['Morning Average'] = val_set.loc[:, mornings].mean(axis=1)
-                val_set['Evening Average'] = val_set.loc[:, evenings].mean(axis=1)
-
-                # Calculate and insert the top 'cdpw' maximum morning and evening commute times
-                # Note: Adjust the code below to calculate the averages of the top 'cdpw' as new columns directly
-                val_set['Average Top CDPW Morning'] = val_set[mornings].apply(lambda row: row.nlargest(cdpw).mean(), axis=1)
-                val_set['Average Top CDPW Evening'] = val_set[evenings].apply(lambda row: row.nlargest(cdpw).mean(), axis=1)
-
-                # Calculate a per-minute cost based on "median_salary" and "hours_per_year"
-                per_minute_cost = self.project.median_salary / (self.project.hours_per_year * 60)
-
-                # Calculate and insert the average cost for the week directly into val_set
-                val_set['Morning Average Cost'] = val_set['Morning Average'] * per_minute_cost
-                val_set['Evening Average Cost'] = val_set['Evening Average'] * per_minute_cost
-
-                # Calculate and insert the high/conservative cost for the week directly into val_set
-                val_set['Morning High Cost'] = val_set['Average Top CDPW Morning'] * per_minute_cost
-                val_set['Evening High Cost'] = val_set['Average Top CDPW Evening'] * per_minute_cost
-
-                # Calculate a Total Average Time and Total High Time cost
-                val_set['Total Average Time Cost'] = val_set['Morning Average Cost'] + val_set['Evening Average Cost']
-                val_set['Total High Time Cost'] = val_set['Morning High Cost'] + val_set['Evening High Cost']
-
-                # Calculate a Total Average Cost and Total High Cost
-                val_set['Total Average Cost'] = val_set['Total Average Time Cost'] + val_set['commute_cost']
-                val_set['Total High Cost'] = val_set['Total High Time Cost'] + val_set['commute_cost']
-                
-                # add the current val_set to the employee_costs_to_office dictionary
-                employee_costs_to_office[row['address']] = val_set
-
-            dvalues = ['Total Average Cost','Total High Cost']
-            bins = []
-
-            # now iterate through again to get bins
-            for index, row in offices.iterrows():
-                # create bins based on the max value of the Total Average Cost and Total High Cost data for each office, get the max value for bins
-                binmax = 0
-                for each in dvalues:
-                    if max(employee_costs_to_office[row['address']][each]) > binmax:
-                        binmax = max(employee_costs_to_office[row['address']][each])
-                step = 5
-
-            # round the binmax up to the nearest step
-            bins = range(0, int(binmax + step - (binmax % step)), step)
-            
-            font_mod = 1.5
-            
-            # create histograms for the morning and evening average costs
-            plt, ax = self.graphing.get_histogram(emp, office, commute_data, dvalues, 
-                                                    suptitle="Total Employee Commute Costs per Day",cutoff_radius=self.project.commute_range_cut_off,
-                                    x_label=str('\$ (USD)'), y_label='# Employees', bins=bins, rows=len(employee_costs_to_office.keys()), cols=2, 
-                                    column_titles=["Average","High/Conservative"], cumulative_line=False, font_mod=font_mod, manual_plot=True, 
-                                    sharey=True, sharex=True, override_values=employee_costs_to_office)
-            
-            # manually add histograms for each office option
-            keys = list(employee_costs_to_office.keys())
-            for r in range(len(keys)):
-                for c in range(len(dvalues)):
-                    ax[r,c].hist(employee_costs_to_office[keys[r]][dvalues[c]], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, 
-                                 zorder=2, align='mid', rwidth=0.8, label=dvalues, color=colors(r+1))
-                    ax[r,c].tick_params(axis='both', which='major', labelsize=16)
-
-                    # add a text box in the upper right corner with the stats
-                    t = {'me' : 'Median: |${:,.2f}'.format(np.median(employee_costs_to_office[keys[r]][dvalues[c]])),
-                        'av' : 'Average: |${:,.2f}'.format(np.mean(employee_costs_to_office[keys[r]][dvalues[c]])),
-                        'mi' : 'Min: |${:,.2f}'.format(min(employee_costs_to_office[keys[r]][dvalues[c]])),
-                        'ma' : 'Max: |${:,.2f}'.format(max(employee_costs_to_office[keys[r]][dvalues[c]])),
-                        'to' : 'Total: |${:,.2f}'.format(sum(employee_costs_to_office[keys[r]][dvalues[c]])),
-                        'co' : 'Count: |{}'.format(len(employee_costs_to_office[keys[r]][dvalues[c]]))
-                        }
-                    # get the longest string value
-                    max_len = max(len(t['me']),len(t['av']),len(t['to']),len(t['mi']),len(t['ma']),len(t['co']))
-                    # calculate additional space
-                    for k in t:
-                        t[k] = t[k].replace("|"," "*(max_len-len(t[k])))
-                    # add spaces to make all the same length, replacing |
-                    textstr = "Employee Commute \n Cost per Day: "
-                    for k in t:
-                        textstr += "\n" + t[k]
-                    # these are matplotlib.patch.Patch properties
-                    props = dict(boxstyle='round', facecolor='wheat', alpha=0.2)
-                    # place a text box in upper right in axes coords,
-                    ax[r,c].text(.95, .7, textstr, transform=ax[r,c].transAxes, fontsize=14,
-                                verticalalignment='center', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='right')
-                    
-                    # add the address to the top left of the plot
-                    if c==0:
-                        ax[r,c].text(0.02, 0.98, keys[r], fontsize=10*font_mod, transform=ax[r,c].transAxes, ha='left', va='top')
-
-                    # for the first column, add morning/evening text box the top left of the plot
-                    if r==len(employee_costs_to_office.keys())-1:
-                        ax[r,c].set_xlabel('Employee Total Cost ($ USD / Day)', fontsize=14*font_mod)                        
-             
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close() 
+        renderers[key] = (self._render_tcca, self.graph_list[-1], title, None)
 
         ################################################################################ 
         # GRAPH: 
@@ -1994,94 +1954,7 @@ class Analyzer:
                                                     "average and conservative costs due to cash equivalent for time."
                                 })
         
-        if graph == "_all" or graph == key:
-            # gather the data for the analysis
-            base_costs, cost_values, average_diffs, conservative_diffs, withins, employee_costs_to_office, current_office, other_offices = \
-                self.get_attrition_analysis(emp, offices, commute_data)
-
-
-            # now we have a list of dataframes with the differentials, we eliminate all rows with 0 cost differential to prevent skewing the histogram
-            # calculate the bin list based upon a the min (negative) and max (positive) values of the data     
-            binmin = 0
-            binmax = 0
-            diffs = [average_diffs, conservative_diffs]
-            for diff in diffs:
-                for each in diff:
-                    if min(each) < binmin:
-                        binmin = min(each)
-                    if max(each) > binmax:
-                        binmax = max(each)
-            step = 10 
-            # round the binmin down to the nearest step, max up to the nearest step
-            bins = range(int(binmin - (binmin % step)), int(binmax + step - (binmax % step)), step)
-            dvalues = ['Total Average Cost','Total High Cost']
-            
-            plt, ax = self.graphing.get_histogram(emp, other_offices, cost_values, values=dvalues, suptitle="Total Employee Commute Cost Differential Analysis", cutoff_radius=self.project.commute_range_cut_off,
-                                      x_label='\$ (USD) based on time and mileage', y_label='# Employees (log scale)',
-                                      bins=bins, rows=len(other_offices), cols=2, column_titles=dvalues, 
-                                      cumulative_line=False, font_mod=1.5, manual_plot=True,override_values=cost_values)
-            
-            # calculate the $ value for turnover due to cost
-            median_salary = self.project.median_salary
-            threshold = self.project.turnover_threshold_due_to_cost*median_salary
-            daily_threshold = threshold/(self.project.commute_days_per_week*self.project.commute_weeks_per_year)
-                   
-            # manually add histograms for each office option
-            for r in range(len(other_offices)):
-                for c in range(2):
-                    ax[r,c].hist(average_diffs[r], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, align='mid', 
-                            rwidth=0.8, label=other_offices['address'].values[r], color=colors(r+2), log=True)
-                    ax[r,c].tick_params(axis='both', which='major', labelsize=16)
-                    if c == 0:
-                        ax[r,c].set_ylabel('# Employees (log scale)', fontsize=16)
-                        # put office address top left of the plot
-                        ax[r,c].text(0.03, 0.99, other_offices['address'].values[r], fontsize=16, transform=ax[r,c].transAxes, ha='left', va='top')
-                    
-                    if r == len(other_offices)-1:
-                        ax[r,c].set_xlabel('Employee Total Cost Differential ($ USD)', fontsize=16)
-                    ax[r,c].tick_params(axis='both', which='major', labelsize=16)
-                    # draw a red box with alpha 0.1 over the plot from x=daily_threshold to x=binmax, and y=0 to y max
-                    ax[r,c].fill_between([daily_threshold,binmax], 0, 10**3, color='red', alpha=0.1)
-                    ax[r,c].fill_between([daily_threshold,binmax], 0, 10**3, color='red', alpha=0.1)
-                    
-                    above_threshold = 0
-                    cost_impact = 0
-                    # cycle through the average diffs and get a count of costs above the threshold
-                    if c == 0:
-                        for each in average_diffs[r]:
-                            if each > daily_threshold:
-                                above_threshold += 1                        
-                    else:
-                        for each in conservative_diffs[r]:
-                            if each > daily_threshold:
-                                above_threshold += 1
-
-                    # cost impact is the # above threshold * employee replacement cost * probability of turnover
-                    cost_impact = above_threshold * self.project.turnover_probability_time_cost * self.project.employee_replacement_cost
-                    # add a text box with the count
-                    t = {'dt' : 'Cost Threshold (\$/day): |${:,.2f}'.format(daily_threshold),
-                         'co' : '# > Threshold (#): |{}'.format(above_threshold),
-                         'ci' : 'Expected Cost (\$): |${:,.2f}'.format(cost_impact)                         
-                        }
-                    # get the longest string value
-                    max_len = max(len(t['co']),len(t['ci']),len(t['dt']))
-                    # calculate additional space
-                    for k in t:
-                        t[k] = t[k].replace("|"," "*(max_len-len(t[k])))
-                        t[k] = t[k].replace("# > Threshold (#): ","# > Threshold (#):"*(max_len-len(t[k])))
-                    # add spaces to make all the same length, replacing |
-                    textstr = ""#Employees above \n Threshold: "
-                    for k in t:
-                        textstr += "\n" + t[k]
-                    # these are matplotlib.patch.Patch properties
-                    props = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
-                    # place a text box in upper right in axes coords,
-                    ax[r,c].text(.03, .85, textstr, transform=ax[r,c].transAxes, fontsize=14,
-                                verticalalignment='center', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='left')
-            
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
+        renderers[key] = (self._render_teccda, self.graph_list[-1], title, None)
 
 
         ################################################################################
@@ -2101,111 +1974,7 @@ class Analyzer:
                                     str(row['address']) + " for each day of the week."
                                     })
             
-            if graph == "_all" or graph == key:
-                
-                office = row.to_frame().T
-                
-                # get the needed commute values
-                values = commute_data.columns.to_list()
-                # filter teh employees to only those within the cutoff distance
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-                # restore val_set columns latitutde and longitude to origin_lat and origin_long
-                val_set['origin_lat'] = val_set['latitude']
-                val_set['origin_long'] = val_set['longitude']
-
-                # for each employee, for each day's morning and evening commute, get the traffic regime
-                # add the traffic regime to the val_set dataframe
-                
-                # lambda to call get_traffic_regime(distance, duration_in_traffic) using distance and duration_in_traffic columns
-                val_set['m_morning_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['m_morning_duration_in_traffic']), axis=1)
-                val_set['m_evening_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['m_evening_duration_in_traffic']), axis=1)
-                val_set['t_morning_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['t_morning_duration_in_traffic']), axis=1)
-                val_set['t_evening_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['t_evening_duration_in_traffic']), axis=1)
-                val_set['w_morning_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['w_morning_duration_in_traffic']), axis=1)
-                val_set['w_evening_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['w_evening_duration_in_traffic']), axis=1)
-                val_set['h_morning_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['h_morning_duration_in_traffic']), axis=1)
-                val_set['h_evening_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['h_evening_duration_in_traffic']), axis=1)
-                val_set['f_morning_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['f_morning_duration_in_traffic']), axis=1)
-                val_set['f_evening_traffic_regime'] = val_set.apply(lambda row: self.get_traffic_regime(row['miles'], row['f_evening_duration_in_traffic']), axis=1)
-
-                # save val_set to file for debugging
-            
-                # get the counts of each traffic regime for each office
-                traffic_graph_keys = ['m_morning_traffic_regime',
-                                        't_morning_traffic_regime',
-                                        'w_morning_traffic_regime',
-                                        'h_morning_traffic_regime',
-                                        'f_morning_traffic_regime',
-                                        'm_evening_traffic_regime',
-                                        't_evening_traffic_regime',
-                                        'w_evening_traffic_regime',
-                                        'h_evening_traffic_regime',
-                                        'f_evening_traffic_regime']
-                
-                traffic_graphs_nice_names = {"m_morning_traffic_regime":"Monday Morning",
-                                             "t_morning_traffic_regime":"Tuesday Morning",
-                                             "w_morning_traffic_regime":"Wednesday Morning",
-                                             "h_morning_traffic_regime":"Thursday Morning",
-                                             "f_morning_traffic_regime":"Friday Morning",
-                                             "m_evening_traffic_regime":"Monday Evening",
-                                             "t_evening_traffic_regime":"Tuesday Evening",
-                                             "w_evening_traffic_regime":"Wednesday Evening",
-                                             "h_evening_traffic_regime":"Thursday Evening",
-                                             "f_evening_traffic_regime":"Friday Evening"}
-                
-                traffic_regimes = {1:"Congested",2:"Bounded",3:"Free Flow"}
-
-                # create a dictionary to hold the traffic regime counts for each day and morning/evening
-                traffic_regime_counts = {}
-                for k in traffic_graph_keys:
-                    traffic_regime_counts[k] = val_set[k].value_counts().to_dict()
-                    # sort the dictionary by key
-                    traffic_regime_counts[k] = dict(sorted(traffic_regime_counts[k].items()))
-
-                # traffic_regime_counts now holds: 
-                # {'m_morning_traffic_regime': {1: 1539, 2: 424}, 't_morning_traffic_regime': {1: 1863, 2: 100}, 'w_morning_traffic_regime': {1: 1874, 2: 89}, 'h_morning_traffic_regime': {1: 1824, 2: 139}, 'f_morning_traffic_regime': {1: 1348, 2: 615}, 'm_evening_traffic_regime': {1: 1711, 2: 252}, 't_evening_traffic_regime': {1: 1826, 2: 137}, 'w_evening_traffic_regime': {1: 1888, 2: 75}, 'h_evening_traffic_regime': {1: 1878, 2: 85}, 'f_evening_traffic_regime': {1: 1704, 2: 259}}
-                
-                # create a values variable holding a list of the traffic regime counts for each day and morning/evening
-                values = []
-                for k in traffic_graph_keys:
-                    values.append(list(traffic_regime_counts[k].values()))
-
-                # iterate through traffic regime counts and create a list of labels for each day and morning/evening for regimes where counts are present
-                labels = []
-                for k in traffic_graph_keys:
-                    label = []
-                    for k in traffic_regime_counts[k].keys():
-                        label.append(traffic_regimes[k])
-                    labels.append(label)
-                
-                # iterate through the labels and get the colors for each traffic regime colors(i+1) will return a color for each regime
-                colors_list = []
-                for i in range(len(labels)):
-                    color_list = []
-                    for j in range(len(labels[i])):
-                        color_list.append(colors(j+7))
-                    colors_list.append(color_list)
-                
-                # create a titles variable holding a list of the traffic graph nice names
-                titles = [traffic_graphs_nice_names[key] for key in traffic_graph_keys]
-                rows = 2
-                cols = 5
-                # create a composite pie chart, five wide, with rows for morning and evening.  Each pie chart will display three values, Congested, Bounded, Free Flow
-                plt, ax = self.graphing.get_piechart(values, titles=titles, suptitle=title, value_labels=labels, 
-                                                    figsize=(21,7), manual_plot=False, font_mod=1, rows=rows, cols=cols, startangle=70, colors=colors_list)
-                plt.tight_layout(pad=6, w_pad=8, h_pad=1)
-                plt.subplots_adjust(top=0.85)
-                # mauanlly adjust the font size of suptitle and plot titles
-                plt.suptitle(title, fontsize=25, fontweight='bold')
-                for i in range(rows):
-                    for j in range(cols):
-                        ax[i,j].title.set_fontsize(20)
-                        # set bold
-                        ax[i,j].title.set_fontweight('bold')
-                
-                plt.savefig(plots_dir+"/"+key+".png")
-                plt.close()
+            renderers[key] = (_render_tra, title, offices.loc[[index]])
                 
 
         ################################################################################
@@ -2224,65 +1993,7 @@ class Analyzer:
                                     "PLOT-DESCRIPTION": "This heat map displays the representative worst case emissions rates for each office option. "
                                     })
             
-            if graph == "_all" or graph == key:
-                office = row.to_frame().T
-                # get the needed commute values
-                values = commute_data.columns.to_list()
-                # filter teh employees to only those within the cutoff distance
-                emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-                val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-                # restore val_set columns latitutde and longitude to origin_lat and origin_long
-                val_set['origin_lat'] = val_set['latitude']
-                val_set['origin_long'] = val_set['longitude']
-
-                traffic_graph_keys = ['m_morning_emissions',
-                                        't_morning_emissions',
-                                        'w_morning_emissions',
-                                        'h_morning_emissions',
-                                        'f_morning_emissions',
-                                        'm_evening_emissions',
-                                        't_evening_emissions',
-                                        'w_evening_emissions',
-                                        'h_evening_emissions',
-                                        'f_evening_emissions']
-                
-                traffic_graphs_nice_names = {"m_morning_emissions":"Monday Morning",
-                                             "t_morning_emissions":"Tuesday Morning",
-                                             "w_morning_emissions":"Wednesday Morning",
-                                             "h_morning_emissions":"Thursday Morning",
-                                             "f_morning_emissions":"Friday Morning",
-                                             "m_evening_emissions":"Monday Evening",
-                                             "t_evening_emissions":"Tuesday Evening",
-                                             "w_evening_emissions":"Wednesday Evening",
-                                             "h_evening_emissions":"Thursday Evening",
-                                             "f_evening_emissions":"Friday Evening"}
-                
-                # get the sum total emissions for each day and morning/evening
-                emissions = []
-                for k in traffic_graph_keys:
-                    emissions.append(val_set[k].sum())
-
-                # create a dictionary to hold the emissions for each day and morning/evening
-                emissions_dict = {}
-                for i in range(len(traffic_graph_keys)):
-                    emissions_dict[traffic_graph_keys[i]] = emissions[i]
-                
-
-                plt, ax = self.graphing.get_heatmap(emp_within, office, val_set, "w_evening_emissions", title="Worst Case Emissions Rate (Wed. Evening)) \nfor "+str(row['address']), 
-                                                value_label="CO2 Emissions in Traffic (kg/commute)", cutoff_distance=self.project.commute_range_cut_off, 
-                                                commute_radius=self.project.commute_range_cut_off, alpha=0.4, levels=20, font_mod=1.5, 
-                                                convex_hull=True, plot_points=True, imagery="Google", cmap='gist_heat_r')
-                # add a text label to the bottom right of the plot with the total emissions for the plotted value
-                t = {'em' : 'Total Emissions / Commute: {:.2f} kg'.format(emissions_dict['w_evening_emissions'])}    
-                # add to plot
-                textstr = t['em']                              
-                # these are matplotlib.patch.Patch properties
-                props = dict(boxstyle='round', facecolor='white', alpha=1)
-                # place a text box in lower right in axes coords,
-                ax.text(.985, .015, textstr, transform=ax.transAxes, fontsize=14,
-                            verticalalignment='bottom', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='right')
-                plt.savefig(plots_dir+"/"+key+".png")
-                plt.close()
+            renderers[key] = (_render_wcerhma, row["address"], offices.loc[[index]])
                 
         #TODO : GRAPH THE EMISSIONS FOR EACH OFFICE
 
@@ -2299,85 +2010,775 @@ class Analyzer:
                                 "PLOT-DESCRIPTION": "This graph displays the differential cost associated with emissions based on the office options."
                                 })
         
-        if graph == "_all" or graph == key:
-            # gather the data for the analysis
-            base_costs, cost_values, average_diffs, conservative_diffs, withins, employee_costs_to_office, current_office, other_offices = \
-                self.get_emissions_analysis(emp, offices, commute_data)
-
-        
-            # now we have a list of dataframes with the differentials, we eliminate all rows with 0 cost differential to prevent skewing the histogram
-            # calculate the bin list based upon a the min (negative) and max (positive) values of the data     
-            binmin = 0
-            binmax = 0
-            diffs = [average_diffs, conservative_diffs]
-            for diff in diffs:
-                for each in diff:
-                    if min(each) < binmin:
-                        binmin = min(each)
-                    if max(each) > binmax:
-                        binmax = max(each)
-            step = 0.001
-            # round the binmin down to the nearest step, max up to the nearest step
-            bins = np.arange(binmin - (binmin % step), binmax + step - (binmax % step), step)
-
-            dvalues = ['Total Average Cost','Total High Cost']
-            
-            plt, ax = self.graphing.get_histogram(emp, other_offices, cost_values, values=dvalues, suptitle=title, cutoff_radius=self.project.commute_range_cut_off,
-                                      x_label='\$ (USD) per commute', y_label='# Employees (log scale)',
-                                      bins=bins, rows=len(other_offices), cols=2, column_titles=dvalues, 
-                                      cumulative_line=False, font_mod=1.5, manual_plot=True,override_values=cost_values)
-            
-                  
-            # manually add histograms for each office option
-            for r in range(len(other_offices)):
-                for c in range(2):
-                    ax[r,c].hist(average_diffs[r], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, align='mid', 
-                            rwidth=0.8, label=other_offices['address'].values[r], color=colors(r+2), log=True)
-                    ax[r,c].tick_params(axis='both', which='major', labelsize=16)
-                    if c == 0:
-                        ax[r,c].set_ylabel('# Employees (log scale)', fontsize=16)
-                        # put office address top left of the plot
-                        ax[r,c].text(0.03, 0.99, other_offices['address'].values[r], fontsize=16, transform=ax[r,c].transAxes, ha='left', va='top')
-                    
-                    if r == len(other_offices)-1:
-                        ax[r,c].set_xlabel('Cost of C02 Emissions (\$USD/commuting day)', fontsize=16)
-                    ax[r,c].tick_params(axis='both', which='major', labelsize=16)
-                    
-                    # cost impact is the summation of the cost of emissions for all employees
-                    cost_impact_avg = sum(average_diffs[r])
-                    cost_impact_con = sum(conservative_diffs[r])
-                    
-                    # add a text box with the count
-                    t = {'co' : 'Total Avg Emissions Cost Difference\n (\$/commuting day): ${:,.2f}'.format(cost_impact_avg),
-                            'ci' : 'Total Conservative Cost Difference\n (\$/commuting day): ${:,.2f}'.format(cost_impact_con)                         
-                            }
-                    
-                    textstr = t['co'] if c == 0 else t['ci']
-                    # these are matplotlib.patch.Patch properties
-                    props = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
-                    # place a text box in upper right in axes coords,
-                    ax[r,c].text(.03, .85, textstr, transform=ax[r,c].transAxes, fontsize=14,
-                                verticalalignment='center', bbox=props, fontdict={'family': 'monospace'}, horizontalalignment='left')
-                    
-            plt.tight_layout(pad=1.0)
-            plt.savefig(plots_dir+"/"+key+".png")
-            plt.close()
-
-
+        renderers[key] = (self._render_tecdca, self.graph_list[-1], title, None)
 
+        # render the requested graphs, a single graph is looked up directly rather than testing every key
+        if graph == "_all":
+            selected = list(renderers.items())
+        elif graph in renderers:
+            selected = [(graph, renderers[graph])]
+        else:
+            selected = []
+        # skip graphs whose .png was already rendered from the same inputs, the hash each graph was last rendered from
+        # is kept alongside the plots in graph_hashes.json, with its final graph list entry (some renderers fill in their
+        # description) which is restored for a skipped graph, an old bare hash without an entry is rendered again
+        entries = {entry["GRAPH"]: entry for entry in self.graph_list}
+        inputs_hash = self.get_graph_inputs_hash(emp, offices, commute_data)
+        hash_file = os.path.join(plots_dir, "graph_hashes.json")
+        graph_hashes = {}
+        if os.path.exists(hash_file):
+            with open(hash_file, "r", encoding="utf-8") as f:
+                graph_hashes = json.load(f)
+        if not force:
+            to_render = []
+            for key, renderer in selected:
+                rendered = graph_hashes.get(key)
+                if (isinstance(rendered, dict) and rendered.get("hash") == inputs_hash
+                        and os.path.exists(os.path.join(plots_dir, key+".png"))):
+                    entries[key].update(rendered["entry"])
+                else:
+                    to_render.append((key, renderer))
+            selected = to_render
+        # the map view figures kept open across renders are closed whether or not every render succeeds
+        try:
+            # the per-office renders are module level functions, collect them so they can be spread across worker processes
+            office_jobs = []
+            for key, (render, *args) in selected:
+                # tbcca, tra and wcerhma render from the shared per-office frames, workers can't fill the caches so
+                # build them here and hand the workers only what they plot
+                if render is _render_tbcca:
+                    office_jobs.append((render, (key, *args, self.get_cost_frame(args[-1], emp, commute_data))))
+                elif render is _render_tra:
+                    office_jobs.append((render, (key, args[0], self.get_traffic_regime_counts(args[1], emp, commute_data))))
+                elif render is _render_wcerhma:
+                    office_jobs.append((render, (key, *args, *self.get_office_commutes(args[-1], emp, commute_data))))
+                elif render in _RENDER_SHARED_ARGS:
+                    office_jobs.append((render, (key, *args)))
+                else:
+                    render(key, *args, emp=emp, offices=offices, commute_data=commute_data, plots_dir=plots_dir)
+            _render_office_graphs(office_jobs, {"emp": emp, "commute_data": commute_data, 
+                                                "commute_range_cut_off": self.project.commute_range_cut_off, "plots_dir": plots_dir})
+        finally:
+            # close the map view figures kept for reuse
+            self.graphing.release_figure()
+        # all renders succeeded, record the inputs they were rendered from and their final entries
+        graph_hashes.update({key: {"hash": inputs_hash, "entry": entries[key]} for key, _ in selected})
+        _save_json(graph_hashes, hash_file)
 
         # write the graphs to graphs.json in the project plots directory
         # convert self.graphs_list to json
-        with open(os.path.join(plots_dir, "graphs.json"), "w") as f:
-            json.dump(self.graph_list, f)
+        # written compactly and without escaping non-ASCII characters (e.g. in addresses), read back by the ui
+        _save_json(self.graph_list, os.path.join(plots_dir, "graphs.json"), ensure_ascii=False, separators=(',', ':'))
 
         # update the analysis phase
         self.update_analysis_phase()
         return self.graph_list
-    
 
+    def _render_gdal(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Geographical Distribution of Analyzed Locations graph, see generate_graphs().
+        """
+        plt, ax = self.graphing.get_map_view(emp, offices, title=title, font_mod=1.5,
+                                             commute_color=False, commute_data=commute_data, convex_hull=False, size_o=400, size_e=40)
+        _save_png(plt, plots_dir+"/gdal.png")
+        # the map view figure is left open for the next map view to reuse, see Graphing.configure_map_plot()
+
+    def _render_lafo(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Employee Distribution graph for the office in "row", see generate_graphs().
+        """
+        OfficeAddr = row["address"]
+        #just get the first office row
+        #offices = pd.DataFrame(offices.iloc[0],offices.columns).reset_index(drop=True)
+        office = offices.loc[[row.name]]
+        plt, ax = self.graphing.get_map_view(emp, office, title="Employee Distribution for \n"+OfficeAddr, 
+                                            cutoff_distance=self.project.commute_range_cut_off*2,
+                                            commute_radius=self.project.commute_range_cut_off, font_mod=1.5,
+                                            commute_color=True, commute_data=commute_data, convex_hull=True, legend_loc='lower right')
+        _save_png(plt, plots_dir+"/"+key+".png")
+        # the map view figure is left open for the next map view to reuse, see Graphing.configure_map_plot()
+
+        # get the employees within the cutoff distance by driving distance, then add the count to the plot description
+        emp_within = self.get_office_commutes(office, emp, commute_data)[0]
+        entry["PLOT-DESCRIPTION"] = entry["PLOT-DESCRIPTION"] + " There are " + str(len(emp_within)) + \
+                                                        " of the total " + str(len(emp)) + " employees within the cutoff distance, a total of " + \
+                                                        str(round(len(emp_within)/len(emp)*100,2)) + "% of the total employees."
+
+    def _render_lacg(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Local Analysis of Commute Geography graph, see generate_graphs().
+        """
+        plt, ax = self.graphing.get_map_view(emp, offices, title=title, 
+                                             cutoff_radius=self.project.commute_range_cut_off*2,
+                                             commute_radius=self.project.commute_range_cut_off, legend_loc='lower left', font_mod=1.5,
+                                             commute_color=True, commute_data=commute_data, convex_hull=True,size_o=500)
+        _save_png(plt, plots_dir+"/"+key+".png")
+        # the map view figure is left open for the next map view to reuse, see Graphing.configure_map_plot()
+
+    def _render_lacg2(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Employees Impacted by Remote Work Policy & Relocation graph, see generate_graphs().
+        """
+        plt, ax = self.graphing.get_map_view(emp, offices, title=title, font_mod=1.5,
+                                             cutoff_radius=self.project.commute_range_cut_off*1.2,
+                                             commute_radius=self.project.commute_range_cut_off, 
+                                             commute_color=False, commute_data=commute_data, convex_hull=False,size_o=500, manual_plot=True)
+
+        emp_within, emp_outside, emp_overlap, emp_within_all, emp_outside_all = None, None, None, None, None
+
+        # both sets are selected from one pass over the commute data
+        within, outside = self.graphing.filter_drive_distance_mask(emp,offices,self.project.commute_range_cut_off, commute_data)
+        emp_within = _masked_points(emp, within)
+        emp_outside = _masked_points(emp, outside)
+        if not emp_within.empty and not emp_outside.empty:                
+            emp_overlap = self.graphing.get_common_points(emp_within,emp_outside)
+        if not emp_within.empty and not emp_outside.empty:
+            emp_outside_all = self.graphing.get_unique_points(emp_outside,emp_overlap)
+        if not emp_within.empty and not emp_outside.empty:
+            emp_within_all = self.graphing.get_unique_points(emp_within,emp_overlap)
+        emp_within_list = []
+        hullvars = {"color":"red","linewidth":50,"alpha":0.07}
+        for i, row in offices.iterrows():
+            office = offices.loc[[i]]
+            emp_within_list.append(self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data, inside=True))
+            self.graphing.plot_convex_hull(ax, emp_within_list[i], **hullvars)
+
+        # plot the points
+        if emp_within_all is not None and not emp_within_all.empty:
+            self.graphing.plot_addresses(ax, emp_within_all, color='green', label="Unaffected by \nRelocation Decision")
+        #if emp_outside_all is not None and not emp_outside_all.empty:
+            #self.graphing.plot_addresses(ax, emp_outside_all,color='gray',label="Outside Commute \nRadius for Offices")
+        if emp_overlap is not None and not emp_overlap.empty:
+            self.graphing.plot_addresses(ax, emp_overlap, color='red',s=50, label="Impacted by \nRelocation Decision")
+        self.graphing.plot_offices(ax, offices, s=400, label="Potential Office Locations")
+        if emp_within_all is not None and not emp_within_all.empty:
+            self.graphing.plot_convex_hull(ax, emp_within_all, color='red')
+        if emp_overlap is not None and not emp_overlap.empty:
+            self.graphing.plot_convex_hull(ax, emp_overlap, color='gray')
+        self.graphing.add_scalebar(ax,font_mod=1.5)
+        # add legend
+        handles, labels = plt.gca().get_legend_handles_labels()
+        self.graphing.map_view_standard_legend(ax, handles, labels, fontsize=15)
+        plt.title(title, fontsize=25)
+        _save_png(plt, plots_dir+"/"+key+".png")
+        # the map view figure is left open for the next map view to reuse, see Graphing.configure_map_plot()
+
+
+        # udpate the plot description
+        entry["PLOT-DESCRIPTION"] = "This graph displays the " + str(0 if emp_overlap is None or emp_overlap.empty else len(emp_overlap)) + " employees that are impacted by the relocaiton.  " + \
+                            "Specifically, the red indicates employees that either rotate into, or out of the remote work policy by cutoff-distance. This is " + \
+                            str(0 if emp_overlap is None or emp_overlap.empty else round(len(emp_overlap)/len(emp)*100,2)) + "% of the total employees.  "
+
+    def _render_bcca(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Baseline Commute Cost Analysis graph, see generate_graphs().
+        """
+        # get the value to plot
+        value = ['commute_cost']
+        # baseline will be first office, assumed to be the current office, or "as is use case"
+        office = offices.iloc[[0]]
+        # employees to analyze are within the cutoff distance for this office
+        emp_within = self.get_office_commutes(office, emp, commute_data)[0]
+        # get commute cost values 
+        cost_values = self.graphing.get_commute_values(emp_within, office, commute_data, value)
+        # calculate the bin list based upon a the max value of the data
+        binmax = int(max(cost_values['commute_cost'])+1)
+        step = 1
+        # round the binmax up to the nearest step
+        bins = _bin_edges(binmax, step)
+        plt, ax = self.graphing.get_histogram(emp_within, office, commute_data, value, suptitle="",
+                                  x_label=str('\$ (USD) based on \$'+str(self.project.mileage_rate)+' per mile.'), y_label='# Employees',
+                                  bins=bins, rows=1, cols=1, column_titles=["Baseline Commute Cost Analysis for "+office["address"].values[0] ], cumulative_line=False, font_mod=1, figsize=(10,6))
+
+        # udpate the plot description
+        median_cost = round(np.median(cost_values['commute_cost']),2)
+        average_cost = round(np.mean(cost_values['commute_cost']),2)
+        commutes = 2*self.project.commute_days_per_week*self.project.commute_weeks_per_year
+        entry["PLOT-DESCRIPTION"] = "This graph displays the distribution of commute costs for employees within the " + \
+                                                "cutoff distance of the office at "+office["address"].values[0]+".  " + \
+                                                "The median cost per commute is $"+"{:.2f}".format(median_cost)+", and the average cost per commute is $"+"{:.2f}".format(average_cost)+", one way. " + \
+                                                "For 2 commutes per day, " + str(self.project.commute_days_per_week) + \
+                                                " days per week, and " + str(self.project.commute_weeks_per_year) + " weeks per year (" + str(commutes) + " commutes/yr), the " + \
+                                                "median and average annual cost per employee is $"+"{:.2f}".format(round(median_cost*commutes,2))+" and $"+"{:.2f}".format(round(average_cost*commutes,2))+" respectively not including tolls, etc. " + \
+                                                "Minimum and maximum annual costs within the designated commute range are: $" + "{:.2f}".format(round(min(cost_values['commute_cost']*commutes),2)) + " and $" + \
+                                                "{:.2f}".format(round(max(cost_values['commute_cost']*commutes),2)) + " respectively.  In total, the workforce within the cutoff distance " + \
+                                                "has a total annual commute cost of $"+"{:,.2f}".format(round(sum(cost_values['commute_cost'])*commutes,2))+". Values based on $"+str(self.project.mileage_rate)+" per mile."
+
+        # add a text box with the stats, using two decimal places and adding commas at the thousands
+        textstr = _stats_textstr("Annualized Costs: ", (median_cost*commutes, average_cost*commutes,
+                                                       round(min(cost_values['commute_cost']*commutes),2),
+                                                       round(max(cost_values['commute_cost']*commutes),2),
+                                                       round(sum(cost_values['commute_cost'])*commutes,2)))
+
+
+        ax.text(.95, .5, textstr, fontsize=10, transform=ax.transAxes,
+                    verticalalignment='center', bbox=_STATS_BBOX, fontdict=_MONO_FONT, horizontalalignment='right')
+
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close()
+
+    def _render_ccpo(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Commute Costs per Office graph, see generate_graphs().
+        """
+        # get the value to plot
+        value = []
+        # employees to analyze are within the cutoff distance for this office
+        # for this analysis, we need to iterate through options
+        emp_within = []
+        office_addrs = []
+        cost_values = []
+        median_costs = []
+        average_costs = []
+        total_costs = []
+        min_costs = []
+        max_costs = []
+        commutes = 2*self.project.commute_days_per_week*self.project.commute_weeks_per_year
+        for row in offices.itertuples():
+            office = offices.loc[[row.Index]]
+            emp_within.append(self.get_office_commutes(office, emp, commute_data)[0])
+            office_addrs.append(row.address)
+            value.append('commute_cost')
+            cost_values.append(self.graphing.get_commute_values(emp_within[-1], office, commute_data, value[-1]))
+            median_costs.append(round(np.median(cost_values[-1]['commute_cost'])*commutes,2))
+            average_costs.append(round(np.mean(cost_values[-1]['commute_cost']*commutes),2))
+            total_costs.append(round(sum(cost_values[-1]['commute_cost'])*commutes,2))
+            min_costs.append(round(min(cost_values[-1]['commute_cost']*commutes),2))
+            max_costs.append(round(max(cost_values[-1]['commute_cost']*commutes),2))
+
+
+        # calculate the bin list based upon a the max value of the data
+        #binmax = int(max(cost_values['commute_cost'])+1)
+        binmax = 0
+        for i in range(len(cost_values)):
+            if max(cost_values[i]['commute_cost']) > binmax:
+                binmax = max(cost_values[i]['commute_cost'])
+        step = 1
+        # round the binmax up to the nearest step
+        bins = _bin_edges(binmax, step)
+        plt, ax = self.graphing.get_histogram(emp, offices, commute_data, value, suptitle="", cutoff_radius=self.project.commute_range_cut_off,
+                                  x_label=str('\$ (USD), one-way, based on \$'+str(self.project.mileage_rate)+' per mile.'), y_label='# Employees',
+                                  bins=bins, rows=len(office_addrs), cols=1, column_titles=["Commute Cost Analysis for Options"], 
+                                  cumulative_line=False, font_mod=1.5, manual_plot=True)
+
+        # manually add histograms for each office option
+        for i in range(len(emp_within)):
+            ax[i].hist(cost_values[i]['commute_cost'], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, align='mid', 
+                       rwidth=0.8, label=office_addrs[i], color=_colors(i))
+            ax[i].tick_params(axis='both', which='major', labelsize=16)
+
+            # add a legend to show the office options
+            ax[i].legend(loc='upper right', fontsize=16)
+
+            # add a text box with the stats, using two decimal places and adding commas at the thousands
+            textstr = _stats_textstr("Annualized Costs: ", (median_costs[i], average_costs[i], min_costs[i], max_costs[i], total_costs[i]))
+            # place a text box in upper right in axes coords, 
+            ax[i].text(.95, .5, textstr, transform=ax[i].transAxes, fontsize=14,
+                        verticalalignment='center', bbox=_STATS_BBOX, fontdict=_MONO_FONT, horizontalalignment='right')
 
 
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close()
+
+    def _render_eccda(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Employee Commute Cost Differential Analysis graph, see generate_graphs().
+        """
+        # helper function to set the cost of each employee in emp_within to the office in a base cost dataframe
+        def fill_costs(costs_df, officeaddr, emp_within):
+            # the office's commute rows are selected by address once, and the columns compared for every employee are 
+            # pulled out as arrays before the loop rather than looked up on the frames for each employee
+            office_commutes = commute_data[commute_data['office_address'] == officeaddr]
+            origin_lats = office_commutes['origin_lat'].to_numpy()
+            origin_longs = office_commutes['origin_long'].to_numpy()
+            commute_costs = office_commutes['commute_cost'].to_numpy()
+            lats = costs_df['latitude'].to_numpy()
+            longs = costs_df['longitude'].to_numpy()
+            costs = costs_df['cost'].to_numpy(dtype=np.float64, copy=True)
+            for lat, long in zip(emp_within['latitude'].to_numpy(), emp_within['longitude'].to_numpy()):
+                # get the cost from the commute_data
+                cost = commute_costs[(origin_lats == lat) & (origin_longs == long)][0]
+                costs[(lats == lat) & (longs == long)] = cost
+            costs_df['cost'] = costs
+
+        # get the value to plot
+        value = []
+        # employees to analyze are within the cutoff distance for this office
+        # for this analysis, we need to iterate through options
+        current_office = offices.iloc[[0]]
+        other_offices = offices.drop(0)
+        cost_values = []
+        withins = []
+        commutes = 2*self.project.commute_days_per_week*self.project.commute_weeks_per_year
+
+        # for each employee, calculate the commute cost to the current office, place a new dataframe with lat, long, office, and cost
+        # if the employee is within the cutoff distance, if outside the cutoff distance, the cost is 0
+        # start by looping through ALL employees and adding a row with the current office, and cost = 0
+
+
+        current_office_addr = current_office['address'].values[0]
+        base_costs = _base_cost_df(emp, current_office_addr)
+        # now get emp_within for the current office, and update the relevant rows of base_costs with actual costs for those employees 
+        # using the commute_cost column in the commute_data dataframe where the employee lat long matches the commute_data lat long and office address
+
+        base_emp_within = self.graphing.filter_drive_distance(emp,current_office,self.project.commute_range_cut_off, commute_data=commute_data)
+
+        fill_costs(base_costs, current_office_addr, base_emp_within)
+        # now we have a dataframe with all employees, and the cost to the current office
+
+        # now iterate through the other offices, get a base cost dataframe, and then update the relevant rows with actual costs, place in cost_values
+        for row in other_offices.itertuples():
+            office = other_offices.loc[[row.Index]]
+            office_addr = row.address
+            tmp_costs = _base_cost_df(emp, office_addr)
+            emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
+            # we will use this later to get the differential for each employee, without the employees that aren't overlapping
+            withins.append(emp_within)
+            fill_costs(tmp_costs, office_addr, emp_within)
+            cost_values.append(tmp_costs)
+
+        # now we have a full list of costs for each employee to each office, we can get the differentials
+        # create a list to hold the differential dataframes
+        diffs = []
+        # for each cost dataframe, calculate the differential from the base_costs dataframe into a new dataframe
+        for i in range(len(cost_values)):
+            # get the differential
+            diffs.append(cost_values[i]['cost'] - base_costs['cost'])
+        # now we have a list of dataframes with the differentials, we eliminate all rows with 0 cost differential to prevent skewing the histogram
+        # calculate the bin list based upon a the min (negative) and max (positive) values of the data     
+        binmin = 0
+        binmax = 0
+        for i in range(len(diffs)):
+            if min(diffs[i]) < binmin:
+                binmin = min(diffs[i])
+            if max(diffs[i]) > binmax:
+                binmax = max(diffs[i])
+        step = 1
+        # round the binmin down to the nearest step, max up to the nearest step
+        bins = _bin_edges(binmax, step, binmin=binmin)
+
+        plt, ax = self.graphing.get_histogram(emp, other_offices, commute_data, value, suptitle="Employee Commute Cost Differential Analysis", cutoff_radius=self.project.commute_range_cut_off,
+                                  x_label=str('\$ (USD) based on \$'+str(self.project.mileage_rate)+' per mile.'), y_label='# Employees (log scale)',
+                                  bins=bins, rows=len(other_offices), cols=1, column_titles=["Employee Commute Cost Differential Analysis"], 
+                                  cumulative_line=False, font_mod=1.5, manual_plot=True)
+
+        # manually add histograms for each office option
+        for i in range(len(diffs)):
+            ax[i].hist(diffs[i], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, align='mid', 
+                       rwidth=0.8, label=other_offices['address'].values[i], color=_colors(i+1))
+            ax[i].tick_params(axis='both', which='major', labelsize=16)
+
+            # add a legend to show the office options
+            ax[i].legend(loc='upper right', fontsize=16)
+
+            # add a text box with the stats, using two decimal places and adding commas at the thousands
+            textstr = _stats_textstr("Annualized \nDifferentials: ", (np.median(diffs[i]*commutes), np.mean(diffs[i]*commutes),
+                                                                     min(diffs[i])*commutes, max(diffs[i])*commutes, sum(diffs[i])*commutes))
+            # place a text box in upper left in axes coords, 
+            ax[i].text(.05, .75, textstr, transform=ax[i].transAxes, fontsize=14,
+                        verticalalignment='center', bbox=_STATS_BBOX, fontdict=_MONO_FONT, horizontalalignment='left')
+
+            # now, take the base_cost and the cost_values[i] and get the differential for each employee omitting 
+            # any employees that are zero cost in one, and not zero cost in the other
+            # this will omit those employees who rotated to/from remote work status as a result of the move.
+            mask = (cost_values[i]['cost'] != 0) & (base_costs['cost'] != 0)
+            differences = (cost_values[i]['cost'] - base_costs['cost'])[mask]
+
+            # Convert differences to a list and store in diffs
+            diffs2 = differences.tolist()
+
+            # get the differential
+            # get the stats
+            median = np.median(diffs2)*commutes
+            average = np.mean(diffs2)*commutes
+            minimum = min(diffs2)*commutes
+            maximum = max(diffs2)*commutes
+            total = sum(diffs2)*commutes
+
+            # add a text box with the stats, using two decimal places and adding commas at the thousands
+            textstr = _stats_textstr("Annualized Differentials omitting \n Employees Rotating to/from Remote Work: ",
+                                    (median, average, minimum, maximum, total))
+            # place a text box in upper right in axes coords, 
+            ax[i].text(.95, .75, textstr, transform=ax[i].transAxes, fontsize=14,
+                        verticalalignment='center', bbox=_STATS_BBOX, fontdict=_MONO_FONT, horizontalalignment='right')
+
+
+            ax[i].set_yscale('log')
+
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close()
+
+    def _render_wcda(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Weekly Commute Duration Analysis graph for the office in "row", see generate_graphs().
+        """
+        # only calculate for the first office, the current office
+        #office = offices.iloc[0].to_frame().T
+        office = offices.loc[[row.name]]
+        values = self._DURATION_COLS
+        cumulative_markers = {50: {'color': 'purple', 'marker': 'x', 'label': '50%', 'linestyle': '--', 'linewidth': 1},
+                            75: {'color': 'blue', 'marker': 'x', 'label': '75%', 'linestyle': '--', 'linewidth': 1},}
+        # calculate teh bins based on the max value of the data
+        binmax = 0
+        emp_within = self.get_office_commutes(office, emp, commute_data)[0]
+        val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
+        # get max value of val_set
+        # val_set is a DataFrame containing the extracted values for each employee location that matches the given office location. The DataFrame includes 'latitude' and 'longitude' of the employee locations and the specified `values`.
+        for each in values:
+            if max(val_set[each]) > binmax:
+                binmax = max(val_set[each])            
+        step = 5
+        # round the binmax up to the nearest step
+        bins = _bin_edges(binmax, step)
+        plt, ax = self.graphing.get_histogram(emp, office, commute_data, values, suptitle=str(row['address'])+" Commute Analysis", x_label='Minutes in Traffic', y_label='# Employees',  
+                    commute_radius=self.project.commute_range_cut_off, bins=bins, rows=5, cols=2, column_titles=['Morning Commute','Evening Commute'], cumulative_line=True,
+                    cumulative_color='black', cumulative_linestyle='--', cumulative_linewidth=1, cumulative_markers=cumulative_markers, font_mod=1.5)
+
+        plt.legend(loc='center right')
+        for each in plt.gcf().get_axes():
+            # Add monday through Friday labels on first column only
+            if each.get_subplotspec().colspan.start == 0:
+                # first row is monday, second is tuesday, etc
+                row = each.get_subplotspec().rowspan.start
+                if row == 0:
+                    each.text(0.02, 0.85, 'Monday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+                elif row == 1:
+                    each.text(0.02, 0.85, 'Tuesday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+                elif row == 2:
+                    each.text(0.02, 0.85, 'Wednesday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+                elif row == 3:
+                    each.text(0.02, 0.85, 'Thursday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+                elif row == 4:
+                    each.text(0.02, 0.85, 'Friday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close()
+
+    def _render_nwcda(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Normalized Weekly Commute Duration Analysis graph for the office in "row", see generate_graphs().
+        """
+        # only calculate for the first office, the current office
+        #office = offices.iloc[0].to_frame().T
+        office = offices.loc[[row.name]]
+        values = self._DURATION_COLS
+        cumulative_markers = {50: {'color': 'purple', 'marker': 'x', 'label': 'Median (min)', 'linestyle': '--', 'linewidth': 1}}
+
+        emp_within = self.get_office_commutes(office, emp, commute_data)[0]
+        val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
+        val_set_free = self.graphing.get_commute_values(emp_within, office, commute_data, "duration")
+        # Normalize the values in val_set by dividing by the corresponding values in val_set_free, and multiplying by 100
+        for each in values:
+            val_set[each] = val_set[each] / val_set_free['duration'] * 100
+
+        # calculate teh bins based on the max value of the data
+        binmax = 0
+        binmin = 100
+        for each in values:
+            if max(val_set[each]) > binmax:
+                binmax = max(val_set[each])
+            if min(val_set[each]) < binmin:
+                binmin = min(val_set[each])            
+        step = 5
+        # round the binmax up to the nearest step, and binmin down to the nearest step
+        bins = _bin_edges(binmax, step, binmin=binmin)
+
+        plt, ax = self.graphing.get_histogram(emp, office, commute_data, values, suptitle="Normalized 'In Traffic' Commute Analysis, \n"+str(row['address']), 
+                                              x_label='Normalized (In-Traffic / Traffic-Free) \n Commute Duration (%)', y_label='# Employees',  
+                    commute_radius=self.project.commute_range_cut_off, bins=bins, rows=5, cols=2, column_titles=['Morning Commute','Evening Commute'], cumulative_line=True,
+                    cumulative_color='black', cumulative_linestyle='--', cumulative_linewidth=1, cumulative_markers=cumulative_markers, 
+                    override_values=val_set, font_mod=1.5)
+
+
+        plt.legend(loc='center right')
+        for each in plt.gcf().get_axes():
+            # Add monday through Friday labels on first column only
+            if each.get_subplotspec().colspan.start == 0:
+                # first row is monday, second is tuesday, etc
+                row = each.get_subplotspec().rowspan.start
+                if row == 0:
+                    each.text(0.02, 0.85, 'Monday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+                elif row == 1:
+                    each.text(0.02, 0.85, 'Tuesday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+                elif row == 2:
+                    each.text(0.02, 0.85, 'Wednesday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+                elif row == 3:
+                    each.text(0.02, 0.85, 'Thursday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+                elif row == 4:
+                    each.text(0.02, 0.85, 'Friday', fontsize=12, transform=each.transAxes, ha='left', va='top')
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close()
+
+    def _render_ncda(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Normalized Commute Distribution Analysis graph, see generate_graphs().
+        """
+        office = offices.iloc[[0]]
+        values = self._DURATION_COLS
+        data_labels = ['Monday Morning','Monday Evening',
+                'Tuesday Morning','Tuesday Evening',
+                'Wednesday Morning','Wednesday Evening',
+                'Thursday Morning','Thursday Evening',
+                'Friday Morning','Friday Evening']
+        emp_within = self.get_office_commutes(office, emp, commute_data)[0]
+        val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
+        val_set_free = self.graphing.get_commute_values(emp_within, office, commute_data, "duration")
+        val_set_miles = self.graphing.get_commute_values(emp_within, office, commute_data, "miles")
+        # Normalize the values in val_set by dividing by the corresponding values in val_set_free, and multiplying by 100
+        for each in values:
+            val_set[each] = val_set[each] / val_set_free['duration'] * 100
+
+        plt, ax = self.graphing.get_scatterplot(emp, office, commute_data, "miles", "duration", title=title, x_label='Normalized (In-Traffic / Traffic-Free) \n Commute Duration (%)', 
+                                                y_label='Commute Distance miles',
+                                                cutoff_radius=self.project.commute_range_cut_off, commute_radius=self.project.commute_range_cut_off, figsize=(15, 15), manual_plot=True, font_mod=1.5)
+        # manually add scatter plots for each day
+        for i in range(len(values)):
+            ax.scatter(val_set[values[i]], val_set_miles['miles'],  alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, 
+                       label=data_labels[i], color=_colors(i))
+
+            ax.tick_params(axis='both', which='major', labelsize=16)
+
+            # add a legend to show the office options
+            ax.legend(loc='upper right', fontsize=16)
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close()
+
+    def _render_ncdahm(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Normalized Commute Distribution Analysis Heat Map graph, see generate_graphs().
+        """
+        office = offices.iloc[[0]]
+        values = self._DURATION_COLS
+        data_labels = ['Monday Morning','Monday Evening',
+                'Tuesday Morning','Tuesday Evening',
+                'Wednesday Morning','Wednesday Evening',
+                'Thursday Morning','Thursday Evening',
+                'Friday Morning','Friday Evening']
+
+        emp_within = self.get_office_commutes(office, emp, commute_data)[0]
+        val_set = self.graphing.get_commute_values(emp_within, office, commute_data, commute_data.columns.to_list())
+        # restore origin_lat and origin_long to the val_set
+        val_set['origin_lat'] = val_set['latitude']
+        val_set['origin_long'] = val_set['longitude']
+        val_set_free = self.graphing.get_commute_values(emp_within, office, commute_data, "duration")
+        # Normalize the values in val_set by dividing by the corresponding values in val_set_free, and multiplying by 100
+        for each in values:
+            val_set[each] = val_set[each] / val_set_free['duration'] * 100
+
+        plt, ax = self.graphing.get_heatmap(emp_within, office, val_set, values[3], title=title, 
+                                            value_label="Normalized Commute in Traffic (% vs. Free)", cutoff_distance=self.project.commute_range_cut_off, commute_radius=self.project.commute_range_cut_off,
+                                            cmap='jet', alpha=0.3, levels=10, font_mod=1.5)
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        # the map view figure is left open for the next map view to reuse, see Graphing.configure_map_plot()
+
+    def _render_tcca(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Total Commute Cost Analysis graph, see generate_graphs().
+        """
+        employee_costs_to_office = {}
+
+        for row in offices.itertuples():    
+            office = offices.loc[[row.Index]]
+            # the cost frame is shared with the tbcca graphs and the attrition analysis
+            val_set = self.get_cost_frame(office, emp, commute_data)
+
+            # add the current val_set to the employee_costs_to_office dictionary
+            employee_costs_to_office[row.address] = val_set
+
+        dvalues = ['Total Average Cost','Total High Cost']
+        # now iterate through again to get bins shared by all offices
+        binmax = 0
+        for address in offices['address']:
+            # create bins based on the max value of the Total Average Cost and Total High Cost data across the offices
+            for each in dvalues:
+                if max(employee_costs_to_office[address][each]) > binmax:
+                    binmax = max(employee_costs_to_office[address][each])
+            step = 5
+
+        # round the binmax up to the nearest step
+        bins = _bin_edges(binmax, step)
+
+        font_mod = 1.5
+
+        # create histograms for the morning and evening average costs
+        plt, ax = self.graphing.get_histogram(emp, office, commute_data, dvalues, 
+                                                suptitle="Total Employee Commute Costs per Day",cutoff_radius=self.project.commute_range_cut_off,
+                                x_label=str('\$ (USD)'), y_label='# Employees', bins=bins, rows=len(employee_costs_to_office.keys()), cols=2, 
+                                column_titles=["Average","High/Conservative"], cumulative_line=False, font_mod=font_mod, manual_plot=True, 
+                                sharey=True, sharex=True, override_values=employee_costs_to_office)
+
+        # manually add histograms for each office option
+        keys = list(employee_costs_to_office.keys())
+        for r in range(len(keys)):
+            for c in range(len(dvalues)):
+                ax[r,c].hist(employee_costs_to_office[keys[r]][dvalues[c]], bins=bins, alpha=0.5, edgecolor='#555555', linewidth=1, 
+                             zorder=2, align='mid', rwidth=0.8, label=dvalues, color=_colors(r+1))
+                ax[r,c].tick_params(axis='both', which='major', labelsize=16)
+
+                # add a text box in the upper right corner with the stats, plus the employee count
+                textstr = _stats_textstr("Employee Commute \n Cost per Day: ", (np.median(employee_costs_to_office[keys[r]][dvalues[c]]),
+                                                                               np.mean(employee_costs_to_office[keys[r]][dvalues[c]]),
+                                                                               min(employee_costs_to_office[keys[r]][dvalues[c]]),
+                                                                               max(employee_costs_to_office[keys[r]][dvalues[c]]),
+                                                                               sum(employee_costs_to_office[keys[r]][dvalues[c]])))
+                textstr += f"\n{'Count:':<9}{len(employee_costs_to_office[keys[r]][dvalues[c]]):>14}"
+                # place a text box in upper right in axes coords,
+                ax[r,c].text(.95, .7, textstr, transform=ax[r,c].transAxes, fontsize=14,
+                            verticalalignment='center', bbox=_STATS_BBOX, fontdict=_MONO_FONT, horizontalalignment='right')
+
+                # add the address to the top left of the plot
+                if c==0:
+                    ax[r,c].text(0.02, 0.98, keys[r], fontsize=10*font_mod, transform=ax[r,c].transAxes, ha='left', va='top')
+
+                # for the first column, add morning/evening text box the top left of the plot
+                if r==len(employee_costs_to_office.keys())-1:
+                    ax[r,c].set_xlabel('Employee Total Cost ($ USD / Day)', fontsize=14*font_mod)                        
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close() 
+
+    def _render_teccda(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Total Employee Commute Cost Differential Analysis graph, see generate_graphs().
+        """
+        # gather the data for the analysis
+        base_costs, cost_values, average_diffs, conservative_diffs, withins, employee_costs_to_office, current_office, other_offices = \
+            self.get_attrition_analysis(emp, offices, commute_data)
+
+        # the differentials come back as one array per office, make sure they are contiguous float64 once (a no-op for the
+        # rows of the stacked differentials) so the range, binning, threshold and sum passes below all scan plain arrays
+        average_diffs = [np.ascontiguousarray(d, dtype=np.float64) for d in average_diffs]
+        conservative_diffs = [np.ascontiguousarray(d, dtype=np.float64) for d in conservative_diffs]
+
+
+        # now we have a list of dataframes with the differentials, we eliminate all rows with 0 cost differential to prevent skewing the histogram
+        # calculate the bin list based upon a the min (negative) and max (positive) values of the data     
+        binmin, binmax = _diff_range(average_diffs + conservative_diffs)
+        step = 10 
+        # round the binmin down to the nearest step, max up to the nearest step
+        bins = _bin_edges(binmax, step, binmin=binmin)
+        dvalues = ['Total Average Cost','Total High Cost']
+
+        plt, ax = self.graphing.get_histogram(emp, other_offices, cost_values, values=dvalues, suptitle="Total Employee Commute Cost Differential Analysis", cutoff_radius=self.project.commute_range_cut_off,
+                                  x_label='\$ (USD) based on time and mileage', y_label='# Employees (log scale)',
+                                  bins=bins, rows=len(other_offices), cols=2, column_titles=dvalues, 
+                                  cumulative_line=False, font_mod=1.5, manual_plot=True,override_values=cost_values)
+
+        # calculate the $ value for turnover due to cost
+        median_salary = self.project.median_salary
+        threshold = self.project.turnover_threshold_due_to_cost*median_salary
+        daily_threshold = threshold/(self.project.commute_days_per_week*self.project.commute_weeks_per_year)
+        # get a count of the average and conservative costs above the threshold for every office up front, one row per office
+        # with the average count in column 0 and the conservative count in column 1, matching the subplot columns
+        above_thresholds = np.array([[np.count_nonzero(average_diffs[r] > daily_threshold),
+                                      np.count_nonzero(conservative_diffs[r] > daily_threshold)]
+                                     for r in range(len(other_offices))], dtype=np.int64).reshape(-1, 2)
+        # cost impact is the # above threshold * employee replacement cost * probability of turnover
+        cost_impacts = above_thresholds * self.project.turnover_probability_time_cost * self.project.employee_replacement_cost
+
+        # manually add histograms for each office option
+        # bar centers and widths matching hist(..., align='mid', rwidth=0.8) over the uniform bins
+        bin_step = bins[1] - bins[0]
+        bin_centers = bins[:-1] + bin_step/2
+        for r in range(len(other_offices)):
+            # bin the office's differentials once, both columns draw the same counts
+            counts = _uniform_counts(average_diffs[r], bins)
+            for c in range(2):
+                ax[r,c].bar(bin_centers, counts, width=bin_step*0.8, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, 
+                        label=other_offices['address'].values[r], color=_colors(r+2), log=True)
+                ax[r,c].tick_params(axis='both', which='major', labelsize=16)
+                if c == 0:
+                    ax[r,c].set_ylabel('# Employees (log scale)', fontsize=16)
+                    # put office address top left of the plot
+                    ax[r,c].text(0.03, 0.99, other_offices['address'].values[r], fontsize=16, transform=ax[r,c].transAxes, ha='left', va='top')
+
+                if r == len(other_offices)-1:
+                    ax[r,c].set_xlabel('Employee Total Cost Differential ($ USD)', fontsize=16)
+                ax[r,c].tick_params(axis='both', which='major', labelsize=16)
+                # draw a red box with alpha 0.1 over the plot from x=daily_threshold to x=binmax, and y=0 to y max
+                ax[r,c].fill_between([daily_threshold,binmax], 0, 10**3, color='red', alpha=0.1)
+                ax[r,c].fill_between([daily_threshold,binmax], 0, 10**3, color='red', alpha=0.1)
+
+                # add a text box with the count
+                threshold_vals = (f'${daily_threshold:,.2f}', int(above_thresholds[r,c]), f'${cost_impacts[r,c]:,.2f}')
+                textstr = "".join(f"\n{lbl.ljust(_THRESHOLD_LABEL_WIDTH)}{val:>14}" for lbl, val in zip(_THRESHOLD_LABELS, threshold_vals))
+                # place a text box in upper right in axes coords,
+                ax[r,c].text(.03, .85, textstr, transform=ax[r,c].transAxes, fontsize=14,
+                            verticalalignment='center', bbox=_THRESHOLD_BBOX, fontdict=_MONO_FONT, horizontalalignment='left')
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close()
+
+    def _render_tecdca(self, key, entry, title, row, emp, offices, commute_data, plots_dir):
+        """
+        Renders the Total Emissions Cost Differential Analysis graph, see generate_graphs().
+        """
+        # gather the data for the analysis
+        base_costs, cost_values, average_diffs, conservative_diffs, withins, employee_costs_to_office, current_office, other_offices = \
+            self.get_emissions_analysis(emp, offices, commute_data)
+
+        # the differentials come back as one array per office, make sure they are contiguous float64 once (a no-op for the
+        # rows of the stacked differentials) so the range, binning, threshold and sum passes below all scan plain arrays
+        average_diffs = [np.ascontiguousarray(d, dtype=np.float64) for d in average_diffs]
+        conservative_diffs = [np.ascontiguousarray(d, dtype=np.float64) for d in conservative_diffs]
+
+
+        # now we have a list of dataframes with the differentials, we eliminate all rows with 0 cost differential to prevent skewing the histogram
+        # calculate the bin list based upon a the min (negative) and max (positive) values of the data     
+        binmin, binmax = _diff_range(average_diffs + conservative_diffs)
+        step = 0.001
+        # round the binmin down to the nearest step, max up to the nearest step
+        bins = _bin_edges(binmax, step, binmin=binmin)
+
+        dvalues = ['Total Average Cost','Total High Cost']
+
+        plt, ax = self.graphing.get_histogram(emp, other_offices, cost_values, values=dvalues, suptitle=title, cutoff_radius=self.project.commute_range_cut_off,
+                                  x_label='\$ (USD) per commute', y_label='# Employees (log scale)',
+                                  bins=bins, rows=len(other_offices), cols=2, column_titles=dvalues, 
+                                  cumulative_line=False, font_mod=1.5, manual_plot=True,override_values=cost_values)
+
+
+        # manually add histograms for each office option
+        # bar centers and widths matching hist(..., align='mid', rwidth=0.8) over the uniform bins
+        bin_step = bins[1] - bins[0]
+        bin_centers = bins[:-1] + bin_step/2
+        for r in range(len(other_offices)):
+            # bin the office's differentials once, both columns draw the same counts
+            counts = _uniform_counts(average_diffs[r], bins)
+            # cost impact is the summation of the cost of emissions for all employees
+            cost_impact_avg = average_diffs[r].sum()
+            cost_impact_con = conservative_diffs[r].sum()
+            for c in range(2):
+                ax[r,c].bar(bin_centers, counts, width=bin_step*0.8, alpha=0.5, edgecolor='#555555', linewidth=1, zorder=2, 
+                        label=other_offices['address'].values[r], color=_colors(r+2), log=True)
+                ax[r,c].tick_params(axis='both', which='major', labelsize=16)
+                if c == 0:
+                    ax[r,c].set_ylabel('# Employees (log scale)', fontsize=16)
+                    # put office address top left of the plot
+                    ax[r,c].text(0.03, 0.99, other_offices['address'].values[r], fontsize=16, transform=ax[r,c].transAxes, ha='left', va='top')
+
+                if r == len(other_offices)-1:
+                    ax[r,c].set_xlabel('Cost of C02 Emissions (\$USD/commuting day)', fontsize=16)
+                ax[r,c].tick_params(axis='both', which='major', labelsize=16)
+
+
+                # add a text box with the count
+                t = {'co' : 'Total Avg Emissions Cost Difference\n (\$/commuting day): ${:,.2f}'.format(cost_impact_avg),
+                        'ci' : 'Total Conservative Cost Difference\n (\$/commuting day): ${:,.2f}'.format(cost_impact_con)                         
+                        }
+
+                textstr = t['co'] if c == 0 else t['ci']
+                # place a text box in upper right in axes coords,
+                ax[r,c].text(.03, .85, textstr, transform=ax[r,c].transAxes, fontsize=14,
+                            verticalalignment='center', bbox=_THRESHOLD_BBOX, fontdict=_MONO_FONT, horizontalalignment='left')
+
+        _save_png(plt, plots_dir+"/"+key+".png")
+        plt.close()
 
     def generate_tables(self, table="_all"):
         """
@@ -2429,6 +2830,16 @@ class Analyzer:
             with open(os.path.join(tables_dir, key+".html"), "w") as f:
                 f.write(t)
 
+        # each table entry is also streamed to tables.jsonl (one JSON object per line) as soon as it is generated, so the
+        # progress survives a failure partway through and can be polled, tables.json is still written in full at the end
+        jsonl_file = os.path.join(tables_dir, "tables.jsonl")
+        open(jsonl_file, 'wb').close()
+
+        # helper function to add a table entry to the table list and tables.jsonl
+        def add_table(entry, jsonl_file=jsonl_file):
+            self.table_list.append(entry)
+            _append_jsonl(entry, jsonl_file)
+
         ################################################################################
         ### TABLE SET: Office Addresses and Lat/Longs
         # iterate through offices and generate a table for each office
@@ -2439,15 +2850,15 @@ class Analyzer:
             key = 'li'+str(index)
             title = "Location Information "+str(row['address'])
             short_title = title
-            self.table_list.append( {"TABLE": key,
-                                    "TITLE": short_title,
-                                    "FILENAME": key+".html",
-                                    "TABLE-DESCRIPTION": "This table displays the location information for office option " + \
-                                    str(row['address']) + "."
-                                    })
+            add_table( {"TABLE": key,
+                        "TITLE": short_title,
+                        "FILENAME": key+".html",
+                        "TABLE-DESCRIPTION": "This table displays the location information for office option " + \
+                        str(row['address']) + "."
+                        })
             
             if table == "_all" or table == key:
-                office = row.to_frame().T
+                office = offices.loc[[index]]
                 # get the needed commute values
 
                 # create a dataframe with the office address and lat/long
@@ -2467,15 +2878,15 @@ class Analyzer:
         key = 'occt'
         title = "Overall Cost Comparison Table"
         short_title = title
-        self.table_list.append( {"TABLE": key,
-                                "TITLE": short_title,
-                                "FILENAME": key+".html",
-                                "TABLE-DESCRIPTION": "This table displays the overall cost comparison for each office option."
-                                })
+        add_table( {"TABLE": key,
+                    "TITLE": short_title,
+                    "FILENAME": key+".html",
+                    "TABLE-DESCRIPTION": "This table displays the overall cost comparison for each office option."
+                    })
         
         if table == "_all" or table == key:
-            print("Generating table for: ", key, table)
-            office = row.to_frame().T
+            logger.debug("Generating table for: %s %s", key, table)
+            office = offices.loc[[index]]
             # gather the data for the analysis
             val_set, base_costs, cost_values, average_diffs, conservative_diffs, withins, employee_costs_to_office, current_office, other_offices = \
                 self.get_attrition_analysis(emp, offices, commute_data)
@@ -2525,290 +2936,98 @@ class Analyzer:
 
         # write the graphs to tables.json in the project tables directory
         # convert self.tables_list to json
-        print(self.table_list)
-        with open(os.path.join(tables_dir, "tables.json"), "w") as f:
-            json.dump(self.table_list, f)
+        logger.debug("Tables: %s", self.table_list)
+        # written compactly and without escaping non-ASCII characters (e.g. in addresses), read back by the ui
+        _save_json(self.table_list, os.path.join(tables_dir, "tables.json"), ensure_ascii=False, separators=(',', ':'))
         
         # update the analysis phase
         self.update_analysis_phase()
         return self.table_list
-        ################################################################################
-    
-    """
-        # Constants
-    annual_savings = 0.25  # in millions
-    attrition_costs_year_1 = 0.05  # in millions
-    annual_emissions_costs = 0.01  # in millions
-    discount_rate = 0.05
-    years = 5
-
-    # Calculating NPV
-    npv = 0
-
-    # Year 1 cash flow (including attrition cost)
-    year_1_net_savings = annual_savings - attrition_costs_year_1
-    npv += year_1_net_savings / (1 + discount_rate)**1
 
-    # Years 2-5 cash flows (including emissions costs)
-    for year in range(2, years + 1):
-        annual_net_savings = annual_savings - annual_emissions_costs
-        npv += annual_net_savings / (1 + discount_rate)**year
-
-    npv
-
-    """
     def get_attrition_analysis(self, emp, offices, commute_data):
-        # helper function to get a base cost dataframe
-        def get_base_cost_df(emp, officeaddr):
-            rows = []
-            for index, row in emp.iterrows():
-                cost = 0.0
-                rows.append({'latitude':row['latitude'],'longitude':row['longitude'],'office':officeaddr,'cost':cost})
-            #cost_df = pd.DataFrame(rows)
-            return rows
-        
-        employee_costs_to_office = {}
-        for index, row in offices.iterrows():    
-            office = row.to_frame().T
-            
-            # get the needed commute values
-            values = commute_data.columns.to_list()
-            
-            mornings = ['m_morning_duration_in_traffic','t_morning_duration_in_traffic','w_morning_duration_in_traffic','h_morning_duration_in_traffic','f_morning_duration_in_traffic']
-            evenings = ['m_evening_duration_in_traffic','t_evening_duration_in_traffic','w_evening_duration_in_traffic','h_evening_duration_in_traffic','f_evening_duration_in_traffic']
-            
-            cdpw = self.project.commute_days_per_week
-
-            emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-            val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-            
-            # restore val_set columns latitutde and longitude to origin_lat and origin_long
-            val_set['origin_lat'] = val_set['latitude']
-            val_set['origin_long'] = val_set['longitude']
-
-            
+        # the per-employee commute (time plus mileage) costs to each office, see _get_cost_analysis()
+        return self._get_cost_analysis(emp, offices, commute_data, self.get_cost_frame)
 
-            # Calculate and insert the average morning and evening commute times directly into val_set
-            val_set['Morning Average'] = val_set.loc[:, mornings].mean(axis=1)
-            val_set['Evening Average'] = val_set.loc[:, evenings].mean(axis=1)
-
-            # Calculate and insert the top 'cdpw' maximum morning and evening commute times
-            # Note: Adjust the code below to calculate the averages of the top 'cdpw' as new columns directly
-            val_set['Average Top CDPW Morning'] = val_set[mornings].apply(lambda row: row.nlargest(cdpw).mean(), axis=1)
-            val_set['Average Top CDPW Evening'] = val_set[evenings].apply(lambda row: row.nlargest(cdpw).mean(), axis=1)
-
-            # Calculate a per-minute cost based on "median_salary" and "hours_per_year"
-            per_minute_cost = self.project.median_salary / (self.project.hours_per_year * 60)
-
-            # Calculate and insert the average cost for the week directly into val_set
-            val_set['Morning Average Cost'] = val_set['Morning Average'] * per_minute_cost
-            val_set['Evening Average Cost'] = val_set['Evening Average'] * per_minute_cost
+    def get_emissions_analysis(self, emp, offices, commute_data):
+        # the per-employee emissions costs to each office, see _get_cost_analysis()
+        return self._get_cost_analysis(emp, offices, commute_data, self.get_emissions_frame)
 
-            # Calculate and insert the high/conservative cost for the week directly into val_set
-            val_set['Morning High Cost'] = val_set['Average Top CDPW Morning'] * per_minute_cost
-            val_set['Evening High Cost'] = val_set['Average Top CDPW Evening'] * per_minute_cost
+    def _get_cost_analysis(self, emp, offices, commute_data, cost_frame):
+        """
+        Compares every employee's costs to the current office (the first office) with their costs to each of the other 
+        offices, the shared body of get_attrition_analysis() and get_emissions_analysis().
 
-            # Calculate a Total Average Time and Total High Time cost
-            val_set['Total Average Time Cost'] = val_set['Morning Average Cost'] + val_set['Evening Average Cost']
-            val_set['Total High Time Cost'] = val_set['Morning High Cost'] + val_set['Evening High Cost']
+        Args:
+            emp (DataFrame): The employee data.
+            offices (DataFrame): The office data, the first office is the current office.
+            commute_data (DataFrame): The commute data.
+            cost_frame (callable): Returns an office's cost frame, with 'Total Average Cost' and 'Total High Cost' columns, 
+                called as cost_frame(office, emp, commute_data).
 
-            # Calculate a Total Average Cost and Total High Cost
-            val_set['Total Average Cost'] = val_set['Total Average Time Cost'] + val_set['commute_cost']
-            val_set['Total High Cost'] = val_set['Total High Time Cost'] + val_set['commute_cost']
+        Returns:
+            tuple: base_costs, cost_values, average_diffs, conservative_diffs, withins, employee_costs_to_office, 
+            current_office, other_offices
+        """
+        employee_costs_to_office = {}
+        for row in offices.itertuples():    
+            office = offices.loc[[row.Index]]
+            # the cost frames are cached, see get_cost_frame() and get_emissions_frame()
+            val_set = cost_frame(office, emp, commute_data)
             
             # add the current val_set to the employee_costs_to_office dictionary
-            employee_costs_to_office[row['address']] = val_set
+            employee_costs_to_office[row.address] = val_set
+        # every office's costs in one frame indexed by office address and employee coordinates
+        costs_lookup = _cost_lookup(employee_costs_to_office)
         
         # employees to analyze are within the cutoff distance for this office
         # for this analysis, we need to iterate through options
-        current_office = offices.iloc[0].to_frame().T
+        current_office = offices.iloc[[0]]
         other_offices = offices.drop(0)
         cost_values = []
         withins = []
-        commutes = 2*self.project.commute_days_per_week*self.project.commute_weeks_per_year
         
         # for each employee, calculate the commute cost to the current office, place a new dataframe with lat, long, office, and cost
         # if the employee is within the cutoff distance, if outside the cutoff distance, the cost is 0
         # start by looping through ALL employees and adding a row with the current office, and cost = 0
                 
 
-        base_costs = pd.DataFrame(get_base_cost_df(emp, current_office['address'].values[0]))
+        base_costs = _base_cost_df(emp, current_office['address'].values[0])
         # add columns for total average cost and total high cost
         base_costs['Total Average Cost'] = 0.0
         base_costs['Total High Cost'] = 0.0
         # now get emp_within for the current office, and update the relevant rows of base_costs with actual costs for those employees 
         # using the commute_cost column in the commute_data dataframe where the employee lat long matches the commute_data lat long and office address
         
-        base_emp_within = self.graphing.filter_drive_distance(emp,current_office,self.project.commute_range_cut_off, commute_data=commute_data)
-
-        for index, row in base_emp_within.iterrows():
-            # set val_set from the employee_costs_to_office = {} dictionary
-            val_set = employee_costs_to_office[current_office['address'].values[0]]
-            # get the cost from the commute_data
-            avg_cost = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude']) & (val_set['office_address'] == current_office['address'].values[0])]['Total Average Cost'].values[0]
-            conservative_cost = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude']) & (val_set['office_address'] == current_office['address'].values[0])]['Total High Cost'].values[0]
-            base_costs.loc[(base_costs['latitude'] == row['latitude']) & (base_costs['longitude'] == row['longitude']),'Total Average Cost'] = avg_cost
-            base_costs.loc[(base_costs['latitude'] == row['latitude']) & (base_costs['longitude'] == row['longitude']),'Total High Cost'] = conservative_cost
+        # the office's cost frame holds exactly the employees within the cutoff distance, so they are matched with one join
+        _fill_costs(base_costs, costs_lookup)
 
         # now we have a dataframe with all employees, and the cost to the current office
     
         # now iterate through the other offices, get a base cost dataframe, and then update the relevant rows with actual costs, place in cost_values
-        for index, row in other_offices.iterrows():
-            office = row.to_frame().T
-            tmp_costs = pd.DataFrame(get_base_cost_df(emp, office['address'].values[0]))
+        for row in other_offices.itertuples():
+            office = other_offices.loc[[row.Index]]
+            tmp_costs = _base_cost_df(emp, row.address)
             # add columns for total average cost and total high cost
             tmp_costs['Total Average Cost'] = 0.0
             tmp_costs['Total High Cost'] = 0.0
-            emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
+            emp_within = self.get_office_commutes(office, emp, commute_data)[0]
             # we will use this later to get the differential for each employee, without the employees that aren't overlapping
             withins.append(emp_within)
 
-            for index, row in emp_within.iterrows():
-                # set val_set from the employee_costs_to_office = {} dictionary
-                val_set = employee_costs_to_office[office['address'].values[0]]
-                # get the cost from the commute_data
-                avg_cost = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude']) & (val_set['office_address'] == office['address'].values[0])]['Total Average Cost'].values[0]
-                conservative_cost = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude']) & (val_set['office_address'] == office['address'].values[0])]['Total High Cost'].values[0]
-                tmp_costs.loc[(tmp_costs['latitude'] == row['latitude']) & (tmp_costs['longitude'] == row['longitude']),'Total Average Cost'] = avg_cost
-                tmp_costs.loc[(tmp_costs['latitude'] == row['latitude']) & (tmp_costs['longitude'] == row['longitude']),'Total High Cost'] = conservative_cost
+            _fill_costs(tmp_costs, costs_lookup)
             
             cost_values.append(tmp_costs)
             
         # now we have a full list of costs for each employee to each office, we can get the differentials
-        # create a list to hold the differential dataframes
+        # every cost frame lists the employees in the same order as base_costs, so the costs are stacked into (offices, employees)
+        # arrays and differenced in one subtraction each, the differentials are the rows of the result (one array per office)
         average_diffs = []
         conservative_diffs = []
-        # for each cost dataframe, calculate the differential from the base_costs dataframe into a new dataframe
-        for i in range(len(cost_values)):
-            # get the differential
-            average_diffs.append(cost_values[i]['Total Average Cost'] - base_costs['Total Average Cost'])
-            conservative_diffs.append(cost_values[i]['Total High Cost'] - base_costs['Total High Cost'])
+        if cost_values:
+            average_diffs = list(np.stack([cv['Total Average Cost'].to_numpy(dtype=np.float64) for cv in cost_values]) -
+                                 base_costs['Total Average Cost'].to_numpy(dtype=np.float64))
+            conservative_diffs = list(np.stack([cv['Total High Cost'].to_numpy(dtype=np.float64) for cv in cost_values]) -
+                                      base_costs['Total High Cost'].to_numpy(dtype=np.float64))
 
         return base_costs, cost_values, average_diffs, conservative_diffs, withins, employee_costs_to_office, current_office, other_offices
     
-
-
-
-
-    def get_emissions_analysis(self, emp, offices, commute_data):
-        # helper function to get a base cost dataframe
-        def get_base_cost_df(emp, officeaddr):
-            rows = []
-            for index, row in emp.iterrows():
-                cost = 0.0
-                rows.append({'latitude':row['latitude'],'longitude':row['longitude'],'office':officeaddr,'cost':cost})
-            #cost_df = pd.DataFrame(rows)
-            return rows
-        
-        employee_costs_to_office = {}
-        for index, row in offices.iterrows():    
-            office = row.to_frame().T
-            
-            # get the needed commute values
-            values = commute_data.columns.to_list()
-            
-            mornings = ['m_morning_emissions','t_morning_emissions','w_morning_emissions','h_morning_emissions','f_morning_emissions']
-            evenings = ['m_evening_emissions','t_evening_emissions','w_evening_emissions','h_evening_emissions','f_evening_emissions']
-            
-            cdpw = self.project.commute_days_per_week
-
-            emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-            val_set = self.graphing.get_commute_values(emp_within, office, commute_data, values)
-            
-            # restore val_set columns latitutde and longitude to origin_lat and origin_long
-            val_set['origin_lat'] = val_set['latitude']
-            val_set['origin_long'] = val_set['longitude']
-
-            # Calculate and insert the average morning and evening commute times directly into val_set
-            val_set['Morning Average'] = val_set.loc[:, mornings].mean(axis=1)
-            val_set['Evening Average'] = val_set.loc[:, evenings].mean(axis=1)
-            
-            # Calculate and insert the top 'cdpw' maximum morning and evening commute times
-            # Note: Adjust the code below to calculate the averages of the top 'cdpw' as new columns directly
-            val_set['Average Top CDPW Morning'] = val_set[mornings].apply(lambda row: row.nlargest(cdpw).mean(), axis=1)
-            val_set['Average Top CDPW Evening'] = val_set[evenings].apply(lambda row: row.nlargest(cdpw).mean(), axis=1)
-            
-            # emissions figure are in kg/commute. To get cost we need the CO2_credit_cost, which is $/metric ton
-            per_kg_CO2_cost = self.project.CO2_credit_cost / 1000
-
-            # Calculate and insert the average cost for the week directly into val_set
-            val_set['Morning Average Cost'] = val_set['Morning Average'] * per_kg_CO2_cost
-            val_set['Evening Average Cost'] = val_set['Evening Average'] * per_kg_CO2_cost
-            
-            # Calculate and insert the high/conservative cost for the week directly into val_set
-            val_set['Morning High Cost'] = val_set['Average Top CDPW Morning'] * per_kg_CO2_cost
-            val_set['Evening High Cost'] = val_set['Average Top CDPW Evening'] * per_kg_CO2_cost
-
-            # Calculate a Total Average Time and Total High Time cost
-            val_set['Total Average Cost'] = val_set['Morning Average Cost'] + val_set['Evening Average Cost']
-            val_set['Total High Cost'] = val_set['Morning High Cost'] + val_set['Evening High Cost']
-            
-            # add the current val_set to the employee_costs_to_office dictionary
-            employee_costs_to_office[row['address']] = val_set
-        
-        # employees to analyze are within the cutoff distance for this office
-        # for this analysis, we need to iterate through options
-        current_office = offices.iloc[0].to_frame().T
-        other_offices = offices.drop(0)
-        cost_values = []
-        withins = []
-        commutes = 2*self.project.commute_days_per_week*self.project.commute_weeks_per_year
-        
-        # for each employee, calculate the commute cost to the current office, place a new dataframe with lat, long, office, and cost
-        # if the employee is within the cutoff distance, if outside the cutoff distance, the cost is 0
-        # start by looping through ALL employees and adding a row with the current office, and cost = 0
-                
-
-        base_costs = pd.DataFrame(get_base_cost_df(emp, current_office['address'].values[0]))
-        # add columns for total average cost and total high cost
-        base_costs['Total Average Cost'] = 0.0
-        base_costs['Total High Cost'] = 0.0
-        # now get emp_within for the current office, and update the relevant rows of base_costs with actual costs for those employees 
-        # using the commute_cost column in the commute_data dataframe where the employee lat long matches the commute_data lat long and office address
-        
-        base_emp_within = self.graphing.filter_drive_distance(emp,current_office,self.project.commute_range_cut_off, commute_data=commute_data)
-
-        for index, row in base_emp_within.iterrows():
-            # set val_set from the employee_costs_to_office = {} dictionary
-            val_set = employee_costs_to_office[current_office['address'].values[0]]
-            # get the cost from the commute_data
-            avg_cost = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude']) & (val_set['office_address'] == current_office['address'].values[0])]['Total Average Cost'].values[0]
-            conservative_cost = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude']) & (val_set['office_address'] == current_office['address'].values[0])]['Total High Cost'].values[0]
-            base_costs.loc[(base_costs['latitude'] == row['latitude']) & (base_costs['longitude'] == row['longitude']),'Total Average Cost'] = avg_cost
-            base_costs.loc[(base_costs['latitude'] == row['latitude']) & (base_costs['longitude'] == row['longitude']),'Total High Cost'] = conservative_cost
-
-        # now we have a dataframe with all employees, and the cost to the current office
-    
-        # now iterate through the other offices, get a base cost dataframe, and then update the relevant rows with actual costs, place in cost_values
-        for index, row in other_offices.iterrows():
-            office = row.to_frame().T
-            tmp_costs = pd.DataFrame(get_base_cost_df(emp, office['address'].values[0]))
-            # add columns for total average cost and total high cost
-            tmp_costs['Total Average Cost'] = 0.0
-            tmp_costs['Total High Cost'] = 0.0
-            emp_within = self.graphing.filter_drive_distance(emp,office,self.project.commute_range_cut_off, commute_data=commute_data)
-            # we will use this later to get the differential for each employee, without the employees that aren't overlapping
-            withins.append(emp_within)
-
-            for index, row in emp_within.iterrows():
-                # set val_set from the employee_costs_to_office = {} dictionary
-                val_set = employee_costs_to_office[office['address'].values[0]]
-                # get the cost from the commute_data
-                avg_cost = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude']) & (val_set['office_address'] == office['address'].values[0])]['Total Average Cost'].values[0]
-                conservative_cost = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude']) & (val_set['office_address'] == office['address'].values[0])]['Total High Cost'].values[0]
-                tmp_costs.loc[(tmp_costs['latitude'] == row['latitude']) & (tmp_costs['longitude'] == row['longitude']),'Total Average Cost'] = avg_cost
-                tmp_costs.loc[(tmp_costs['latitude'] == row['latitude']) & (tmp_costs['longitude'] == row['longitude']),'Total High Cost'] = conservative_cost
-            
-            cost_values.append(tmp_costs)
-            
-        # now we have a full list of costs for each employee to each office, we can get the differentials
-        # create a list to hold the differential dataframes
-        average_diffs = []
-        conservative_diffs = []
-        # for each cost dataframe, calculate the differential from the base_costs dataframe into a new dataframe
-        for i in range(len(cost_values)):
-            # get the differential
-            average_diffs.append(cost_values[i]['Total Average Cost'] - base_costs['Total Average Cost'])
-            conservative_diffs.append(cost_values[i]['Total High Cost'] - base_costs['Total High Cost'])
-
-        return base_costs, cost_values, average_diffs, conservative_diffs, withins, employee_costs_to_office, current_office, other_offices
\ No newline at end of file
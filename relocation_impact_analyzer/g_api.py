@@ -17,48 +17,162 @@ Version: 0.0.1 Pre-Alpha
 """
 
 import googlemaps
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from dotenv import load_dotenv
 import os
 import random
+import asyncio
 import math
+import hashlib
+import shelve
+import threading
+import time
+import weakref
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+
+from relocation_impact_analyzer.geodesy import (_haversine, _haversine_vec, _haversine_newpoint, _haversine_newpoint_vec, 
+                                                 _make_anchor, _haversine_from_anchor)
+
+# load the .env file once at import, rather than on every GAPI construction (existing environment variables, e.g. a key
+# set by the Analyzer, take precedence)
+load_dotenv()
+
+# normalize an address for the per-instance result caches, so case and surrounding/repeated whitespace differences in
+# the same address share one cached API result
+def _address_key(address):
+    return " ".join(str(address).split()).lower()
+
+# persistent API result cache settings, results are kept for 30 days, the suggested cache location is under the user's
+# cache directory (the cache holds addresses, so it is only used when a cache_dir is passed to GAPI)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "relocation_impact_analyzer")
+_DISK_CACHE_EXPIRY = 30*86400
+
+# build a persistent cache key from the parts of an API query, hashed so it is a fixed length string whatever the query
+def _disk_cache_key(*parts):
+    return hashlib.sha1("|".join(str(p) for p in parts).encode('utf-8')).hexdigest()
+
+# bucket a commute departure time (unix epoch seconds) to the hour for the persistent cache key, the traffic model is
+# pessimistic so departures within the same hour share a cached result
+def _departure_bucket(departure_time):
+    return int(departure_time)//3600*3600
+
+# Mapping of Google API exception names to recoverability, one read-only table (GAPI.google_api_exceptions) shared by 
+# all GAPI instances
+_EXCEPTION_RECOVERABILITY = MappingProxyType({
+    'ApiError': 'non-recoverable',  # General API errors
+    'TransportError': 'recoverable',  # Issues with the network transport
+    'HttpError': 'recoverable',  # Errors in HTTP response
+    'Timeout': 'recoverable',  # Request timeout errors
+    '_RetriableRequest': 'recoverable', # Retriable requests
+    '_OverQueryLimit': 'recoverable', # Rate limit errors
+    'EmptyResult': 'recoverable',  # Empty results
+    # Add more specific exceptions as needed
+})
+
+# release a GAPI's OS resources (thread pool, pooled connections, persistent cache), called once through its finalizer
+# by close(), when it is garbage collected, or at interpreter exit, whichever is first
+def _release_resources(executor, session, disk_cache, disk_cache_lock):
+    executor.shutdown(wait=False, cancel_futures=True)
+    session.close()
+    if disk_cache is not None:
+        with disk_cache_lock:
+            disk_cache.close()
 
 class EmptyResult(Exception):
     # create a custom exception for when the geocode result is empty
-    pass
+    __slots__ = ()
 
 class GAPI:
-    def __init__(self, api_key=None):
+    # fixed instance attributes, no per-instance __dict__
+    __slots__ = ("api_key", "gmaps", "_session", "_executor", "_geocode_cache", "_validation_cache", "_disk_cache", 
+                 "_disk_cache_lock", "_rng", "_finalizer", "__weakref__")
+
+    # Mapping of exceptions to recoverability, shared by all instances
+    google_api_exceptions = _EXCEPTION_RECOVERABILITY
+
+    def __init__(self, api_key=None, max_workers=10, cache_dir=None):
         """
         Initializes the GAPI object with a provided Google Maps API key or loads it from the environment.
 
         Args:
-            api_key (str, optional): The Google Maps API key. If not provided, the key is loaded from the 
-            .env file using the GMAPS_API_KEY variable.
-
-        This constructor sets up the Google Maps client for subsequent API calls and defines a mapping of Google API 
-        exceptions to their recoverability status.
-        """
-
-        # load the API key from the .env file
-        if api_key is not None:
-            self.api_key = api_key
-        else:
-            load_dotenv()
-            self.api_key = os.getenv("GMAPS_API_KEY")
-        self.gmaps = googlemaps.Client(key=self.api_key)
-        # Dictionary mapping exceptions to recoverability
-        self.google_api_exceptions = {
-            'ApiError': 'non-recoverable',  # General API errors
-            'TransportError': 'recoverable',  # Issues with the network transport
-            'HttpError': 'recoverable',  # Errors in HTTP response
-            'Timeout': 'recoverable',  # Request timeout errors
-            '_RetriableRequest': 'recoverable', # Retriable requests
-            '_OverQueryLimit': 'recoverable', # Rate limit errors
-            'EmptyResult': 'recoverable',  # Empty results
-            # Add more specific exceptions as needed
-}
+            api_key (str, optional): The Google Maps API key. If not provided, the key is read from the GMAPS_API_KEY 
+            environment variable (loaded from the .env file when this module is imported).
+            max_workers (int, optional): The number of threads used by the batch methods (geocode_many, commute_many) 
+            to overlap the network latency of concurrent API calls. Defaults to 10.
+            cache_dir (str, optional): A directory (e.g. DEFAULT_CACHE_DIR) in which to persist successful geocode, 
+            commute and address validation results for 30 days, so repeated runs skip the API calls. Defaults to None, 
+            no persistent cache.
+
+        This constructor sets up the Google Maps client for subsequent API calls. The mapping of Google API exceptions 
+        to their recoverability status is the class attribute google_api_exceptions.
+
+        Raises:
+            ValueError: If no API key is provided or set in the environment.
+        """
+
+        # use the API key provided, or the one loaded from the .env file
+        self.api_key = api_key if api_key is not None else os.environ.get("GMAPS_API_KEY")
+        if not self.api_key:
+            raise ValueError("No Google Maps API key provided, pass api_key or set GMAPS_API_KEY in the environment or .env file.")
+        # share one keep-alive session across all the client's calls, so each call reuses a pooled TLS connection rather 
+        # than paying the TCP+TLS handshake again, the pool is sized for the batch methods' threads
+        # rate limit (429) and transient server errors are retried at the connection level with exponential backoff, 
+        # honoring any Retry-After header, rather than failing the call back to the caller's sleep-and-retry handling
+        # this is the only retry layer: exhausted retries raise (surfacing as the client's TransportError) rather than 
+        # handing the error status to the client's own 5xx retry loop, and the client doesn't retry over query limit 
+        # responses itself, which are left to the caller's handling
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], 
+                      allowed_methods=frozenset(["GET", "POST"]), respect_retry_after_header=True, raise_on_status=True)
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=max(32, max_workers), max_retries=retry))
+        self.gmaps = googlemaps.Client(key=self.api_key, requests_session=self._session, retry_over_query_limit=False)
+        # thread pool for the batch methods, the calls are network bound so threads overlap their latency despite the GIL
+        # (the worker threads are only started once a batch is submitted)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # successful geocode and address validation results keyed by normalized address, so repeated addresses (the same 
+        # home or office across runs of the analysis) skip the API call entirely
+        self._geocode_cache = {}
+        self._validation_cache = {}
+        # optional persistent cache shared across runs, shelve isn't thread safe so access to it is locked
+        self._disk_cache = None
+        self._disk_cache_lock = threading.Lock()
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._disk_cache = shelve.open(os.path.join(cache_dir, "gapi_cache"))
+        # random number generator for fuzz_latlong, seeded from system entropy once here rather than on every call
+        self._rng = random.Random()
+        # release the thread pool, connections and cache once, on close(), garbage collection or interpreter exit, 
+        # without the exit hook keeping the object alive
+        self._finalizer = weakref.finalize(self, _release_resources, self._executor, self._session, self._disk_cache, 
+                                           self._disk_cache_lock)
         return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
     
+    def _cache_get(self, key):
+        # get an unexpired result from the persistent cache, None on a miss or with no persistent cache
+        if self._disk_cache is None:
+            return None
+        with self._disk_cache_lock:
+            hit = self._disk_cache.get(key)
+        if hit is None or time.time() - hit[0] > _DISK_CACHE_EXPIRY:
+            return None
+        return hit[1]
+
+    def _cache_set(self, key, value):
+        # store a result in the persistent cache with the time it was stored, if there is one
+        if self._disk_cache is not None:
+            with self._disk_cache_lock:
+                self._disk_cache[key] = (time.time(), value)
+
     def validate_address(self, address):
         """
         Validates an address using the Google Maps API, ensuring it is a legitimate and recognized address.
@@ -70,13 +184,25 @@ class GAPI:
             dict: The validation result, which may include detailed address information or an error message if the validation fails.
 
         This method attempts to validate the given address and catches any exceptions, adding a note to the 
-        exception with the address that triggered it before returning an error dictionary.
+        exception with the address that triggered it before returning an error dictionary. Successful results are 
+        cached per normalized address, and in the persistent cache if there is one.
         """
+        key = _address_key(address)
+        if key in self._validation_cache:
+            return self._validation_cache[key]
+        disk_key = _disk_cache_key("validate_address", key)
+        r = self._cache_get(disk_key)
+        if r is not None:
+            self._validation_cache[key] = r
+            return r
         try:
             r=self.gmaps.addressvalidation(address)
+            self._validation_cache[key] = r
+            self._cache_set(disk_key, r)
             return(r)
         except Exception as e:
-            e.add_note = "Address validation triggered an exception trying address "+ address + "."
+            if hasattr(e, "add_note"):
+                e.add_note(f"Address validation triggered an exception trying address {address}.")
             return {"Error":str(e)}
 
     def commute(self, origin, destination, departure_time):
@@ -86,28 +212,43 @@ class GAPI:
         Args:
             origin (tuple): The latitude and longitude of the origin point.
             destination (tuple): The latitude and longitude of the destination point.
-            departure_time (datetime): The time of departure used to estimate traffic conditions.
+            departure_time (datetime or int): The time of departure used to estimate traffic conditions, as a datetime or 
+            as unix epoch seconds.
 
         Returns:
-            dict: A dictionary containing commute distance, duration, and duration in traffic. If an error occurs, 
+            dict: A dictionary containing commute distance, duration, and duration in traffic as text, along with their 
+            numeric values ('distance_meters', 'duration_seconds', 'duration_in_traffic_seconds'). If an error occurs, 
             returns a dictionary with an error message.
 
         Exceptions are caught and annotated with the relevant details before being returned as part of the error dictionary.
+        Successful results are kept in the persistent cache if there is one, keyed with the departure time to the hour.
         """
 
+        # convert the departure time to epoch seconds once, it is passed to the client as is and keys the cache
+        departure_epoch = int(departure_time.timestamp()) if hasattr(departure_time, "timestamp") else int(departure_time)
+        # check the persistent cache for this commute
+        disk_key = _disk_cache_key("commute", origin, destination, _departure_bucket(departure_epoch))
+        commute = self._cache_get(disk_key)
+        if commute is not None:
+            return commute
         # get the duration of the morning commute, returning a dictionary of the distance, duration, and duration in traffic
         try:
             directions_result = self.gmaps.directions(origin, destination, mode="driving", 
-                                                    departure_time=departure_time, avoid="tolls", 
+                                                    departure_time=departure_epoch, avoid="tolls", 
                                                     traffic_model="pessimistic", units="imperial")
-            # create a dictionary to hold the results
-            commute = {}
-            commute["distance"] = directions_result[0]["legs"][0]["distance"]["text"]
-            commute["duration"] = directions_result[0]["legs"][0]["duration"]["text"]
-            commute["duration_in_traffic"] = directions_result[0]["legs"][0]["duration_in_traffic"]["text"]
+            # create a dictionary to hold the results, from the route's single leg
+            leg = directions_result[0]["legs"][0]
+            commute = {"distance": leg["distance"]["text"],
+                       "duration": leg["duration"]["text"],
+                       "duration_in_traffic": leg["duration_in_traffic"]["text"],
+                       "distance_meters": leg["distance"]["value"],
+                       "duration_seconds": leg["duration"]["value"],
+                       "duration_in_traffic_seconds": leg["duration_in_traffic"]["value"]}
+            self._cache_set(disk_key, commute)
             return commute
         except Exception as e:
-            e.add_note = "Commute triggered an exception trying origin " + origin + " and destination " + destination + " at departure time" + departure_time + "."
+            if hasattr(e, "add_note"):
+                e.add_note(f"Commute triggered an exception trying origin {origin} and destination {destination} at departure time {departure_time}.")
             return {"Error":str(e)}
     
     def geocode(self, address):
@@ -123,21 +264,110 @@ class GAPI:
         Raises:
             EmptyResult: If the geocode operation returns an empty result, indicating the address could not be found or recognized.
 
-        Additional exceptions are caught, annotated, and re-raised to provide more context about the failure.
+        Additional exceptions are caught, annotated, and re-raised to provide more context about the failure. Successful 
+        results are cached per normalized address (and in the persistent cache if there is one), a copy of the cached 
+        coordinates is returned.
         """
+        key = _address_key(address)
+        if key not in self._geocode_cache:
+            disk_key = _disk_cache_key("geocode", key)
+            latlong = self._cache_get(disk_key)
+            if latlong is None:
+                try:
+                    latlong = self._geocode_uncached(address)
+                except Exception as e:
+                    if hasattr(e, "add_note"):
+                        e.add_note(f"Geocode triggered an exception trying address {address}.")
+                    raise
+                self._cache_set(disk_key, latlong)
+            self._geocode_cache[key] = latlong
+        return dict(self._geocode_cache[key])
+
+    def _geocode_uncached(self, address):
         # get the GPS coordinates of an address
         geocode_result = self.gmaps.geocode(address)
+        # if the geocode result is an empty list... we had a silent failure
+        if not geocode_result:
+            raise EmptyResult("Geocode result is empty.")
+        # a result missing its geometry/location raises as it is indexed, an unrecoverable error for the caller
+        return geocode_result[0]["geometry"]["location"]
+    
+    def _geocode_safe(self, address):
+        # geocode an address for the batch methods, returning an error dictionary (as commute does) instead of raising
         try:
-            return geocode_result[0]["geometry"]["location"]
+            return self.geocode(address)
         except Exception as e:
-            # if the geocode result is an empty list... we had a silent failure
-            if len(geocode_result) == 0:
-                raise EmptyResult("Geocode result is empty.")
-            else:
-                # raise the exception
-                e.add_note = "Geocode triggered an exception trying address "+ address + "."
-                raise e
-    
+            return {"Error":str(e)}
+
+    def geocode_many(self, addresses, worker=None):
+        """
+        Retrieves the latitude and longitude coordinates for many addresses, with the API calls made concurrently.
+
+        Args:
+            addresses (iterable): The addresses to geocode.
+            worker (callable, optional): Called with each address in place of the default geocode call, e.g. to wrap 
+            geocode with the caller's rate limiting and retry handling. Defaults to None.
+
+        Returns:
+            list: A list with one dictionary per address, in the order given, containing the 'lat' and 'lng' keys or, 
+            if geocoding that address failed, an 'Error' key with the exception message. With a worker, its return values, 
+            and the first exception it raises is raised here (the calls not yet started are cancelled).
+        """
+        return list(self._executor.map(worker if worker is not None else self._geocode_safe, addresses))
+
+    def commute_many(self, commutes, worker=None):
+        """
+        Calculates commute details for many origin, destination and departure time combinations, with the API calls 
+        made concurrently.
+
+        Args:
+            commutes (iterable): Tuples of (origin, destination, departure_time), as passed to commute.
+            worker (callable, optional): Called with each tuple's origin, destination and departure_time in place of 
+            commute, e.g. to wrap commute with the caller's rate limiting and retry handling. Defaults to None.
+
+        Returns:
+            list: A list with one commute dictionary per tuple, in the order given, as returned by commute (including 
+            its error dictionary if a call fails). With a worker, its return values, and the first exception it raises is 
+            raised here (the calls not yet started are cancelled).
+        """
+        worker = worker if worker is not None else self.commute
+        return list(self._executor.map(lambda c: worker(*c), commutes))
+
+    async def geocode_async(self, address):
+        """
+        Awaitable geocode for callers running an asyncio event loop. The API call runs on the batch thread pool so the 
+        loop isn't blocked.
+
+        Args:
+            address (str): The address to geocode.
+
+        Returns:
+            dict: As geocode_many, the 'lat' and 'lng' keys or an 'Error' key with the exception message.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._geocode_safe, address)
+
+    async def geocode_many_async(self, addresses):
+        """
+        Awaitable geocode_many for callers running an asyncio event loop, gathering one geocode_async per address.
+
+        Args:
+            addresses (iterable): The addresses to geocode.
+
+        Returns:
+            list: A list with one dictionary per address, in the order given, as returned by geocode_async.
+        """
+        return list(await asyncio.gather(*[self.geocode_async(address) for address in addresses]))
+
+    def close(self):
+        """
+        Releases the thread pool used by the batch methods (cancelling any batch calls not yet started), the pooled HTTP 
+        connections and the persistent cache. The object should not be used for API calls afterwards. Safe to call more 
+        than once, and called on leaving a with block.
+        """
+        with self._disk_cache_lock:
+            self._disk_cache = None
+        self._finalizer()
+
     def fuzz_latlong(self, latlong, fuzz):
         """
         Applies a random displacement within a specified radius to a set of GPS coordinates to anonymize them.
@@ -152,12 +382,11 @@ class GAPI:
         This method is particularly useful for anonymizing location data before publication, ensuring individual privacy is maintained.
         """
      # add a small amount of fuzz to the GPS coordinates to provide a degree of anonymity to the data (useful for publication)
-        # first, convert the fuzz into a lat lont offset, it will vary by the distance from the equator
-        np = self.haversine_newpoint(latlong["lat"], latlong["lng"], fuzz, 0)
-        fuzz = abs(latlong["lat"] - np[0])
-        random.seed() 
-        latfuzz = random.uniform(-fuzz, fuzz)
-        lngfuzz = random.uniform(-fuzz, fuzz) 
+        # first, convert the fuzz into a lat long offset, the latitude change of a due north (bearing 0) haversine_newpoint,
+        # which is exactly the fuzz distance's central angle in degrees
+        fuzz = math.degrees(fuzz / 3958.8)
+        latfuzz = self._rng.uniform(-fuzz, fuzz)
+        lngfuzz = self._rng.uniform(-fuzz, fuzz) 
         latlong["lat"] += latfuzz
         latlong["lng"] += lngfuzz
         return latlong
@@ -175,30 +404,53 @@ class GAPI:
         Returns:
             float: The distance between the two points in miles.
         """
+        return _haversine(lat1, lon1, lat2, lon2)
 
-        # Radius of the Earth in miles
-        R = 3958.8
-        # Radius of the Earth in kilometers (uncomment to use kilometers)
-        #R = 6371.0
+    def make_anchor(self, lat, lon):
+        """
+        Precomputes a fixed origin point's radian coordinates and latitude trig for repeated haversine_from_anchor calls.
 
-        # Convert latitude and longitude from degrees to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
+        Args:
+            lat (float): The latitude of the origin point.
+            lon (float): The longitude of the origin point.
+
+        Returns:
+            _AnchorTrig: A namedtuple of the origin's (lat_r, lon_r, sin_lat, cos_lat).
+        """
+        return _make_anchor(lat, lon)
+
+    def haversine_from_anchor(self, anchor, lat2, lon2):
+        """
+        Calculates the great-circle distance from a precomputed origin (see make_anchor) to a point, as haversine does 
+        but without converting the origin's coordinates or recomputing its trig on each call.
+
+        Args:
+            anchor (_AnchorTrig): The precomputed origin point.
+            lat2 (float): The latitude of the second point.
+            lon2 (float): The longitude of the second point.
 
-        # Difference in coordinates
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
+        Returns:
+            float: The distance between the two points in miles.
+        """
+        return _haversine_from_anchor(anchor, lat2, lon2)
 
-        # Haversine formula
-        a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    def haversine_vec(self, lat1, lon1, lats, lons, out=None):
+        """
+        Calculates the great-circle distances from one point to many points on the Earth's surface, as one vectorized 
+        NumPy calculation rather than a haversine call per point.
 
-        # Total distance in (units selected above)
-        distance = R * c
+        Args:
+            lat1 (float): The latitude of the first point.
+            lon1 (float): The longitude of the first point.
+            lats (array-like): The latitudes of the other points.
+            lons (array-like): The longitudes of the other points.
+            out (numpy.ndarray, optional): A float64 array, shaped as lats, to write the distances into, so repeated 
+            calls can reuse one buffer. Defaults to None, a new array.
 
-        return distance
+        Returns:
+            numpy.ndarray: The distances from the first point to each of the other points in miles (out if given).
+        """
+        return _haversine_vec(lat1, lon1, lats, lons, out=out)
     
     # calcuate a new point given a distance and bearing from a starting point using haversine
     def haversine_newpoint(self,lat1, lon1, distance, bearing):
@@ -217,23 +469,23 @@ class GAPI:
         Returns:
             tuple: A tuple containing the latitude and longitude (lat2, lon2) of the new point.
         """
-        # convert distance to radians
-        distance = distance / 3958.8
-        # convert bearing to radians
-        bearing = math.radians(bearing)
-        # convert latitude to radians
-        lat1 = math.radians(lat1)
-        # convert longitude to radians
-        lon1 = math.radians(lon1)
-        # calculate the new latitude
-        lat2 = math.asin(math.sin(lat1) * math.cos(distance) + math.cos(lat1) * math.sin(distance) * math.cos(bearing))
-        # calculate the new longitude
-        lon2 = lon1 + math.atan2(math.sin(bearing) * math.sin(distance) * math.cos(lat1), math.cos(distance) - math.sin(lat1) * math.sin(lat2))
-        # convert latitude back to degrees
-        lat2 = math.degrees(lat2)
-        # convert longitude back to degrees
-        lon2 = math.degrees(lon2)
-        return (lat2, lon2)
+        return _haversine_newpoint(lat1, lon1, distance, bearing)
+
+    def haversine_newpoint_vec(self, lat1, lon1, distances, bearings):
+        """
+        Determines many new latitudes and longitudes from one starting point, as haversine_newpoint does for each 
+        distance and bearing pair but as one vectorized NumPy calculation.
+
+        Args:
+            lat1 (float): Latitude of the starting point in degrees.
+            lon1 (float): Longitude of the starting point in degrees.
+            distances (array-like): Distances to move from the starting point in miles.
+            bearings (array-like): Directions to move in from the starting point in degrees (broadcast against distances).
+
+        Returns:
+            tuple: A tuple of numpy.ndarrays containing the latitudes and longitudes (lat2, lon2) of the new points.
+        """
+        return _haversine_newpoint_vec(lat1, lon1, distances, bearings)
 
         
 
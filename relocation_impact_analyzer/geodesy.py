@@ -0,0 +1,100 @@
+"""
+Geodesic helpers for the Relocation Impact Analysis Tool
+
+The great-circle calculations shared by the GAPI and Graphing classes: the haversine distance between points and the new
+point a distance and bearing from a starting point, each as a scalar (math) function for single points and a vectorized
+(NumPy, broadcasting) function for arrays of points, with a precomputed origin (anchor) form of the distance for many
+distances from one point. Both classes' haversine methods call these, so every distance in the
+package is calculated with the same formula.
+
+Author: Victor Foulk
+License: MIT License
+Date: 2024-03-15
+Version: 0.0.1 Pre-Alpha
+"""
+
+import math
+import numpy as np
+from collections import namedtuple
+
+# Radius of the Earth in miles
+_EARTH_RADIUS_MILES = 3958.8
+
+# the great-circle distance in miles between two lat/long points, by the haversine formula. asin(sqrt(a)) is equivalent to
+# atan2(sqrt(a), sqrt(1-a)) as a is in [0, 1], with one less sqrt, and a is clipped to 1 so rounding for near antipodal
+# points can't raise a math domain error
+def _haversine(lat1, lon1, lat2, lon2):
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    a = (math.sin((lat2_rad - lat1_rad) / 2)**2
+         + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin((math.radians(lon2) - math.radians(lon1)) / 2)**2)
+    return _EARTH_RADIUS_MILES * 2 * math.asin(math.sqrt(min(a, 1.0)))
+
+# a fixed origin point's coordinates in radians and its latitude's sine and cosine, precomputed once by _make_anchor()
+# for many distances from the same origin
+_AnchorTrig = namedtuple("_AnchorTrig", ["lat_r", "lon_r", "sin_lat", "cos_lat"])
+
+def _make_anchor(lat, lon):
+    lat_r = math.radians(lat)
+    return _AnchorTrig(lat_r, math.radians(lon), math.sin(lat_r), math.cos(lat_r))
+
+# the great-circle distance in miles from a precomputed origin (see _make_anchor()) to a point, as _haversine() with the
+# origin as the first point but without converting the origin or recomputing its cosine, the result matches _haversine()
+def _haversine_from_anchor(anchor, lat2, lon2):
+    lat2_rad = math.radians(lat2)
+    a = (math.sin((lat2_rad - anchor.lat_r) / 2)**2
+         + anchor.cos_lat * math.cos(lat2_rad) * math.sin((math.radians(lon2) - anchor.lon_r) / 2)**2)
+    return _EARTH_RADIUS_MILES * 2 * math.asin(math.sqrt(min(a, 1.0)))
+
+# the great-circle distances in miles between arrays of lat/long points as _haversine(), as one NumPy calculation (the
+# arguments broadcast, e.g. a column of sources against a row of targets gives a matrix of distances). Each step runs in
+# place in three scratch arrays of the broadcast shape (and one of the first latitudes' shape) rather than allocating a
+# temporary per operation, with the same formula and order of operations as _haversine(). The result
+# is written into out if given (a float64 array of the broadcast shape, so repeated calls can reuse one buffer, it is
+# also used as a scratch array), otherwise into the haversine term's own array
+def _haversine_vec(lat1, lon1, lat2, lon2, out=None):
+    shape = np.broadcast_shapes(np.shape(lat1), np.shape(lon1), np.shape(lat2), np.shape(lon2))
+    lat1_rad = np.radians(lat1, out=np.empty(np.shape(lat1)))
+    # the second latitudes in radians, then their cosines times the first latitudes' cosines
+    coslat = np.radians(lat2, out=np.empty(shape) if out is None else out)
+    # sin(dlat/2)**2
+    a = np.subtract(coslat, lat1_rad, out=np.empty(shape))
+    a *= 0.5
+    np.square(np.sin(a, out=a), out=a)
+    np.cos(coslat, out=coslat)
+    coslat *= np.cos(lat1_rad, out=lat1_rad)
+    # sin(dlon/2)**2, times the cosines
+    dlon = np.radians(lon2, out=np.empty(shape))
+    dlon -= np.radians(lon1)
+    dlon *= 0.5
+    np.square(np.sin(dlon, out=dlon), out=dlon)
+    dlon *= coslat
+    a += dlon
+    # 2R*asin(sqrt(a)), a clipped to 1
+    np.minimum(a, 1.0, out=a)
+    np.arcsin(np.sqrt(a, out=a), out=a)
+    return np.multiply(a, _EARTH_RADIUS_MILES * 2, out=a if out is None else out)
+
+# the lat/long point distance miles from a starting point on a bearing in degrees, returned as a (lat2, lon2) tuple
+def _haversine_newpoint(lat1, lon1, distance, bearing):
+    distance = distance / _EARTH_RADIUS_MILES
+    bearing = math.radians(bearing)
+    lat1 = math.radians(lat1)
+    lat2 = math.asin(math.sin(lat1) * math.cos(distance) + math.cos(lat1) * math.sin(distance) * math.cos(bearing))
+    lon2 = math.radians(lon1) + math.atan2(math.sin(bearing) * math.sin(distance) * math.cos(lat1),
+                                           math.cos(distance) - math.sin(lat1) * math.sin(lat2))
+    return (math.degrees(lat2), math.degrees(lon2))
+
+# the new points for arrays of starting points, distances and bearings as _haversine_newpoint(), as one NumPy calculation
+# (the arguments broadcast, e.g. one starting point and distance against an array of bearings), returned as a tuple of
+# (lat2, lon2) arrays, with the shared sines and cosines computed once
+def _haversine_newpoint_vec(lat1, lon1, distance, bearing):
+    distance = np.asarray(distance, dtype=np.float64) / _EARTH_RADIUS_MILES
+    bearing = np.radians(bearing)
+    lat1 = np.radians(lat1)
+    sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+    sin_d, cos_d = np.sin(distance), np.cos(distance)
+    sin_lat2 = sin_lat1 * cos_d + cos_lat1 * sin_d * np.cos(bearing)
+    lat2 = np.arcsin(sin_lat2)
+    lon2 = np.radians(lon1) + np.arctan2(np.sin(bearing) * sin_d * cos_lat1, cos_d - sin_lat1 * sin_lat2)
+    return (np.degrees(lat2), np.degrees(lon2))
@@ -17,12 +17,14 @@ Version: 0.0.1 Pre-Alpha
 """
 
 import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgb
 from matplotlib.path import Path
 from matplotlib.patches import Circle, Ellipse
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection, PatchCollection
 
 import numpy as np
-from scipy.spatial import ConvexHull
+from scipy.spatial import ConvexHull, KDTree
 
 from cartopy.io.img_tiles import OSM
 from cartopy.io.img_tiles import GoogleTiles
@@ -32,6 +34,114 @@ import cartopy.feature as cfeature
 import pandas as pd
 
 import math
+import functools
+
+from relocation_impact_analyzer.geodesy import (_EARTH_RADIUS_MILES, _haversine, _haversine_vec, _haversine_newpoint, 
+                                                 _haversine_newpoint_vec, _make_anchor)
+
+
+# the lat/long coordinate system of all the plotted data, created once and shared by every transform
+_PLATE_CARREE = ccrs.PlateCarree()
+
+# scatter the 'latitude'/'longitude' points of data (a DataFrame or a mapping of arrays) as one collection, passing the
+# coordinates to matplotlib as plain float arrays
+def _scatter_points(ax, data, **kwargs):
+    ax.scatter(np.asarray(data['longitude'], dtype=np.float64), np.asarray(data['latitude'], dtype=np.float64), 
+               transform=_PLATE_CARREE, **kwargs)
+
+# plot_addresses draws more points than this as an aggregated raster (plot_addresses_agg) rather than a marker each
+_AGGREGATE_POINTS = 20000
+
+# get_heatmap bins more points than this into its grid of cells before triangulating them
+_HEATMAP_BIN_POINTS = 10000
+
+# background imagery tile sources by configure_map_plot imagery name, created once per process and shared by every map
+# view. The tiles are cached on disk (cartopy's cache directory) so overlapping views don't download them again, and the
+# most recently used decoded tiles are also kept in memory so they aren't reloaded for each view
+_IMAGERY_SOURCES = {"OSM": lambda: OSM(cache=True),
+                    "Google": lambda: GoogleTiles(cache=True),
+                    "GoogleSatellite": lambda: GoogleTiles(style='satellite', cache=True)}
+_IMAGERY = {}
+def _imagery(name):
+    if name not in _IMAGERY_SOURCES:
+        name = "OSM"
+    if name not in _IMAGERY:
+        imagery = _IMAGERY_SOURCES[name]()
+        imagery.get_image = functools.lru_cache(maxsize=256)(imagery.get_image)
+        _IMAGERY[name] = imagery
+    return _IMAGERY[name]
+
+# pack coordinates into one int64 key of their integer microdegrees (latitude in the high 32 bits, longitude in the low
+# 32 bits), so coordinate lookups hash and compare integers rather than floats, and coordinates that went through a
+# float conversion still match as long as they agree to the microdegree (the precision they are stored at); the analyzer
+# uses the same keys for its cost lookups
+def _latlong_key(lat, long):
+    lat_i = np.round(np.asarray(lat, dtype=np.float64) * 1_000_000).astype(np.int64)
+    long_i = np.round(np.asarray(long, dtype=np.float64) * 1_000_000).astype(np.int64)
+    return (lat_i << 32) | (long_i & 0xffffffff)
+
+# the unit vectors of lat/long points on the sphere, as an (n, 3) array, so the nearest point by straight-line (chord)
+# distance between them is the nearest by great-circle distance, and the nearest to a point's antipode (its negated 
+# vector) is the farthest from it
+def _unit_vectors(lat, long):
+    lat = np.radians(lat)
+    long = np.radians(long)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(long), cos_lat * np.sin(long), np.sin(lat)))
+
+# the haversine distances in miles from each lat/long point to its nearest and its farthest target, looping over the 
+# (few) targets with a running minimum and maximum of the haversine term a, so memory stays one array per point rather 
+# than a (points, targets) matrix, and as the distance only grows with a it is converted to miles once per point at the 
+# end (the same operations as geodesy._haversine_vec, so the distances match it exactly), each target's radians and 
+# cosine are precomputed once as an anchor (see geodesy._make_anchor) for its pass over all the points
+def _nearest_farthest(lat, long, target_lat, target_long):
+    lat_rad = np.radians(lat)
+    long_rad = np.radians(long)
+    cos_lat = np.cos(lat_rad)
+    a_min = np.full(len(lat_rad), np.inf)
+    a_max = np.full(len(lat_rad), -np.inf)
+    for anchor in map(_make_anchor, target_lat, target_long):
+        a = np.sin((anchor.lat_r - lat_rad) / 2)**2 + cos_lat * anchor.cos_lat * np.sin((anchor.lon_r - long_rad) / 2)**2
+        np.minimum(a_min, a, out=a_min)
+        np.maximum(a_max, a, out=a_max)
+    def miles(a):
+        with np.errstate(invalid='ignore'):
+            return np.where(np.isinf(a), a, _EARTH_RADIUS_MILES * 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0))))
+    return miles(a_min), miles(a_max)
+
+# the tile zoom level for a map width_deg degrees wide drawn width_px pixels wide, memoized as the same map extents and
+# figure sizes come back for each job's plots
+@functools.lru_cache(maxsize=256)
+def _zoom_level(width_deg, width_px, tile_service_resolution):
+    # This formula is an approximation and might need adjustment for your specific needs
+    zoom_level = math.log2((360 * width_px) / (width_deg * tile_service_resolution))
+    return max(0, min(round(zoom_level), 19))  # Ensure zoom level is within a valid range
+
+# masks of the sources with a commute_data row to any of the targets whose value in column is within limit (inside) or
+# outside it, one per entry of sides, matching the origin/destination lat/long pairs by their _latlong_key() with one 
+# hashed pass over the commute rows rather than a boolean mask over all of commute_data for each source and target pair
+def _commute_masks(sources, targets, commute_data, column, limit, sides):
+    values = commute_data[column].to_numpy()
+    to_targets = pd.Index(_latlong_key(commute_data['destination_lat'], commute_data['destination_long'])).isin(
+                     _latlong_key(targets['latitude'], targets['longitude']))
+    origins = _latlong_key(commute_data['origin_lat'], commute_data['origin_long'])
+    points = pd.Index(_latlong_key(sources['latitude'], sources['longitude']))
+    return tuple(points.isin(origins[to_targets & ((values <= limit) if inside else (values > limit))]) for inside in sides)
+
+# bin points into a grid of (nx, ny) cells over their extent, returning the centroid longitude/latitude and the mean 
+# value of each cell with points, in one weighted histogram pass per array, so a heatmap triangulates at most one point 
+# per cell however many points there are
+def _bin_means(lon, lat, values, grid):
+    counts, lon_edges, lat_edges = np.histogram2d(lon, lat, bins=grid)
+    filled = counts > 0
+    def mean(weights):
+        return np.histogram2d(lon, lat, bins=(lon_edges, lat_edges), weights=weights)[0][filled] / counts[filled]
+    return mean(lon), mean(lat), mean(values)
+
+# the lat/long points of sources selected by mask, as a new frame of just those two columns, taken straight from sources
+# by the mask rather than built up row by row
+def _masked_points(sources, mask):
+    return sources.loc[np.asarray(mask, dtype=bool), ['latitude', 'longitude']].reset_index(drop=True).astype(np.float64, copy=False)
 
 
 class Graphing:
@@ -39,54 +149,85 @@ class Graphing:
         """
         Initializes the Graphing class instance.
         """
-        pass  
-
-    def configure_map_plot(self, latitudes, longitudes, imagery="OSM", padding=0.03):
+        # map view figures and axes by (imagery, figsize), reused by configure_map_plot while they are left open
+        self._fig_pool = {}
+        # the (sources, targets, distances) of the last get_radius_distances call
+        self._radius_distances = None
+        # the (emp, office, commute_data, rows) of the last get_commute_values call
+        self._commute_rows = None
+
+    def configure_map_plot(self, latitudes, longitudes, imagery="OSM", padding=0.03, figsize=(15, 10)):
         """
         Configures a map plot with specified latitudes and longitudes and an optional background imagery source.
 
+        The figure is kept for reuse: if the caller leaves it open (saving it rather than closing it with plt.close()), the 
+        next map view with the same imagery and figsize clears and redraws it instead of creating a new figure and cartopy 
+        axes. Call release_figure() to close the kept figures.
+
         Args:
-            latitudes (list): A list of latitude coordinates for plotting.
-            longitudes (list): A list of longitude coordinates for plotting.
+            latitudes (list): A list of latitude coordinates for plotting (only their range is used, so the [min, max] pair 
+            from plot_preamble is enough).
+            longitudes (list): A list of longitude coordinates for plotting (as latitudes).
             imagery (str, optional): The background imagery source. Options include "OSM" (default), "Google", and "GoogleSatellite".
             padding (float, optional): Padding around the coordinate extents to ensure all points are visible on the map.
+            figsize (tuple, optional): Figure size. Defaults to (15, 10).
 
         Returns:
             tuple: A tuple containing the figure and axis objects of the map plot.
         """
         # configure the map plot
-        if imagery == "OSM":
-            # use OpenStreetMap as the background map
-            imagery = OSM()
-        elif imagery == "Google":
-            # alternatively, use GoogleTiles() for a satellite map
-            imagery = GoogleTiles()
-        elif imagery == "GoogleSatellite":
-            # alternatively, use GoogleTiles() for a satellite map
-            imagery = GoogleTiles(style='satellite')
+        # use OpenStreetMap as the background map, or alternatively Google's street or satellite tiles (unknown names use
+        # OpenStreetMap), the shared tile source caches its tiles across map views
+        key = (imagery, tuple(figsize))
+        imagery = _imagery(imagery)
+
+        fig, ax = self._fig_pool.get(key, (None, None))
+        if fig is not None and plt.fignum_exists(fig.number):
+            # reuse the figure, removing any axes added to it (e.g. a colorbar) and clearing the map, and make it current for
+            # the plt calls in the caller
+            for each in fig.axes:
+                if each is not ax:
+                    each.remove()
+            ax.clear()
+            # GeoAxes.clear() leaves the last view's tile source and its drawn flag, which would stop add_image() below
+            # from adding this view's tiles, reset them as a new GeoAxes has them
+            ax.img_factories = []
+            ax._done_img_factory = False
+            plt.figure(fig.number)
         else:
-            imagery = OSM()
-
-        # set figure size for readability
-        fig, ax = plt.subplots(figsize=(15, 10), subplot_kw={'projection': imagery.crs})
+            # set figure size for readability, laying out with the constrained layout engine as the figure is drawn
+            fig, ax = plt.subplots(figsize=figsize, subplot_kw={'projection': imagery.crs}, layout='constrained')
+            self._fig_pool[key] = (fig, ax)
         
-        # set the extent of the map to include all the points plus a little extra
-        lat_delta = abs((max(latitudes) - min(latitudes)) * padding)
-        long_delta = abs((max(longitudes) - min(longitudes)) * padding)
-        min_max = [min(longitudes)-long_delta, max(longitudes)+long_delta,min(latitudes)-lat_delta, max(latitudes)+lat_delta]
+        # set the extent of the map to include all the points plus a little extra (each range is found once, as numpy reductions)
+        lat_min, lat_max = np.min(latitudes), np.max(latitudes)
+        long_min, long_max = np.min(longitudes), np.max(longitudes)
+        lat_delta = abs((lat_max - lat_min) * padding)
+        long_delta = abs((long_max - long_min) * padding)
+        min_max = [long_min-long_delta, long_max+long_delta, lat_min-lat_delta, lat_max+lat_delta]
         ax.set_extent(min_max)
 
         # Add the imagery to the map at an automatically-chosen zoom level
-        ax.add_image(imagery, self.calculate_zoom_level(ax), cmap='gray')
+        ax.add_image(imagery, self.calculate_zoom_level(ax, fig=fig), cmap='gray')
         return fig, ax
 
+    def release_figure(self):
+        """
+        Closes the map view figures kept for reuse by configure_map_plot.
+        """
+        for fig, _ in self._fig_pool.values():
+            plt.close(fig)
+        self._fig_pool.clear()
+
     def plot_addresses(self, ax, data, color='red', label=None, s=10, alpha=1.0, linestyle='', marker='o'):
         """
         Plots address points on the map.
 
         Args:
             ax: The matplotlib axes object on which to plot.
-            data (DataFrame): The data containing 'latitude' and 'longitude' columns for the points to plot.
+            data (DataFrame): The data containing 'latitude' and 'longitude' columns for the points to plot (a mapping of 
+            'latitude' and 'longitude' arrays also works). Each call draws one scatter collection, so group points 
+            by color and call once per color.
             color (str, optional): The color of the points. Defaults to 'red'.
             label (str, optional): Label for the points. Defaults to None.
             s (int, optional): Size of the points. Defaults to 10.
@@ -94,8 +235,46 @@ class Graphing:
             linestyle (str, optional): Style of the point lines. Defaults to '' (solid).
             marker (str, optional): Shape of the points. Defaults to 'o' (circle).
         """
-        # plot the lat long points
-        ax.scatter(data['longitude'], data['latitude'], color=color, marker=marker, alpha=alpha, s=s, linestyle=linestyle, transform=ccrs.PlateCarree(), label=label)
+        # plot the lat long points, rasterized as the many address markers would otherwise be written one vector path each
+        # to a saved PDF/SVG (the offices, hull, ellipses and lines drawn over them stay vector)
+        # very large sets of points are aggregated to a raster instead, as generating a marker path per point dominates
+        if len(data['latitude']) > _AGGREGATE_POINTS:
+            self.plot_addresses_agg(ax, data, color=color, label=label, alpha=alpha, marker=marker)
+            return
+        _scatter_points(ax, data, color=color, marker=marker, alpha=alpha, s=s, linestyle=linestyle, label=label, 
+                        rasterized=True)
+
+    def plot_addresses_agg(self, ax, data, color='red', label=None, alpha=1.0, marker='o'):
+        """
+        Plots address points on the map as an aggregated raster, one pixel per screen pixel of the axes colored by the 
+        number of points in it, rather than a marker per point (plot_addresses does this for very large sets of points).
+
+        Args:
+            ax: The matplotlib axes object on which to plot, with its extent already set.
+            data (DataFrame): The data containing 'latitude' and 'longitude' columns for the points to plot (a mapping of 
+            'latitude' and 'longitude' arrays also works).
+            color (str, optional): The color of the points. Defaults to 'red'.
+            label (str, optional): Label for the points. Defaults to None.
+            alpha (float, optional): Transparency of the most dense pixels. Defaults to 1.0.
+            marker (str, optional): Shape of the points in the legend. Defaults to 'o' (circle).
+        """
+        # count the points in each pixel of the axes' lat/long extent in one histogram pass
+        x0, x1, y0, y1 = ax.get_extent(_PLATE_CARREE)
+        window = ax.get_window_extent()
+        width, height = max(1, int(window.width)), max(1, int(window.height))
+        counts, _, _ = np.histogram2d(np.asarray(data['latitude'], dtype=np.float64), 
+                                      np.asarray(data['longitude'], dtype=np.float64),
+                                      bins=(height, width), range=((y0, y1), (x0, x1)))
+        
+        # shade the pixels with points in the color, log scaling their opacity by count so sparse points stay visible
+        shade = np.zeros((height, width, 4))
+        shade[..., :3] = to_rgb(color)
+        if counts.max() > 0:
+            shade[..., 3] = np.where(counts > 0, alpha * (0.25 + 0.75 * np.log1p(counts) / np.log1p(counts.max())), 0.0)
+        ax.imshow(shade, extent=(x0, x1, y0, y1), origin='lower', interpolation='nearest', transform=_PLATE_CARREE, zorder=2)
+        
+        # an empty scatter carries the legend entry, as the image has none
+        ax.scatter([], [], color=color, marker=marker, alpha=alpha, label=label)
 
     def plot_offices(self, ax, data, color='black', label=None, s=100, alpha=1.0, linestyle='', marker='*'):
         """
@@ -103,7 +282,8 @@ class Graphing:
 
         Args:
             ax: The matplotlib axes object on which to plot.
-            data (DataFrame): The data containing 'latitude' and 'longitude' columns for the points to plot.
+            data (DataFrame): The data containing 'latitude' and 'longitude' columns for the points to plot (a mapping of 
+            'latitude' and 'longitude' arrays also works).
             color (str, optional): The color of the points. Defaults to 'black'.
             label (str, optional): Label for the points. Defaults to None.
             s (int, optional): Size of the points. Defaults to 100.
@@ -112,7 +292,7 @@ class Graphing:
             marker (str, optional): Shape of the points. Defaults to '*' (star).
         """
         # plot the lat long points
-        ax.scatter(data['longitude'], data['latitude'], color=color, marker=marker, alpha=alpha, s=s, linestyle=linestyle, transform=ccrs.PlateCarree(), label=label)
+        _scatter_points(ax, data, color=color, marker=marker, alpha=alpha, s=s, linestyle=linestyle, label=label)
         
     def add_scalebar(self, ax, location=(0.05, 0.05), font_mod=1):
         """
@@ -126,75 +306,72 @@ class Graphing:
 
         # add a scale bar
         # first get the extent of the map
-        x0, x1, y0, y1 = ax.get_extent(ccrs.PlateCarree())
+        x0, x1, y0, y1 = ax.get_extent(_PLATE_CARREE)
         
-        # calculate the width of the x axis in miles
+        # calculate the width of the x axis in miles (the bar length is a quarter of its order of magnitude)
         xd = self.haversine(y0, x0, y1, x0)
-        yd = self.haversine(x0, x0, y1, x1)
         
         order = self.round_to_nearest_order_of_magnitude(xd)
         bar = order/4.0
         
-        np=self.haversine_newpoint(y0, x0, bar, 90)
-        # now we create a tuple of long/lats for the scalebar
-        scalebar = ([x0, np[1]], [y0, y0])
-        # now, adjust the coordinates of the scalebar for proper chart placement, up location[0]% and right location[1]%
-        scalebar = ([x0 + (x1-x0)*location[0], np[1] + (x1-x0)*location[0]], [y0 + (y1-y0)*location[1], y0 + (y1-y0)*location[1]])
-        # now we create end bars for the scale bar using scalebar as the source coordinates.
-        # end bars are positioned one at each end of the scalebar, centered vertically on the scalebar, and total height being 2% of y axis
-        scalebar_end = ([scalebar[0][0], scalebar[0][0]], [scalebar[1][0] - (y1-y0)*0.01, scalebar[1][0] + (y1-y0)*0.01])
-        scalebar_end2 = ([scalebar[0][1], scalebar[0][1]], [scalebar[1][0] - (y1-y0)*0.01, scalebar[1][0] + (y1-y0)*0.01])
+        bar_end = self.haversine_newpoint(y0, x0, bar, 90)[1]
+        # now, place the scalebar in long/lat up location[1]% and right location[0]% of the axes, with end bars centered 
+        # vertically on each end of it, total height being 2% of y axis
+        xa = x0 + (x1-x0)*location[0]
+        xb = bar_end + (x1-x0)*location[0]
+        y = y0 + (y1-y0)*location[1]
+        h = (y1-y0)*0.01
         # now we put a text label on the scale bar indicating the number of miles shown (bar).  Center the lable on the scalebar
-        ax.text((scalebar[0][0]+scalebar[0][1])/2, scalebar[1][0] - (y1-y0)*0.01, str(bar) + ' miles', 
-                horizontalalignment='center', verticalalignment='top', transform=ccrs.PlateCarree(), fontsize=10*font_mod)
+        ax.text((xa+xb)/2, y - h, str(bar) + ' miles', 
+                horizontalalignment='center', verticalalignment='top', transform=_PLATE_CARREE, fontsize=10*font_mod)
 
-        # draw a scale bar
-        ax.plot(scalebar[0],scalebar[1], transform=ccrs.PlateCarree(), color='black', linewidth=2)
-        ax.plot(scalebar_end[0],scalebar_end[1], transform=ccrs.PlateCarree(), color='black', linewidth=2)
-        ax.plot(scalebar_end2[0],scalebar_end2[1], transform=ccrs.PlateCarree(), color='black', linewidth=2)
+        # draw the scale bar and its end bars as one collection of (3, 2, 2) segments rather than a line artist each
+        segments = np.array([[[xa, y], [xb, y]],
+                             [[xa, y - h], [xa, y + h]],
+                             [[xb, y - h], [xb, y + h]]])
+        ax.add_collection(LineCollection(segments, colors='black', linewidths=2, transform=_PLATE_CARREE), autolim=False)
 
     def round_to_nearest_order_of_magnitude(self,number):
         """
-        Rounds a number to the nearest order of magnitude.
+        Rounds a number (or each number in an array) to the nearest order of magnitude.
 
         Args:
-            number (float): The number to round.
+            number (float or array-like): The number(s) to round.
 
         Returns:
-            float: The rounded number.
+            float or numpy.ndarray: The rounded number(s).
         """
 
         # Calculate the order of magnitude of the number
-        order_of_magnitude = 10 ** math.floor(math.log10(abs(number)))
-        # Normalize the number to a value between 1 and 10 and round it
-        rounded_normalized_number = round(number / order_of_magnitude)
+        order_of_magnitude = 10.0 ** np.floor(np.log10(np.abs(number)))
+        # Normalize the number to a value between 1 and 10 and round it (half to even, as round() does)
+        rounded_normalized_number = np.round(np.divide(number, order_of_magnitude))
         # Multiply back by the order of magnitude to get the rounded number
-        return rounded_normalized_number * order_of_magnitude
+        rounded = rounded_normalized_number * order_of_magnitude
+        return float(rounded) if np.ndim(rounded) == 0 else rounded
         
-    def calculate_zoom_level(self, ax, tile_service_resolution=256):
+    def calculate_zoom_level(self, ax, tile_service_resolution=256, fig=None):
         """
         Calculate an appropriate zoom level for a Cartopy axis based on its extent.
         
         Args:
         - ax: The Cartopy GeoAxes object.
         - tile_service_resolution: The resolution of the tile service (256 for most web services).
+        - fig: The figure the axis is drawn in (defaults to ax.figure, rather than pyplot's current figure).
         
         Returns:
         - An integer zoom level.
         """
         # Get the extent of the axis and calculate the width in degrees
-        extent = ax.get_extent(ccrs.PlateCarree())
+        extent = ax.get_extent(_PLATE_CARREE)
         width_deg = extent[1] - extent[0]
         
         # Estimate the width of the plot in pixels
-        fig = plt.gcf()
+        if fig is None:
+            fig = ax.figure
         width_in_pixels = fig.get_dpi() * fig.get_size_inches()[0]
         
-        # Calculate the zoom level
-        # This formula is an approximation and might need adjustment for your specific needs
-        zoom_level = math.log2((360 * width_in_pixels) / (width_deg * tile_service_resolution))
-        
-        return max(0, min(round(zoom_level), 19))  # Ensure zoom level is within a valid range
+        return _zoom_level(width_deg, width_in_pixels, tile_service_resolution)
     
     def filter_radius(self,sources, targets, radius, inside=True):
         """
@@ -211,20 +388,70 @@ class Graphing:
             DataFrame: A DataFrame of filtered source points that meet the radius criteria.
         """
 
-        # check if the lat/long pair is within radius of any of the targets.
+        # check if each lat/long pair is within radius of any of the targets.
         # offices is a pandas dataframe with columns latitude and longitude, and each row represents a cetnered target location
-        # return true if the lat/long pair is within radius of any of the offices, otherwise return false (vice versa for outside)
-        def check_r(lat, lon, targets, radius, inside=True):
-            for index, row in targets.iterrows():
-                if inside:
-                    if self.haversine(lat, lon, row['latitude'], row['longitude']) <= radius:
-                        return True
-                elif not inside:
-                    if self.haversine(lat, lon, row['latitude'], row['longitude']) > radius:
-                        return True
-            return False
-        return pd.DataFrame([{'latitude': lat, 'longitude': lon} for lat, lon in zip(sources['latitude'], sources['longitude']) 
-                                if check_r(lat, lon, targets, radius, inside=inside)])
+        nearest, farthest = self.get_radius_distances(sources, targets)
+        return _masked_points(sources, (nearest <= radius) if inside else (farthest > radius))
+
+    def filter_radius_mask(self, sources, targets, radius):
+        """
+        Finds the source points inside and outside a radius of target points in one pass, as filter_radius does for one 
+        of them, so both sets can be selected from the same distances.
+
+        Args:
+            sources (DataFrame): A DataFrame containing source points with 'latitude' and 'longitude' columns.
+            targets (DataFrame): A DataFrame containing target points with 'latitude' and 'longitude' columns.
+            radius (float): The radius to check source points against, in miles.
+
+        Returns:
+            tuple: A tuple of boolean numpy.ndarrays (inside, outside) aligned with the rows of sources. A source is inside 
+            if it is within radius of any of the targets, and outside if it is beyond radius of any of them (with more than 
+            one target a source may be both).
+        """
+
+        # keep the lat/long pair if it is within radius of any of the offices, its nearest office (vice versa for outside, 
+        # its farthest office)
+        nearest, farthest = self.get_radius_distances(sources, targets)
+        return nearest <= radius, farthest > radius
+
+    def get_radius_distances(self, sources, targets):
+        """
+        Calculates the distances from each source point to its nearest and its farthest target point, which decide whether 
+        it is inside or outside a radius of any of the targets. The distances for the last sources and targets are kept, so
+        filtering the same points inside and then outside a radius (as get_map_view does) calculates them once.
+
+        Args:
+            sources (DataFrame): A DataFrame containing source points with 'latitude' and 'longitude' columns.
+            targets (DataFrame): A DataFrame containing target points with 'latitude' and 'longitude' columns.
+
+        Returns:
+            tuple: A tuple of numpy.ndarrays (nearest, farthest) of the distances in miles, one per source point (inf and -inf
+            when there are no targets).
+        """
+
+        last = self._radius_distances
+        if last is not None and last[0] is sources and last[1] is targets:
+            return last[2]
+
+        lat = sources['latitude'].to_numpy(dtype=np.float64)
+        lon = sources['longitude'].to_numpy(dtype=np.float64)
+        target_lat = targets['latitude'].to_numpy(dtype=np.float64)
+        target_lon = targets['longitude'].to_numpy(dtype=np.float64)
+        if len(target_lat) < 8:
+            # for a few targets the distances from every source to each target are calculated in turn, keeping the 
+            # nearest and farthest
+            distances = _nearest_farthest(lat, lon, target_lat, target_lon)
+        else:
+            # otherwise only the distances to the nearest and the farthest target are calculated, found for all the sources 
+            # with a KD-tree over the targets' unit vectors rather than by the whole matrix
+            points = _unit_vectors(lat, lon)
+            tree = KDTree(_unit_vectors(target_lat, target_lon))
+            _, nearest = tree.query(points)
+            _, farthest = tree.query(-points)
+            distances = (self.haversine_vec(lat, lon, target_lat[nearest], target_lon[nearest]),
+                         self.haversine_vec(lat, lon, target_lat[farthest], target_lon[farthest]))
+        self._radius_distances = (sources, targets, distances)
+        return distances
 
 
     def filter_drive_distance(self, sources, targets, radius, commute_data, inside=True):
@@ -244,24 +471,28 @@ class Graphing:
         """
 
         # employee address maps to source, office address maps to destination
-        # for each office, check if the lat/long pair is within radius of any of the offices based upon actual driving distance
-        def check_d(lat, lon, targets, radius, commute_data, inside=True):
-            for index, row in targets.iterrows():
-                # get the rows from commute_data that have the office address as the destination and lat long pair as the source
-                filtered_data = commute_data[
-                                    (commute_data['origin_lat'] == lat) &
-                                    (commute_data['origin_long'] == lon) &
-                                    (commute_data['destination_lat'] ==row['latitude']) &
-                                    (commute_data['destination_long'] == row['longitude'])
-                                ]
-                for index2, row2 in filtered_data.iterrows():
-                    if inside and row2['miles'] <= radius:
-                        return True
-                    elif not inside and row2['miles'] > radius:
-                        return True
-            return False
-        return pd.DataFrame([{'latitude': lat, 'longitude': lon} for lat, lon in zip(sources['latitude'], sources['longitude'])
-                                if check_d(lat, lon, targets, radius, commute_data, inside=inside)])
+        # check if each lat/long pair is within radius of any of the offices based upon actual driving distance
+        return _masked_points(sources, _commute_masks(sources, targets, commute_data, 'miles', radius, (inside,))[0])
+
+    def filter_drive_distance_mask(self, sources, targets, radius, commute_data):
+        """
+        Finds the source points inside and outside a driving distance of target points in one pass, as 
+        filter_drive_distance does for one of them, so both sets can be selected from the same commute data lookup.
+
+        Args:
+            sources (DataFrame): A DataFrame containing source points with 'latitude' and 'longitude' columns.
+            targets (DataFrame): A DataFrame containing target points with 'latitude' and 'longitude' columns.
+            radius (float): The driving distance to check source points against, in miles.
+            commute_data (DataFrame): A DataFrame containing commute data between source and target points.
+
+        Returns:
+            tuple: A tuple of boolean numpy.ndarrays (inside, outside) aligned with the rows of sources. A source is inside 
+            if its drive to any of the targets is within radius, and outside if its drive to any of them is beyond it (with 
+            more than one target a source may be both).
+        """
+
+        # employee address maps to source, office address maps to destination
+        return _commute_masks(sources, targets, commute_data, 'miles', radius, (True, False))
     
     def filter_drive_time(self, sources, targets, minutes, commute_data, inside=True):
         """
@@ -278,23 +509,9 @@ class Graphing:
             DataFrame: A DataFrame of filtered source points that meet the driving time criteria.
         """
 
-        def check_t(lat, long, targets, minutes, commute_data, inside=True):
-            for index, row in targets.iterrows():
-                # get the rows from commute_data that have the office address as the destination and lat long pair as the source
-                filtered_data = commute_data[
-                                    (commute_data['origin_lat'] == lat) &
-                                    (commute_data['origin_long'] == long) &
-                                    (commute_data['destination_lat'] ==row['latitude']) &
-                                    (commute_data['destination_long'] == row['longitude'])
-                                ]
-                for index2, row2 in filtered_data.iterrows():
-                    if inside and row2['m_morning_duration_in_traffic'] <= minutes:
-                        return True
-                    elif not inside and row2['m_morning_duration_in_traffic'] > minutes:
-                        return True
-            return False
-        return pd.DataFrame([{'latitude': lat, 'longitude': long} for lat, long in zip(sources['latitude'], sources['longitude'])
-                                if check_t(lat, long, targets, minutes, commute_data, inside=inside)])
+        # check if each lat/long pair is within the driving time of any of the offices (monday morning's time in traffic)
+        return _masked_points(sources, _commute_masks(sources, targets, commute_data, 'm_morning_duration_in_traffic', minutes, 
+                                                      (inside,))[0])
                             
     def get_common_points(self, set1, set2):
         """
@@ -322,8 +539,10 @@ class Graphing:
             DataFrame: A DataFrame of unique points in the first set.
         """
 
-        # find the unique points in the first set
-        return set1[~set1.isin(set2)].dropna()
+        # find the unique points in the first set, the rows whose lat/long pair (by _latlong_key()) isn't in the second set
+        # (DataFrame.isin(DataFrame) would compare the sets element-wise by aligned index, not by row membership)
+        points = pd.Index(_latlong_key(set1['latitude'], set1['longitude']))
+        return set1[~points.isin(_latlong_key(set2['latitude'], set2['longitude']))]
     
     def haversine(self,lat1, lon1, lat2, lon2):
         """
@@ -338,36 +557,25 @@ class Graphing:
         Returns:
             float: The distance between the two points in miles.
         """
+        return _haversine(lat1, lon1, lat2, lon2)
+    
+    def haversine_vec(self, lat1, lon1, lat2, lon2):
+        """
+        Calculates the great-circle distances between arrays of points using the Haversine formula, as haversine does for 
+        one pair of points but as one vectorized NumPy calculation (the arrays broadcast, e.g. a column of sources 
+        against a row of targets gives a matrix of distances).
 
-        #To calculate the distance between two latitude/longitude coordinates while taking the curvature of the Earth into account, 
-        #you use the Haversine formula. This formula gives you the great-circle distance between two points on the surface of a sphere, 
-        #given their longitudes and latitudes. This is particularly useful for calculating the approximate distance between two points 
-        #on the Earth."
-
-        # Radius of the Earth in miles
-        R = 3958.8
-        # Radius of the Earth in kilometers (uncomment to use kilometers)
-        #R = 6371.0
-
-        # Convert latitude and longitude from degrees to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-
-        # Difference in coordinates
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-
-        # Haversine formula
-        a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        Args:
+            lat1 (array-like): Latitudes of the first points.
+            lon1 (array-like): Longitudes of the first points.
+            lat2 (array-like): Latitudes of the second points.
+            lon2 (array-like): Longitudes of the second points.
 
-        # Total distance in (units selected above)
-        distance = R * c
+        Returns:
+            numpy.ndarray: The distances between the points in miles.
+        """
+        return _haversine_vec(lat1, lon1, lat2, lon2)
 
-        return distance
-    
     # calcuate a new point given a distance and bearing from a starting point using haversine
     def haversine_newpoint(self,lat1, lon1, distance, bearing):
         """
@@ -382,24 +590,24 @@ class Graphing:
         Returns:
             tuple: A tuple (lat2, lon2) representing the latitude and longitude of the new point.
         """
+        return _haversine_newpoint(lat1, lon1, distance, bearing)
 
-        # convert distance to radians
-        distance = distance / 3958.8
-        # convert bearing to radians
-        bearing = math.radians(bearing)
-        # convert latitude to radians
-        lat1 = math.radians(lat1)
-        # convert longitude to radians
-        lon1 = math.radians(lon1)
-        # calculate the new latitude
-        lat2 = math.asin(math.sin(lat1) * math.cos(distance) + math.cos(lat1) * math.sin(distance) * math.cos(bearing))
-        # calculate the new longitude
-        lon2 = lon1 + math.atan2(math.sin(bearing) * math.sin(distance) * math.cos(lat1), math.cos(distance) - math.sin(lat1) * math.sin(lat2))
-        # convert latitude back to degrees
-        lat2 = math.degrees(lat2)
-        # convert longitude back to degrees
-        lon2 = math.degrees(lon2)
-        return (lat2, lon2)
+    def haversine_newpoint_vec(self, lat1, lon1, distance, bearing):
+        """
+        Calculates new points given distances and bearings from starting points using the Haversine formula, as 
+        haversine_newpoint does for one point but as one vectorized NumPy calculation (the arguments broadcast, e.g. one 
+        starting point and distance against an array of bearings).
+
+        Args:
+            lat1 (array-like): Latitudes of the starting points.
+            lon1 (array-like): Longitudes of the starting points.
+            distance (array-like): Distances from the starting points in miles.
+            bearing (array-like): Bearings in degrees from the starting points to the new points.
+
+        Returns:
+            tuple: A tuple of numpy.ndarrays (lat2, lon2) with the latitudes and longitudes of the new points.
+        """
+        return _haversine_newpoint_vec(lat1, lon1, distance, bearing)
 
     def plot_ellipses(self, ax, offices, commute_radius):
         """
@@ -413,18 +621,16 @@ class Graphing:
 
         # draw an ellipse around the office locations to represent the radius from each office (ellipse in thise OSM projection will be a circle)
         # note: this will be a jagged representation due to cartopy handling, better to use our own eline function
-        xcdelta = None
-        ycdelta = None
-        for index, row in offices.iterrows():
-            # if cdelta is None, calculate the circle radius using first set of lat long, and using haversine to calcuate a new point, then x0-x1
-            if ycdelta is None:
-                # calculate the circle radius using the first set of lat long
-                ycdelta = abs(row['latitude']-self.haversine_newpoint(row['latitude'], row['longitude'], commute_radius, 0)[0])
-                xcdelta = abs(row['longitude']-self.haversine_newpoint(row['latitude'], row['longitude'], commute_radius, 90)[1])
-
-            # calculate the ellipse around the office location
-            ellipse = Ellipse((row['longitude'], row['latitude']), 2*xcdelta, 2*ycdelta, color='blue', fill=False, label='Radius', transform=ccrs.PlateCarree(), zorder=10, )
-            ax.add_patch(ellipse)
+        # the ellipses are drawn as one collection rather than a patch artist each
+        # each office's half widths are its distance to the points commute_radius north (0) and east (90) of it, found for 
+        # all the offices in one vectorized calculation, as they grow with the office's latitude
+        lats = offices['latitude'].to_numpy(dtype=np.float64)
+        lons = offices['longitude'].to_numpy(dtype=np.float64)
+        newpoints = self.haversine_newpoint_vec(lats[:, None], lons[:, None], commute_radius, np.array([0.0, 90.0]))
+        ycdelta = np.abs(lats - newpoints[0][:, 0])
+        xcdelta = np.abs(lons - newpoints[1][:, 1])
+        ellipses = [Ellipse((lon, lat), 2*xd, 2*yd) for lat, lon, xd, yd in zip(lats, lons, xcdelta, ycdelta)]
+        ax.add_collection(PatchCollection(ellipses, facecolor='none', edgecolor='blue', label='Radius', transform=_PLATE_CARREE, zorder=10))
     
     def plot_elines(self, ax, targets, commute_radius, color='black', linestyle='--',linewidth=2):
         """
@@ -440,10 +646,10 @@ class Graphing:
 
         """
 
-        for index, row in targets.iterrows():
-            # plot an eline
-            elinex,eliney = self.create_eline(row['latitude'], row['longitude'], commute_radius)
-            ax.plot(elinex, eliney, color=color, transform=ccrs.PlateCarree(), label='New Line', linewidth=linewidth, linestyle=linestyle, marker='')
+        # create an eline for each target, and draw them all as one collection rather than a line artist each
+        elines = [np.column_stack(self.create_eline(lat, long, commute_radius)) for lat, long in zip(targets['latitude'], targets['longitude'])]
+        ax.add_collection(LineCollection(elines, colors=color, linestyles=linestyle, linewidths=linewidth, label='New Line', 
+                                         transform=_PLATE_CARREE), autolim=False)
 
     def create_eline(self, lat, long, r, step=10):
         """
@@ -460,13 +666,9 @@ class Graphing:
         """
 
         # start with the lat/long, and calculate a point r miles away at 0 degrees, then, repeat every step degrees until 360, inclusive
-        elinex = []
-        eliney = []
-        for i in range(0, 360+step, step):
-            np = self.haversine_newpoint(lat, long, r, i)
-            elinex.append(np[1])
-            eliney.append(np[0])
-        return [elinex, eliney]
+        # (all of the bearings at once)
+        eliney, elinex = self.haversine_newpoint_vec(lat, long, r, np.arange(0, 360+step, step))
+        return [elinex.tolist(), eliney.tolist()]
     
     def plot_convex_hull(self, ax, data, color='green', linestyle='--', linewidth=2, alpha=1):
         """
@@ -484,10 +686,12 @@ class Graphing:
         """
 
         # plot the convex hull of the employee addresses within the commute radius
-        hull = ConvexHull(data[['longitude', 'latitude']])
-        for simplex in hull.simplices:
-            ax.plot(data['longitude'].iloc[simplex], data['latitude'].iloc[simplex], linestyle=linestyle, 
-                     color=color, transform=ccrs.PlateCarree(), linewidth=linewidth, marker='', alpha=alpha) 
+        # the hull edges are drawn as one collection of (edges, 2, 2) segments rather than a line artist per edge
+        # (the points are made C-contiguous here, as Qhull needs them, rather than copied again inside ConvexHull)
+        points = np.ascontiguousarray(data[['longitude', 'latitude']].to_numpy(dtype=np.float64))
+        hull = ConvexHull(points)
+        ax.add_collection(LineCollection(points[hull.simplices], linestyles=linestyle, colors=color, transform=_PLATE_CARREE, 
+                                         linewidths=linewidth, alpha=alpha), autolim=False)
     
     
     def get_commute_values(self, emp, office, commute_data, values):
@@ -502,6 +706,8 @@ class Graphing:
 
         Returns:
             DataFrame: A DataFrame containing the extracted values for each employee location that matches the given office location. The DataFrame includes 'latitude' and 'longitude' of the employee locations and the specified `values`.
+            The matching commute_data rows for the last emp, office and commute_data are kept, so extracting other values for the 
+            same employees and office doesn't match them again (the returned DataFrame is always a new copy).
         """
 
          # Ensure the basic columns are always included
@@ -512,9 +718,18 @@ class Graphing:
         else:
             selected_columns = base_columns + [value for value in values if value not in base_columns]
         
-        return commute_data[(commute_data['destination_lat'] == office.iloc[0]['latitude']) & 
-                           (commute_data['destination_long'] == office.iloc[0]['longitude']) & 
-                            (commute_data['origin_lat'].isin(emp['latitude']) & commute_data['origin_long'].isin(emp['longitude']))][selected_columns].rename(columns={'origin_lat': 'latitude', 'origin_long': 'longitude'})
+        # the rows to the office are found first, then those whose origin lat/long pair is an employee's with one hashed
+        # lookup of their _latlong_key() over just those rows, and only the selected columns of them are copied
+        last = self._commute_rows
+        if last is not None and last[0] is emp and last[1] is office and last[2] is commute_data:
+            rows = last[3]
+        else:
+            at_office = np.flatnonzero((commute_data['destination_lat'].to_numpy() == office.iloc[0]['latitude']) & 
+                                       (commute_data['destination_long'].to_numpy() == office.iloc[0]['longitude']))
+            origins = pd.Index(_latlong_key(commute_data['origin_lat'].to_numpy()[at_office], commute_data['origin_long'].to_numpy()[at_office]))
+            rows = at_office[origins.isin(_latlong_key(emp['latitude'], emp['longitude']))]
+            self._commute_rows = (emp, office, commute_data, rows)
+        return commute_data.iloc[rows, commute_data.columns.get_indexer(selected_columns)].rename(columns={'origin_lat': 'latitude', 'origin_long': 'longitude'})
 
     
     def plot_preamble(self, emp, offices, cutoff_radius=None, cutoff_distance=None, commute_data=None):
@@ -529,9 +744,9 @@ class Graphing:
             commute_data (DataFrame): A DataFrame containing commute data between employee and office locations, required if `cutoff_distance` is specified.
             
         Returns:
-            tuple: A tuple containing the filtered employee DataFrame, and Series objects for latitudes and longitudes of all included 
-            locations (employees and offices combined). The filtered DataFrame only includes employees within the `cutoff_radius` from 
-            any office location if specified.
+            tuple: A tuple containing the filtered employee DataFrame, and [min, max] arrays of the latitudes and longitudes of all 
+            included locations (employees and offices combined), the bounding box for configure_map_plot. The filtered DataFrame only 
+            includes employees within the `cutoff_radius` from any office location if specified.
         """
 
         # we will use the haversine formula to calculate the distance between two lat/long pairs 
@@ -545,9 +760,11 @@ class Graphing:
             filtered_emp_points = emp
         
         # data is a pandas dataframe has coloumns latitude and longitude        
-        # append the office lat/longs to the employee lat/longs to get bounding box
-        latitudes = pd.concat([filtered_emp_points['latitude'], offices['latitude']])
-        longitudes = pd.concat([filtered_emp_points['longitude'], offices['longitude']])
+        # combine the employee and office lat/long ranges to get bounding box (nan-skipping, there may be no employees left)
+        latitudes = np.array([np.nanmin([filtered_emp_points['latitude'].min(), offices['latitude'].min()]),
+                              np.nanmax([filtered_emp_points['latitude'].max(), offices['latitude'].max()])])
+        longitudes = np.array([np.nanmin([filtered_emp_points['longitude'].min(), offices['longitude'].min()]),
+                               np.nanmax([filtered_emp_points['longitude'].max(), offices['longitude'].max()])])
         return filtered_emp_points, latitudes, longitudes
     
     ############################################################################################################
@@ -604,8 +821,10 @@ class Graphing:
         elif commute_color and commute_data is None:
             # plot the lat long points with color based on if the employee is within the linear radius of any of the offices
             # first create two new data frames for the employees within and outside the linear radius, and populate them with the appropriate lat/long pairs
-            emp_within = self.filter_radius(filtered_emp_points, offices, commute_radius)
-            emp_outside = self.filter_radius(filtered_emp_points, offices, commute_radius, inside=False)
+            # (both selected from one pass over the distances)
+            within, outside = self.filter_radius_mask(filtered_emp_points, offices, commute_radius)
+            emp_within = _masked_points(filtered_emp_points, within)
+            emp_outside = _masked_points(filtered_emp_points, outside)
             # plot the lat long points
             if not emp_within.empty:
                 self.plot_addresses(ax, emp_within, color=color_e_in, label=e_label +' \nWithin ' + str(commute_radius) + ' Mile Radius', s=size_e)
@@ -614,9 +833,11 @@ class Graphing:
             self.plot_offices(ax, offices, s=size_o, color=color_o, label=o_label)
             
         elif commute_color and commute_data is not None:
-            # use the commute data to use actual driving distance to color the data points
-            emp_within = self.filter_drive_distance(filtered_emp_points, offices, commute_radius, commute_data)
-            emp_outside = self.filter_drive_distance(filtered_emp_points, offices, commute_radius, commute_data, inside=False)
+            # use the commute data to use actual driving distance to color the data points (both sets selected from one 
+            # pass over the commute data)
+            within, outside = self.filter_drive_distance_mask(filtered_emp_points, offices, commute_radius, commute_data)
+            emp_within = _masked_points(filtered_emp_points, within)
+            emp_outside = _masked_points(filtered_emp_points, outside)
             # plot the lat long points
             if not emp_within.empty:
                 self.plot_addresses(ax, emp_within, s=size_e ,color=color_e_in, label=e_label + ' \n' + str(u'\N{LESS-THAN OR EQUAL TO}') + ' ' + str(commute_radius) + ' Mile Drive')
@@ -686,7 +907,7 @@ class Graphing:
     def get_heatmap(self, emp, office, commute_data, value, title=None, value_label='', cutoff_radius=None, cutoff_distance=None,
                     commute_radius=None, convex_hull=False, plot_points=False, imagery="OSM", cmap='jet', 
                     size_e=10, size_o=200, color_o='black', color_e_in='green', color_e_out='red', o_label='Potential Office \nLocations', 
-                    e_label='Employee Addresses', manual_plot=False, alpha=0.5, levels=10, font_mod=1, figsize=(15, 15)):
+                    e_label='Employee Addresses', manual_plot=False, alpha=0.5, levels=10, font_mod=1, figsize=(15, 15), grid=(200, 200)):
 
         """
         Generates a heatmap of a specific commute data metric for employee locations relative to a single office location.
@@ -717,6 +938,9 @@ class Graphing:
             levels (int, optional): Number of levels for the color bar. Defaults to 10.
             font_mod (int, optional): Font size modifier for the plot. Defaults to 1.
             figsize (tuple, optional): Figure size. Defaults to (15, 15).
+            grid (tuple, optional): Grid of (longitude, latitude) cells that more than 10000 employee locations are binned 
+            into, averaging the value of each cell, before the heatmap is contoured. None contours every location. Defaults 
+            to (200, 200).
 
         Returns:
             tuple: A tuple containing the matplotlib figure and axes objects.
@@ -739,7 +963,13 @@ class Graphing:
 
         # Create the heatmap
         #plt.tricontourf(X, Y, Z, cmap='jet', levels=10, alpha=0.7, transform=ccrs.PlateCarree())
-        plt.tricontourf(xyz['longitude'], xyz['latitude'], xyz[value], cmap=cmap, levels=levels, alpha=alpha, transform=ccrs.PlateCarree())
+        # many points are binned into the grid first, so the triangulation and contouring cost is bounded by the grid size
+        x = xyz['longitude'].to_numpy(dtype=np.float64)
+        y = xyz['latitude'].to_numpy(dtype=np.float64)
+        z = xyz[value].to_numpy(dtype=np.float64)
+        if grid is not None and len(z) > _HEATMAP_BIN_POINTS:
+            x, y, z = _bin_means(x, y, z, grid)
+        plt.tricontourf(x, y, z, cmap=cmap, levels=levels, alpha=alpha, transform=_PLATE_CARREE)
         cbar = plt.colorbar(label=value_label)  # Add a color bar to show the temperature scale
         cbar.ax.yaxis.label.set_size(13*font_mod)
         
@@ -782,7 +1012,7 @@ class Graphing:
             y_label (str, optional): Label for the y-axis. Defaults to ''.
             cutoff_radius (float, optional): Radius in miles to include employee locations from the office for the histograms. Defaults to None.
             commute_radius (float, optional): Specifies the radius within which employees are considered for the histograms. Defaults to None.
-            bins (int, optional): Number of bins for the histograms. Defaults to 10.
+            bins (int or sequence, optional): Number of bins, or the bin edges, for the histograms. Defaults to 10.
             rows (int, optional): Number of rows in the subplot grid. Defaults to 1.
             cols (int, optional): Number of columns in the subplot grid. Defaults to 1.
             figsize (tuple, optional): Figure size. Defaults to (15, 15).
@@ -813,6 +1043,9 @@ class Graphing:
         # if values is a string, it is one value to plot, if it is iterable, we get and plot multiple
         if isinstance(values, str):
             values = [values]
+        # convert bin edges (e.g. a range) to an array once, rather than in every subplot's hist/histogram call
+        if not np.isscalar(bins):
+            bins = np.asarray(bins, dtype=np.float64)
 
         # extract rows from commute_data where office is the destination and data aligns with the employee addresses provided
         # only the first row of office will be read, as it doesn't make sense to plot this for more than one on a heatmap
@@ -821,8 +1054,8 @@ class Graphing:
         else:
             xyz = self.get_commute_values(filtered_emp_points, office, commute_data, values)
 
-        fig, ax = plt.subplots(rows,cols,figsize=figsize, sharex=sharex, sharey=sharey)
-        fig.tight_layout(pad=10,h_pad=1,w_pad=1)
+        # the constrained layout engine lays out the grid once at draw time, callers don't need tight_layout()
+        fig, ax = plt.subplots(rows,cols,figsize=figsize, sharex=sharex, sharey=sharey, layout='constrained')
         plt.suptitle(suptitle, fontsize=16*font_mod, y=.995)
         
         r=0
@@ -980,8 +1213,8 @@ class Graphing:
         else:
             xyz = self.get_commute_values(filtered_emp_points, office, commute_data, x_value + y_value)
         
-        fig, ax = plt.subplots(1,1,figsize=figsize)
-        fig.tight_layout(pad=10,h_pad=1,w_pad=1)
+        # the constrained layout engine lays out the figure once at draw time, callers don't need tight_layout()
+        fig, ax = plt.subplots(1,1,figsize=figsize, layout='constrained')
         
         # set x label 
         ax.set_xlabel(x_label, fontsize=14*font_mod)
@@ -996,7 +1229,8 @@ class Graphing:
 
         # give the bars a border for visibility
         #axf(r,c).hist(xyz[values[i]], bins=bins, alpha=0.5, edgecolor='gray', linewidth=1, zorder=2, align='mid', rwidth=0.8)
-        ax.scatter(x=xyz[x_value], y=xyz[y_value], alpha=0.5, edgecolor='gray', linewidth=1, zorder=2, s=10, c='blue')
+        # one scatter collection of all the points, passed to matplotlib as plain arrays
+        ax.scatter(x=xyz[x_value].to_numpy(), y=xyz[y_value].to_numpy(), alpha=0.5, edgecolor='gray', linewidth=1, zorder=2, s=10, c='blue')
 
         # set the xticks and yticks font size
         ax.tick_params(axis='both', labelsize=12*font_mod)
@@ -1005,7 +1239,7 @@ class Graphing:
         return plt, ax
             
     def get_piechart(self, values, titles=None, suptitle=None, value_labels='', figsize=None, 
-                     manual_plot=False, font_mod=1, rows=1, cols=1, startangle=90, colors=None):
+                     manual_plot=False, font_mod=1, rows=1, cols=1, startangle=90, colors=None, ax=None):
         """
         Generates a pie chart or charts for selected commute data.
 
@@ -1021,6 +1255,8 @@ class Graphing:
             cols (int, optional): Number of columns in the subplot grid. Defaults to 1.
             startangle (int, optional): Starting angle for the pie chart. Defaults to 90.
             colors (list, optional): List of colors for the pie chart. For multi-row/col, list of lists. Defaults to None.
+            ax (Axes or array of Axes, optional): Axes from a previous call (same rows/cols) to clear and draw into, reusing their
+                figure rather than creating a new one. The figure must still be open. Defaults to None.
 
         Returns:
             tuple: A tuple containing the matplotlib figure and axes objects.
@@ -1039,8 +1275,15 @@ class Graphing:
         if isinstance(titles, str):
             titles = [titles]
 
-        fig, ax = plt.subplots(rows,cols,figsize=figsize)
-        fig.tight_layout(pad=10,h_pad=1,w_pad=1)
+        # no tight_layout() here, laying out the empty grid is wasted work, callers lay out the finished chart once
+        if ax is None:
+            fig, ax = plt.subplots(rows,cols,figsize=figsize)
+        else:
+            # reuse the figure, clearing the previous charts and making it current for the plt calls below and in the caller
+            fig = np.ravel(ax)[0].figure
+            for each in np.ravel(ax):
+                each.clear()
+            plt.figure(fig.number)
         plt.suptitle(suptitle, fontsize=16*font_mod)
         
         r=0
@@ -1116,7 +1359,7 @@ if __name__ == '__main__':
         #print(plt.style.available)
         #plt = graph.get_histogram(emp, office, commute_data, values, cutoff_radius=40, bins=10, rows=5, cols=2, x_label='Minutes in Traffic', y_label='# of Employees')
         plt = graph.get_histogram(emp, office, commute_data, values, suptitle="Existing Commute Analysis", x_label='Minutes in Traffic', y_label='# Employees',  
-                    commute_radius=50, bins=range(0,120,5), rows=5, cols=2, column_titles=['Morning Commute','Evening Commute'], cumulative_line=True,
+                    commute_radius=50, bins=np.arange(0,120,5), rows=5, cols=2, column_titles=['Morning Commute','Evening Commute'], cumulative_line=True,
                     cumulative_color='black', cumulative_linestyle='--', cumulative_linewidth=1, cumulative_markers=cumulative_markers)
         plt.legend(loc='center right')
         for each in plt.gcf().get_axes():
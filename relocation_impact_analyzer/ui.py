@@ -382,6 +382,8 @@ class HTTP_UI(BaseHTTPRequestHandler):
                     #attach the dataframe to the project to validate
                     #setattr(a.project, data_file_map[post_data['data_file_type']], df)
                     a.project.data[data_file_map[post_data['data_file_type']]] = df
+                    # the project's data changed, drop the analyzer's per-office values built from the old data
+                    a.clear_office_caches()
                     # validate the dataframe
                     if a.project.validate_dataframe(data_file_map[post_data['data_file_type']]):
                         # save the project
@@ -408,6 +410,7 @@ class HTTP_UI(BaseHTTPRequestHandler):
             else:
                 a.project.delete_data_file(post_data['delete_data_file'])
                 a.project.save_project()
+                a.clear_office_caches()
                 self.status_message += "Data file '" + post_data['delete_data_file'] + "' deleted. "
 
         # if the request is to convert data files to GPS, then we will convert the data files to GPS
@@ -608,7 +611,7 @@ class HTTP_UI(BaseHTTPRequestHandler):
         json_file = os.path.join(project.project_directory, project.project_name, "plots/graphs.json")
         
         if os.path.exists(json_file):
-            with open(json_file, 'r') as file:
+            with open(json_file, 'r', encoding='utf-8') as file:
                 graphs_list = json.load(file)
             # for each graph in the list, the key is the template var, the value is the value, call 
             for graph in graphs_list:
@@ -656,7 +659,7 @@ class HTTP_UI(BaseHTTPRequestHandler):
         
         json_file = os.path.join(project.project_directory, project.project_name, "tables/tables.json")
         if os.path.exists(json_file):
-            with open(json_file, 'r') as file:
+            with open(json_file, 'r', encoding='utf-8') as file:
                 tables_list = json.load(file)
             # for each graph in the list, the key is the template var, the value is the value, call 
             for table in tables_list:
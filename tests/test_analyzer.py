@@ -0,0 +1,91 @@
+"""
+Tests for the Analyzer module's vectorized binning and cost helpers, against the np.histogram and per-employee lookup
+results they replaced
+
+Author: Victor Foulk
+License: MIT License
+Date: 2024-03-15
+Version: 0.0.1 Pre-Alpha
+"""
+
+import pytest
+
+for _module in ("cartopy", "scipy", "googlemaps", "dotenv", "numpy_financial", "requests_toolbelt"):
+    pytest.importorskip(_module)
+
+import numpy as np
+import pandas as pd
+
+from relocation_impact_analyzer.analyzer import _bin_edges, _uniform_counts, _top_n_mean, _cost_lookup, _fill_costs, \
+    _base_cost_df
+
+
+@pytest.mark.parametrize("binmin, binmax, step", [(0, 63, 5), (-95.3, 187.2, 10), (-0.0173, 0.0421, 0.001)])
+def test_bin_edges_cover_range(binmin, binmax, step):
+    edges = _bin_edges(binmax, step, binmin=binmin)
+    assert edges[0] <= binmin and edges[-1] >= binmax
+    np.testing.assert_allclose(np.diff(edges), step)
+
+
+def test_bin_edges_at_least_one_bin():
+    assert len(_bin_edges(0, 10, binmin=0)) == 2
+
+
+@pytest.mark.parametrize("binmin, binmax, step", [(0, 63, 5), (-95.3, 187.2, 10), (-0.0173, 0.0421, 0.001)])
+def test_uniform_counts_match_histogram(binmin, binmax, step):
+    edges = _bin_edges(binmax, step, binmin=binmin)
+    rng = np.random.default_rng(0)
+    values = [rng.uniform(binmin, binmax, 10000),
+              # edge aligned values, and values an ulp either side of each edge
+              edges, np.nextafter(edges, np.inf), np.nextafter(edges, -np.inf),
+              np.round(rng.uniform(binmin, binmax, 1000) / step) * step,
+              # values outside the edges are dropped
+              np.array([edges[0] - step, edges[-1] + step])]
+    for x in values:
+        np.testing.assert_array_equal(_uniform_counts(x, edges), np.histogram(x, bins=edges)[0])
+
+
+def test_top_n_mean_matches_nlargest():
+    rng = np.random.default_rng(1)
+    x = rng.uniform(10, 90, (200, 5))
+    x[rng.random(x.shape) < 0.3] = np.nan
+    x[0] = np.nan
+    x[1, :4] = np.nan
+    frame = pd.DataFrame(x)
+    for n in range(1, 6):
+        expected = frame.apply(lambda row: row.nlargest(n).mean(), axis=1).to_numpy()
+        np.testing.assert_allclose(_top_n_mean(x, n), expected, equal_nan=True)
+    np.testing.assert_allclose(_top_n_mean(x, 9), _top_n_mean(x, 5), equal_nan=True)
+    assert np.isnan(_top_n_mean(x, 0)).all()
+
+
+def test_top_n_mean_without_nan():
+    x = np.array([[1.0, 5.0, 3.0, 2.0, 4.0]])
+    np.testing.assert_allclose(_top_n_mean(x, 2), [4.5])
+    np.testing.assert_allclose(_top_n_mean(x, 5), [3.0])
+
+
+def test_fill_costs_matches_per_employee_lookup():
+    rng = np.random.default_rng(2)
+    emp = pd.DataFrame({'latitude': np.round(rng.uniform(39, 41, 50), 6), 'longitude': np.round(rng.uniform(-76, -74, 50), 6)})
+    frames = {}
+    for addr in ("Office A", "Office B"):
+        within = emp.sample(30, random_state=len(frames))
+        # a repeated coordinate, the first row's costs are used
+        within = pd.concat([within, within.iloc[:2]])
+        frames[addr] = pd.DataFrame({'origin_lat': within['latitude'].to_numpy(), 'origin_long': within['longitude'].to_numpy(),
+                                     'office_address': addr,
+                                     'Total Average Cost': rng.uniform(0, 50, len(within)),
+                                     'Total High Cost': rng.uniform(50, 100, len(within))})
+    lookup = _cost_lookup(frames)
+    for addr, val_set in frames.items():
+        costs = _base_cost_df(emp, addr)
+        _fill_costs(costs, lookup)
+        # the per-employee lookup this replaced, employees without a row keep a cost of 0
+        for col in ('Total Average Cost', 'Total High Cost'):
+            expected = np.zeros(len(emp))
+            for i, row in emp.iterrows():
+                match = val_set[(val_set['origin_lat'] == row['latitude']) & (val_set['origin_long'] == row['longitude'])]
+                if len(match):
+                    expected[i] = match[col].values[0]
+            np.testing.assert_array_equal(costs[col].to_numpy(), expected)
@@ -0,0 +1,54 @@
+"""
+Tests for the Graphing class's map views
+
+Author: Victor Foulk
+License: MIT License
+Date: 2024-03-15
+Version: 0.0.1 Pre-Alpha
+"""
+
+import pytest
+
+pytest.importorskip("cartopy")
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.image import AxesImage
+from PIL import Image
+from cartopy.io.img_tiles import OSM
+
+from relocation_impact_analyzer import graphing
+from relocation_impact_analyzer.graphing import Graphing
+
+
+class _BlankTiles(OSM):
+    # an OpenStreetMap tile source returning blank tiles, so the map views draw without fetching tiles
+    def get_image(self, tile):
+        return Image.new("RGB", (256, 256), "white"), self.tileextent(tile), "lower"
+
+
+@pytest.fixture
+def blank_tiles(monkeypatch):
+    monkeypatch.setitem(graphing._IMAGERY, "OSM", _BlankTiles())
+
+
+def _draw_map_view(g, latitudes, longitudes):
+    fig, ax = g.configure_map_plot(latitudes, longitudes)
+    fig.canvas.draw()
+    return fig, ax
+
+
+def test_reused_map_view_draws_tiles(blank_tiles):
+    g = Graphing()
+    try:
+        fig1, ax1 = _draw_map_view(g, [40.0, 40.2], [-75.2, -75.0])
+        assert any(isinstance(a, AxesImage) for a in ax1.get_images())
+        # the second view reuses the first's figure and axes, and must still get its own tiles
+        fig2, ax2 = _draw_map_view(g, [41.0, 41.1], [-74.1, -74.0])
+        assert fig2 is fig1 and ax2 is ax1
+        assert len(ax2.img_factories) == 1
+        assert any(isinstance(a, AxesImage) for a in ax2.get_images())
+    finally:
+        g.release_figure()
+        plt.close("all")